@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-17 14:05:37 (ywatanabe)"
+# File: ./mngs_repo/benchmarks/db/benchmark_postgres_copy.py
+
+"""
+Functionality:
+    - Round-trips a DataFrame through a local PostgreSQL instance with
+      insert_many (executemany) and copy_from_dataframe / copy_to_dataframe
+      (COPY), checks that the data match and reports rows/sec
+Input:
+    - Connection settings from the environment: MNGS_PG_DBNAME, MNGS_PG_USER,
+      MNGS_PG_PASSWORD, MNGS_PG_HOST (default localhost), MNGS_PG_PORT (5432)
+Output:
+    - Table of rows/sec per method printed to stdout
+Prerequisites:
+    - mngs, psycopg2, numpy, pandas
+    - A running PostgreSQL server (see src/mngs/db/README.md)
+
+Usage:
+    MNGS_PG_DBNAME=test MNGS_PG_USER=user MNGS_PG_PASSWORD=pass \\
+        python benchmarks/db/benchmark_postgres_copy.py
+"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+from mngs.db import PostgreSQL
+
+N_ROWS = 200_000
+TABLE_NAME = "mngs_benchmark_copy"
+
+
+def _create_df(n_rows):
+    return pd.DataFrame(
+        {
+            "id": np.arange(n_rows),
+            "subject": np.random.choice(["s01", "s02", None, 'a "quoted", text'], n_rows),
+            "value": np.where(np.random.rand(n_rows) < 0.1, np.nan, np.random.randn(n_rows)),
+        }
+    )
+
+
+def main():
+    db = PostgreSQL(
+        dbname=os.environ["MNGS_PG_DBNAME"],
+        user=os.environ["MNGS_PG_USER"],
+        password=os.environ["MNGS_PG_PASSWORD"],
+        host=os.environ.get("MNGS_PG_HOST", "localhost"),
+        port=int(os.environ.get("MNGS_PG_PORT", 5432)),
+    )
+    df = _create_df(N_ROWS)
+
+    db.execute(f"DROP TABLE IF EXISTS {TABLE_NAME}")
+    db.execute(
+        f"CREATE TABLE {TABLE_NAME} (id BIGINT PRIMARY KEY, subject TEXT, value DOUBLE PRECISION)"
+    )
+
+    rows = []
+    try:
+        start = time.perf_counter()
+        db.insert_many(
+            TABLE_NAME,
+            df.astype(object).where(df.notna(), None).to_dict("records"),
+            batch_size=10_000,
+        )
+        rows.append(dict(method="insert_many", rows_per_sec=N_ROWS / (time.perf_counter() - start)))
+
+        start = time.perf_counter()
+        db.copy_from_dataframe(TABLE_NAME, df, if_exists="replace")
+        rows.append(dict(method="copy_from_dataframe", rows_per_sec=N_ROWS / (time.perf_counter() - start)))
+
+        start = time.perf_counter()
+        df_out = db.copy_to_dataframe(TABLE_NAME, order_by="id")
+        rows.append(dict(method="copy_to_dataframe", rows_per_sec=N_ROWS / (time.perf_counter() - start)))
+
+        start = time.perf_counter()
+        n_rows = sum(len(chunk) for chunk in db.copy_to_dataframe(TABLE_NAME, chunksize=50_000))
+        rows.append(dict(method="copy_to_dataframe(chunksize)", rows_per_sec=n_rows / (time.perf_counter() - start)))
+
+        pd.testing.assert_frame_equal(
+            df_out.astype(object).where(df_out.notna(), None),
+            df.astype(object).where(df.notna(), None),
+            check_dtype=False,
+        )
+        print("Round trip OK")
+
+    finally:
+        db.execute(f"DROP TABLE IF EXISTS {TABLE_NAME}")
+        db.close()
+
+    df_results = pd.DataFrame(rows)
+    print(f"n_rows: {N_ROWS}")
+    print(df_results.round(0).to_string(index=False))
+    return df_results
+
+
+if __name__ == "__main__":
+    main()
+
+# EOF
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-17 13:40:12 (ywatanabe)"
+# File: ./mngs_repo/benchmarks/db/benchmark_sqlite_pool.py
+
+"""
+Functionality:
+    - Measures read throughput of mngs.db.SQLite3.get_rows / load_array from
+      a thread pool, with a single shared connection (pool_size=0) and with a
+      pool of read-only connections (pool_size=n_threads)
+Input:
+    - None (a temporary database with random arrays)
+Output:
+    - Table of reads/sec per thread count printed to stdout
+Prerequisites:
+    - mngs, numpy, pandas
+
+Usage:
+    python benchmarks/db/benchmark_sqlite_pool.py
+"""
+
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from mngs.db import SQLite3
+
+N_ROWS = 2_000
+ARRAY_SHAPE = (16, 256)
+N_READS = 400
+N_THREADS = [1, 2, 4, 8]
+
+
+def _create_db(db_path):
+    db = SQLite3(db_path)
+    db.execute(
+        "CREATE TABLE epochs (id INTEGER PRIMARY KEY, subject INTEGER, "
+        "data BLOB, data_dtype TEXT, data_shape TEXT)"
+    )
+    arr = np.random.randn(*ARRAY_SHAPE).astype(np.float32)
+    db.bulk_insert(
+        "epochs",
+        {
+            "id": np.arange(1, N_ROWS + 1),
+            "subject": np.arange(N_ROWS) % 10,
+            "data": np.array([arr.tobytes()] * N_ROWS, dtype=object),
+            "data_dtype": np.array([str(arr.dtype)] * N_ROWS, dtype=object),
+            "data_shape": np.array([str(arr.shape)] * N_ROWS, dtype=object),
+        },
+    )
+    db.close()
+
+
+def _read(db, i_read):
+    subject = i_read % 10
+    db.get_rows("epochs", columns=["id"], where=f"subject = {subject}")
+    return db.load_array("epochs", "data", where=f"subject = {subject}")
+
+
+def _reads_per_sec(db, n_threads):
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        list(executor.map(lambda i: _read(db, i), range(n_threads)))  # warm-up
+        start = time.perf_counter()
+        list(executor.map(lambda i: _read(db, i), range(N_READS)))
+    return N_READS / (time.perf_counter() - start)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "benchmark.db")
+        _create_db(db_path)
+
+        rows = []
+        for n_threads in N_THREADS:
+            row = dict(n_threads=n_threads)
+            for pool_size in [0, n_threads]:
+                with SQLite3(db_path, pool_size=pool_size) as db:
+                    key = "pooled" if pool_size else "shared"
+                    row[f"{key}_reads_per_sec"] = _reads_per_sec(db, n_threads)
+            row["speedup"] = row["pooled_reads_per_sec"] / row["shared_reads_per_sec"]
+            rows.append(row)
+
+    df = pd.DataFrame(rows)
+    print(f"n_rows: {N_ROWS}, array shape: {ARRAY_SHAPE}, n_reads: {N_READS}")
+    print(df.round(2).to_string(index=False))
+    return df
+
+
+if __name__ == "__main__":
+    main()
+
+# EOF
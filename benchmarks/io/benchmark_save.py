@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-17 15:52:44 (ywatanabe)"
+# File: ./mngs_repo/benchmarks/io/benchmark_save.py
+
+"""
+Functionality:
+    - Measures saves/sec of mngs.io.save for small per-trial files (.npy,
+      .pkl, .json) with and without atomic writes and symlinks, next to the
+      raw writer (np.save / pickle.dump / json.dump) as a lower bound
+Input:
+    - None (small random arrays and dicts)
+Output:
+    - Table of saves/sec and the overhead of mngs.io.save per call [us]
+Prerequisites:
+    - mngs, numpy, pandas
+
+Usage:
+    python benchmarks/io/benchmark_save.py
+"""
+
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import time
+
+import mngs
+import numpy as np
+import pandas as pd
+
+N_SAVES = 500
+
+
+def _saves_per_sec(fn, n_saves=N_SAVES):
+    fn(0)  # warm-up
+    start = time.perf_counter()
+    for ii in range(n_saves):
+        fn(ii)
+    return n_saves / (time.perf_counter() - start)
+
+
+def _raw_save(obj, path):
+    if path.endswith(".npy"):
+        np.save(path, obj)
+    elif path.endswith(".pkl"):
+        with open(path, "wb") as f:
+            pickle.dump(obj, f)
+    elif path.endswith(".json"):
+        with open(path, "w") as f:
+            json.dump(obj, f)
+
+
+def main():
+    objs = {
+        ".npy": np.random.randn(64, 100).astype(np.float32),
+        ".pkl": {"trial": 1, "values": list(range(100))},
+        ".json": {"trial": 1, "values": list(range(100))},
+    }
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cwd = os.getcwd()
+        os.chdir(tmp_dir)
+        try:
+            for ext, obj in objs.items():
+                raw = _saves_per_sec(
+                    lambda ii: _raw_save(obj, os.path.join(tmp_dir, f"raw_{ii}{ext}"))
+                )
+                row = dict(ext=ext, raw=raw)
+                for label, kwargs in [
+                    ("mngs", {}),
+                    ("mngs_atomic", dict(atomic=True)),
+                    ("mngs_symlink", dict(symlink_from_cwd=True)),
+                ]:
+                    row[label] = _saves_per_sec(
+                        lambda ii: mngs.io.save(
+                            obj,
+                            f"{label}/trial_{ii}{ext}",
+                            verbose=False,
+                            **kwargs,
+                        )
+                    )
+                row["overhead_us"] = (1 / row["mngs"] - 1 / raw) * 1e6
+                rows.append(row)
+        finally:
+            os.chdir(cwd)
+            # Relative paths are saved next to this script
+            shutil.rmtree(
+                os.path.splitext(os.path.abspath(__file__))[0] + "_out",
+                ignore_errors=True,
+            )
+
+    df = pd.DataFrame(rows)
+    print(f"saves/sec over {N_SAVES} saves per setting")
+    print(df.round(1).to_string(index=False))
+    return df
+
+
+if __name__ == "__main__":
+    main()
+
+# EOF
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-17 10:12:31 (ywatanabe)"
+# File: ./mngs_repo/benchmarks/nn/benchmark_filters_conv.py
+
+"""
+Functionality:
+    - Compares direct (F.conv1d) and FFT (overlap-save) convolution paths of
+      mngs.nn.BaseFilter1D over kernel lengths and band counts
+Input:
+    - None (random signals)
+Output:
+    - Table of mean run times [ms] and speedups printed to stdout
+Prerequisites:
+    - mngs, torch, pandas
+
+Usage:
+    python benchmarks/nn/benchmark_filters_conv.py
+"""
+
+import time
+
+import pandas as pd
+import torch
+from mngs.nn._Filters import BaseFilter1D
+
+BATCH_SIZE = 1
+N_CHS = 8
+SEQ_LEN = 2**14
+KERNEL_LENS = [16, 64, 256, 1024, 4096]
+N_BANDS = [1, 10, 50, 100]
+N_REPEATS = 3
+
+
+def _time_ms(fn, n_repeats=N_REPEATS):
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(n_repeats):
+        fn()
+    return (time.perf_counter() - start) / n_repeats * 1e3
+
+
+def main(device="cpu"):
+    x = torch.randn(BATCH_SIZE, N_CHS, SEQ_LEN, device=device)
+
+    rows = []
+    with torch.no_grad():
+        for kernel_len in KERNEL_LENS:
+            for n_bands in N_BANDS:
+                kernels = torch.randn(n_bands, kernel_len, device=device)
+                direct_ms = _time_ms(
+                    lambda: BaseFilter1D.batch_conv(x, kernels, padding=0)
+                )
+                fft_ms = _time_ms(
+                    lambda: BaseFilter1D.batch_fft_conv(x, kernels)
+                )
+                rows.append(
+                    dict(
+                        kernel_len=kernel_len,
+                        n_bands=n_bands,
+                        direct_ms=direct_ms,
+                        fft_ms=fft_ms,
+                        speedup=direct_ms / fft_ms,
+                    )
+                )
+
+    df = pd.DataFrame(rows)
+    print(
+        f"x.shape: {tuple(x.shape)}, device: {device}, "
+        f"auto threshold: {BaseFilter1D.FFT_KERNEL_LEN_THRESHOLD}"
+    )
+    print(df.round(2).to_string(index=False))
+    return df
+
+
+if __name__ == "__main__":
+    main()
+
+# EOF
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-17 17:41:05 (ywatanabe)"
+# File: ./mngs_repo/benchmarks/nn/benchmark_wavelet.py
+
+"""
+Functionality:
+    - Compares the direct (F.conv1d) and FFT (overlap-save) paths of
+      mngs.nn.Wavelet over signal lengths
+Input:
+    - None (random signals)
+Output:
+    - Table of mean run times [ms] and speedups printed to stdout
+Prerequisites:
+    - mngs, torch, pandas
+
+Usage:
+    python benchmarks/nn/benchmark_wavelet.py
+"""
+
+import time
+
+import pandas as pd
+import torch
+from mngs.nn._Wavelet import Wavelet
+
+FS = 500
+BATCH_SIZE = 1
+N_CHS = 4
+SEQ_LENS = [2_000, 10_000, 50_000]
+FREQ_SCALES = ["log", "linear"]
+N_REPEATS = 2
+
+
+def _time_ms(fn, n_repeats=N_REPEATS):
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(n_repeats):
+        fn()
+    return (time.perf_counter() - start) / n_repeats * 1e3
+
+
+def main(device="cpu"):
+    rows = []
+    with torch.no_grad():
+        for freq_scale in FREQ_SCALES:
+            direct = Wavelet(FS, freq_scale=freq_scale, conv_method="direct")
+            fft = Wavelet(FS, freq_scale=freq_scale, conv_method="fft")
+            direct, fft = direct.to(device), fft.to(device)
+            for seq_len in SEQ_LENS:
+                x = torch.randn(BATCH_SIZE, N_CHS, seq_len, device=device)
+                direct_ms = _time_ms(lambda: direct(x))
+                fft_ms = _time_ms(lambda: fft(x))
+                rows.append(
+                    dict(
+                        freq_scale=freq_scale,
+                        n_freqs=len(fft.freqs),
+                        seq_len=seq_len,
+                        direct_ms=direct_ms,
+                        fft_ms=fft_ms,
+                        speedup=direct_ms / fft_ms,
+                    )
+                )
+
+    df = pd.DataFrame(rows)
+    print(
+        f"fs: {FS}, kernel_size: {FS}, batch_size: {BATCH_SIZE}, "
+        f"n_chs: {N_CHS}, device: {device}, threads: {torch.get_num_threads()}"
+    )
+    print(df.round(2).to_string(index=False))
+    return df
+
+
+if __name__ == "__main__":
+    main()
+
+# EOF
@@ -46,9 +46,15 @@ class PostgreSQL(
         password: str = None,
         host: str = "localhost",
         port: int = 5432,
+        pool_size: int = 0,
     ):
         super().__init__(
-            dbname=dbname, user=user, password=password, host=host, port=port
+            dbname=dbname,
+            user=user,
+            password=password,
+            host=host,
+            port=port,
+            pool_size=pool_size,
         )
 
     def __call__(
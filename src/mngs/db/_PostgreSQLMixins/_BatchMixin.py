@@ -38,9 +38,12 @@ class _BatchMixin(_BaseBatchMixin):
         columns = list(records[0].keys())
         return [tuple(record[col] for col in columns) for record in records]
 
-    def dataframe_to_sql(self, df: pd.DataFrame, table: str, if_exists: str = 'fail') -> None:
+    def dataframe_to_sql(self, df: pd.DataFrame, table: str, if_exists: str = 'fail', method: str = 'insert') -> None:
+        """method='copy' loads rows with COPY (see copy_from_dataframe) instead of executemany."""
         if if_exists not in ['fail', 'replace', 'append']:
             raise ValueError("if_exists must be one of 'fail', 'replace', or 'append'")
+        if method not in ['insert', 'copy']:
+            raise ValueError("method must be one of 'insert' or 'copy'")
 
         if if_exists == 'replace':
             self.execute(f"DROP TABLE IF EXISTS {table}")
@@ -52,6 +55,10 @@ class _BatchMixin(_BaseBatchMixin):
             columns_str = ", ".join(columns)
             self.execute(f"CREATE TABLE {table} ({columns_str})")
 
+        if method == 'copy':
+            self.copy_from_dataframe(table, df)
+            return
+
         records = df.to_dict('records')
         self.insert_many(table, records)
 
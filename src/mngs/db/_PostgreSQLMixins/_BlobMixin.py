@@ -5,10 +5,13 @@
 
 __file__ = "/home/ywatanabe/proj/mngs_repo/src/mngs/db/_PostgreSQLMixins/_BlobMixin.py"
 
+import ast
+
 import psycopg2
 import numpy as np
 from typing import Any as _Any
 from typing import Dict, List, Optional, Tuple, Union
+from .._array_codec import decode_array, is_encoded_array
 from .._BaseMixins._BaseBlobMixin import _BaseBlobMixin
 
 
@@ -103,65 +106,69 @@ class _BlobMixin(_BaseBlobMixin):
         shape: Optional[Tuple] = None,
     ) -> Optional[np.ndarray]:
         try:
-            if ids == "all":
-                query = f"SELECT id FROM {table_name}"
-                if where:
-                    query += f" WHERE {where}"
-                self.execute(query)
-                ids = [row[0] for row in self.cursor.fetchall()]
-            elif isinstance(ids, int):
-                ids = [ids]
-
-            id_to_data = {}
-            unique_ids = list(set(ids))
-
-            for idx in range(0, len(unique_ids), batch_size):
-                batch_ids = unique_ids[idx : idx + batch_size]
-                placeholders = ",".join(["%s" for _ in batch_ids])
-
-                try:
-                    query = f"""
-                        SELECT id, {column},
-                               {column}_dtype,
-                               {column}_shape
-                        FROM {table_name}
-                        WHERE id IN ({placeholders})
-                    """
-                    self.execute(query, batch_ids)
-                    has_metadata = True
-                except psycopg2.Error:
-                    query = f"SELECT id, {column} FROM {table_name} WHERE id IN ({placeholders})"
-                    self.execute(query, batch_ids)
-                    has_metadata = False
-
-                if where:
-                    query += f" AND {where}"
-                if order_by:
-                    query += f" ORDER BY {order_by}"
-
-                results = self.cursor.fetchall()
-                if results:
-                    for result in results:
-                        if has_metadata:
-                            id_val, blob, dtype_str, shape_str = result
-                            data = np.frombuffer(
-                                bytes(blob), dtype=np.dtype(dtype_str)
-                            ).reshape(eval(shape_str))
-                        else:
-                            id_val, blob = result
-                            data = (
-                                np.frombuffer(bytes(blob), dtype=dtype)
-                                if dtype
-                                else np.frombuffer(bytes(blob))
-                            )
-                            if shape:
-                                data = data.reshape(shape)
-                        id_to_data[id_val] = data
-
-            all_data = [
-                id_to_data[id_val] for id_val in ids if id_val in id_to_data
-            ]
-            return np.stack(all_data, axis=0) if all_data else None
+            with self.checkout() as conn, conn.cursor() as cursor:
+                if ids == "all":
+                    query = f"SELECT id FROM {table_name}"
+                    if where:
+                        query += f" WHERE {where}"
+                    cursor.execute(query)
+                    ids = [row[0] for row in cursor.fetchall()]
+                elif isinstance(ids, int):
+                    ids = [ids]
+
+                id_to_data = {}
+                unique_ids = list(set(ids))
+
+                for idx in range(0, len(unique_ids), batch_size):
+                    batch_ids = unique_ids[idx : idx + batch_size]
+                    placeholders = ",".join(["%s" for _ in batch_ids])
+
+                    try:
+                        query = f"""
+                            SELECT id, {column},
+                                   {column}_dtype,
+                                   {column}_shape
+                            FROM {table_name}
+                            WHERE id IN ({placeholders})
+                        """
+                        # A savepoint, not a rollback: conn may be the main
+                        # connection holding uncommitted writes
+                        with self._savepoint(conn):
+                            cursor.execute(query, batch_ids)
+                        has_metadata = True
+                    except psycopg2.Error:
+                        query = f"SELECT id, {column} FROM {table_name} WHERE id IN ({placeholders})"
+                        cursor.execute(query, batch_ids)
+                        has_metadata = False
+
+                    if where:
+                        query += f" AND {where}"
+                    if order_by:
+                        query += f" ORDER BY {order_by}"
+
+                    results = cursor.fetchall()
+                    if results:
+                        for result in results:
+                            if has_metadata:
+                                id_val, blob, dtype_str, shape_str = result
+                                data = np.frombuffer(
+                                    bytes(blob), dtype=np.dtype(dtype_str)
+                                ).reshape(ast.literal_eval(shape_str))
+                            else:
+                                id_val, blob = result
+                                data = (
+                                    np.frombuffer(bytes(blob), dtype=dtype)
+                                    if dtype
+                                    else np.frombuffer(bytes(blob))
+                                )
+                                if shape:
+                                    data = data.reshape(shape)
+                            id_to_data[id_val] = data
+
+                all_data = [
+                    id_to_data[id_val] for id_val in ids if id_val in id_to_data
+                ]
+                return np.stack(all_data, axis=0) if all_data else None
 
         except Exception as err:
             raise ValueError(f"Failed to load array: {err}")
@@ -178,10 +185,12 @@ class _BlobMixin(_BaseBlobMixin):
             return None
 
         binary_data = bytes(binary_data)
+        if is_encoded_array(binary_data):
+            return decode_array(binary_data)
         if dtype_str and shape_str:
             return np.frombuffer(
                 binary_data, dtype=np.dtype(dtype_str)
-            ).reshape(eval(shape_str))
+            ).reshape(ast.literal_eval(shape_str))
         elif dtype and shape:
             return np.frombuffer(binary_data, dtype=dtype).reshape(shape)
         return binary_data
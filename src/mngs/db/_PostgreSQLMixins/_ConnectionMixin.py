@@ -14,7 +14,11 @@ from typing import Any, Tuple
 
 __file__ = "/home/ywatanabe/proj/mngs_repo/src/mngs/db/_PostgreSQLMixins/_ConnectionMixin.py"
 
+import contextlib
+import threading
+
 import psycopg2
+import psycopg2.pool
 
 from .._BaseMixins._BaseConnectionMixin import _BaseConnectionMixin
 
@@ -27,8 +31,14 @@ class _ConnectionMixin(_BaseConnectionMixin):
         password: str,
         host: str = "localhost",
         port: int = 5432,
+        pool_size: int = 0,
     ):
         super().__init__()
+        if pool_size < 0:
+            raise ValueError("pool_size must be >= 0")
+        self.pool_size = pool_size
+        self._pool = None
+        self._pool_slots = threading.BoundedSemaphore(max(pool_size, 1))
         self.db_config = {
             "dbname": dbname,
             "user": user,
@@ -52,7 +62,87 @@ class _ConnectionMixin(_BaseConnectionMixin):
                 "SET SESSION CHARACTERISTICS AS TRANSACTION ISOLATION LEVEL READ COMMITTED"
             )
 
+        if self.pool_size > 0:
+            self._pool = psycopg2.pool.ThreadedConnectionPool(
+                1, self.pool_size, **self.db_config
+            )
+
+    @contextlib.contextmanager
+    def checkout(self, readonly: bool = True):
+        """
+        Checks out a connection for the duration of the with block.
+
+        With pool_size > 0, readonly checkouts take a read-only session from a
+        psycopg2 ThreadedConnectionPool of up to pool_size connections, blocking
+        while all are in use, so that reads from different threads do not share
+        a cursor. Writable checkouts return the main connection under the
+        write lock.
+
+        Without a pool, the main connection is returned as before.
+
+        Example:
+            with db.checkout() as conn, conn.cursor() as cursor:
+                cursor.execute("SELECT * FROM t")
+        """
+        if not self.conn:
+            raise ConnectionError("Database not connected")
+
+        if not readonly:
+            with self.lock:
+                yield self.conn
+            return
+
+        if self._pool is None:
+            yield self.conn
+            return
+
+        with self._pool_slots:
+            conn = self._pool.getconn()
+            try:
+                if not conn.readonly:
+                    conn.set_session(readonly=True)
+                yield conn
+            finally:
+                try:
+                    conn.rollback()
+                finally:
+                    self._pool.putconn(conn)
+
+    def _begin_savepoint(self, conn, name: str) -> bool:
+        """
+        Sets a SAVEPOINT so that a failing read can be undone without rolling
+        back uncommitted writes of the main connection. Returns False (and
+        does nothing) in autocommit mode, where there is nothing to protect.
+        """
+        if conn.autocommit:
+            return False
+        with conn.cursor() as cursor:
+            cursor.execute(f"SAVEPOINT {name}")
+        return True
+
+    def _end_savepoint(self, conn, name: str, rollback: bool) -> None:
+        with conn.cursor() as cursor:
+            if rollback:
+                cursor.execute(f"ROLLBACK TO SAVEPOINT {name}")
+            cursor.execute(f"RELEASE SAVEPOINT {name}")
+
+    @contextlib.contextmanager
+    def _savepoint(self, conn, name: str = "mngs_read"):
+        """Runs the with block in a savepoint, rolled back to if it raises."""
+        if not self._begin_savepoint(conn, name):
+            yield
+            return
+        try:
+            yield
+        except BaseException:
+            self._end_savepoint(conn, name, rollback=True)
+            raise
+        self._end_savepoint(conn, name, rollback=False)
+
     def close(self) -> None:
+        if self._pool is not None:
+            self._pool.closeall()
+            self._pool = None
         if self.cursor:
             self.cursor.close()
         if self.conn:
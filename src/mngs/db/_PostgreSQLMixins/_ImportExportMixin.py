@@ -5,11 +5,15 @@
 
 __file__ = "/home/ywatanabe/proj/mngs_repo/src/mngs/db/_PostgreSQL_modules/_ImportExportMixin.py"
 
+import os
+import threading
 import pandas as pd
-from typing import List
+from typing import Iterator, List, Optional, Union
 import psycopg2
 from io import StringIO
 
+_NULL = "\\N"
+
 class _ImportExportMixin:
     def load_from_csv(self, table_name: str, csv_path: str, if_exists: str = "append",
                      batch_size: int = 10_000, chunk_size: int = 100_000) -> None:
@@ -40,5 +44,144 @@ class _ImportExportMixin:
         except (Exception, psycopg2.Error) as err:
             raise ValueError(f"Failed to export to CSV: {err}")
 
+    def copy_from_dataframe(
+        self,
+        table_name: str,
+        df: pd.DataFrame,
+        columns: Optional[List[str]] = None,
+        chunk_size: int = 100_000,
+        if_exists: str = "append",
+    ) -> int:
+        """
+        Loads a DataFrame into an existing table with COPY ... FROM STDIN.
+
+        Rows are serialized to an in-memory CSV buffer chunk_size rows at a
+        time, so memory stays bounded by one chunk. All chunks are loaded in a
+        single transaction. NaN/None are written as NULL.
+
+        Parameters:
+            table_name (str): Target table, which must exist.
+            df (pd.DataFrame): Data; columns are matched by name.
+            columns (List[str], optional): Subset of df columns to load.
+            chunk_size (int): Number of rows per COPY chunk.
+            if_exists (str): "append" or "replace" (TRUNCATE before loading).
+
+        Returns:
+            int: Number of loaded rows.
+        """
+        if if_exists not in ["append", "replace"]:
+            raise ValueError("if_exists must be one of 'append' or 'replace'")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        self._check_writable()
+        columns = list(df.columns) if columns is None else list(columns)
+        columns_str = ", ".join(f'"{col}"' for col in columns)
+        copy_sql = (
+            f"COPY {table_name} ({columns_str}) FROM STDIN "
+            f"WITH (FORMAT csv, NULL '{_NULL}')"
+        )
+
+        with self.lock:
+            try:
+                if if_exists == "replace":
+                    self.cursor.execute(f"TRUNCATE TABLE {table_name}")
+
+                n_rows = 0
+                for start in range(0, len(df), chunk_size):
+                    chunk = df[columns].iloc[start : start + chunk_size]
+                    buffer = StringIO()
+                    chunk.to_csv(buffer, index=False, header=False, na_rep=_NULL)
+                    buffer.seek(0)
+                    self.cursor.copy_expert(sql=copy_sql, file=buffer)
+                    n_rows += len(chunk)
+
+                self.conn.commit()
+                return n_rows
+
+            except (Exception, psycopg2.Error) as err:
+                self.conn.rollback()
+                raise ValueError(f"Failed to copy from DataFrame: {err}")
+
+    def copy_to_dataframe(
+        self,
+        table_name: str,
+        columns: List[str] = ["*"],
+        where: str = None,
+        order_by: str = None,
+        chunksize: Optional[int] = None,
+        **read_csv_kwargs,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Exports a table or filtered selection with COPY ... TO STDOUT.
+
+        The CSV stream is piped from a writer thread into pandas.read_csv, so
+        the whole CSV text is never held in memory. With chunksize, an
+        iterator of DataFrames is returned and memory is bounded by one chunk.
+        Extra keyword arguments (e.g., dtype, parse_dates) go to read_csv.
+        """
+        columns_str = ", ".join(columns) if columns != ["*"] else "*"
+        query = f"SELECT {columns_str} FROM {table_name}"
+        if where:
+            query += f" WHERE {where}"
+        if order_by:
+            query += f" ORDER BY {order_by}"
+        copy_sql = f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER, NULL '{_NULL}')"
+
+        read_csv_kwargs = {
+            "na_values": [_NULL],
+            "keep_default_na": False,
+            **read_csv_kwargs,
+        }
+        chunks = self._iter_copy_to_dataframe(copy_sql, chunksize, read_csv_kwargs)
+        if chunksize:
+            return chunks
+        dfs = list(chunks)
+        return dfs[0] if dfs else pd.DataFrame()
+
+    def _iter_copy_to_dataframe(self, copy_sql, chunksize, read_csv_kwargs):
+        read_fd, write_fd = os.pipe()
+        errors = []
+
+        with self.checkout() as conn:
+            # Without a pool, conn is the main connection: a failed or
+            # interrupted COPY is undone with a savepoint instead of a
+            # rollback, which would discard its uncommitted writes
+            savepoint = self._begin_savepoint(conn, "mngs_copy_to")
+            completed = False
+
+            def _write():
+                try:
+                    with os.fdopen(write_fd, "w") as writer, conn.cursor() as cursor:
+                        cursor.copy_expert(sql=copy_sql, file=writer)
+                except (Exception, psycopg2.Error) as err:
+                    errors.append(err)
+
+            thread = threading.Thread(target=_write, daemon=True)
+            thread.start()
+            try:
+                with os.fdopen(read_fd, "r") as reader:
+                    try:
+                        if chunksize:
+                            with pd.read_csv(
+                                reader, chunksize=chunksize, **read_csv_kwargs
+                            ) as chunks:
+                                for chunk in chunks:
+                                    yield chunk
+                        else:
+                            yield pd.read_csv(reader, **read_csv_kwargs)
+                    except pd.errors.EmptyDataError:
+                        pass
+                completed = True
+            finally:
+                thread.join()
+                if savepoint:
+                    self._end_savepoint(
+                        conn, "mngs_copy_to", rollback=bool(errors) or not completed
+                    )
+
+        if errors and not isinstance(errors[0], BrokenPipeError):
+            raise ValueError(f"Failed to copy to DataFrame: {errors[0]}")
+
 
 # EOF
@@ -5,7 +5,8 @@
 
 __file__ = "/home/ywatanabe/proj/mngs_repo/src/mngs/db/_PostgreSQL_modules/_RowMixin.py"
 
-from typing import List, Optional
+import uuid
+from typing import Iterator, List, Optional
 import pandas as pd
 import psycopg2
 
@@ -13,7 +14,20 @@ class _RowMixin:
     def get_rows(self, table_name: str, columns: List[str] = None,
                  where: str = None, order_by: str = None,
                  limit: Optional[int] = None, offset: Optional[int] = None,
-                 return_as: str = "dataframe"):
+                 return_as: str = "dataframe", chunksize: Optional[int] = None):
+        """
+        Returns rows as a DataFrame, list of tuples or list of dicts.
+
+        With chunksize, an iterator of batches is returned instead
+        (see iter_rows).
+        """
+        if chunksize is not None:
+            return self.iter_rows(
+                table_name, columns=columns, where=where, order_by=order_by,
+                limit=limit, offset=offset, return_as=return_as,
+                chunksize=chunksize,
+            )
+
         try:
             if columns is None:
                 columns_str = "*"
@@ -34,10 +48,10 @@ class _RowMixin:
                 query_parts.append(f"OFFSET {offset}")
 
             query = " ".join(query_parts)
-            self.cursor.execute(query)
-
-            column_names = [desc[0] for desc in self.cursor.description]
-            data = self.cursor.fetchall()
+            with self.checkout() as conn, conn.cursor() as cursor:
+                cursor.execute(query)
+                column_names = [desc[0] for desc in cursor.description]
+                data = cursor.fetchall()
 
             if return_as == "list":
                 return data
@@ -49,6 +63,129 @@ class _RowMixin:
         except (Exception, psycopg2.Error) as err:
             raise ValueError(f"Query execution failed: {err}")
 
+    def iter_rows(self, table_name: str, columns: List[str] = None,
+                  where: str = None, order_by: str = None,
+                  limit: Optional[int] = None, offset: Optional[int] = None,
+                  return_as: str = "dataframe", chunksize: int = 10_000,
+                  keyset: bool = False, key: Optional[str] = None) -> Iterator:
+        """
+        Yields rows in batches of up to chunksize, formatted as in get_rows.
+
+        By default one query is streamed through a server-side (named) cursor
+        with fetchmany, so the client never holds more than one batch. With
+        keyset=True, each batch is a separate query continuing after the last
+        seen key (WHERE key > %s ORDER BY key LIMIT chunksize) instead of
+        OFFSET paging. key defaults to the single-column primary key;
+        order_by, limit and offset are not supported with keyset.
+        """
+        if chunksize <= 0:
+            raise ValueError("chunksize must be positive")
+        if keyset and (order_by or limit is not None or offset is not None):
+            raise ValueError("order_by, limit and offset cannot be used with keyset")
+
+        if columns is None:
+            columns_str = "*"
+        elif isinstance(columns, str):
+            columns_str = f'"{columns}"'
+        else:
+            columns_str = ", ".join(f'"{col}"' for col in columns)
+
+        try:
+            with self.checkout() as conn:
+                if keyset:
+                    batches = self._iter_keyset_batches(
+                        conn, table_name, columns_str, where, chunksize, key
+                    )
+                else:
+                    batches = self._iter_fetchmany_batches(
+                        conn, table_name, columns_str, where, order_by,
+                        limit, offset, chunksize,
+                    )
+                for column_names, data in batches:
+                    yield self._format_rows(data, column_names, return_as)
+
+        except (Exception, psycopg2.Error) as err:
+            raise ValueError(f"Query execution failed: {err}")
+
+    @staticmethod
+    def _iter_fetchmany_batches(conn, table_name, columns_str, where, order_by,
+                                limit, offset, chunksize):
+        query_parts = [f"SELECT {columns_str} FROM {table_name}"]
+        if where:
+            query_parts.append(f"WHERE {where}")
+        if order_by:
+            query_parts.append(f"ORDER BY {order_by}")
+        if limit is not None:
+            query_parts.append(f"LIMIT {limit}")
+        if offset is not None:
+            query_parts.append(f"OFFSET {offset}")
+
+        # Named cursors are server-side; rows are transferred per fetchmany
+        with conn.cursor(name=f"mngs_iter_rows_{uuid.uuid4().hex}") as cursor:
+            cursor.itersize = chunksize
+            cursor.execute(" ".join(query_parts))
+            column_names = None
+            while True:
+                data = cursor.fetchmany(chunksize)
+                if column_names is None:
+                    column_names = [desc[0] for desc in cursor.description]
+                if not data:
+                    break
+                yield column_names, data
+
+    @staticmethod
+    def _iter_keyset_batches(conn, table_name, columns_str, where, chunksize, key):
+        with conn.cursor() as cursor:
+            if key is None:
+                cursor.execute(
+                    """
+                    SELECT a.attname
+                    FROM pg_index i
+                    JOIN pg_attribute a ON a.attrelid = i.indrelid
+                                       AND a.attnum = ANY(i.indkey)
+                    WHERE i.indrelid = %s::regclass AND i.indisprimary
+                    """,
+                    (table_name,),
+                )
+                pk_columns = [row[0] for row in cursor.fetchall()]
+                if len(pk_columns) != 1:
+                    raise ValueError(
+                        f"keyset requires a single-column primary key or key= for {table_name}"
+                    )
+                key = f'"{pk_columns[0]}"'
+
+            base_query = f"SELECT {key} AS _mngs_key, {columns_str} FROM {table_name}"
+            conditions = [f"({where})"] if where else []
+
+            last_key = None
+            while True:
+                batch_conditions = conditions + (
+                    [f"{key} > %s"] if last_key is not None else []
+                )
+                query = base_query
+                if batch_conditions:
+                    query += " WHERE " + " AND ".join(batch_conditions)
+                query += f" ORDER BY {key} LIMIT {chunksize}"
+
+                cursor.execute(query, (last_key,) if last_key is not None else None)
+                column_names = [desc[0] for desc in cursor.description][1:]
+                data = cursor.fetchall()
+                if not data:
+                    break
+                last_key = data[-1][0]
+                yield column_names, [row[1:] for row in data]
+                if len(data) < chunksize:
+                    break
+
+    @staticmethod
+    def _format_rows(data, column_names, return_as):
+        if return_as == "list":
+            return data
+        elif return_as == "dict":
+            return [dict(zip(column_names, row)) for row in data]
+        else:
+            return pd.DataFrame(data, columns=column_names)
+
     def get_row_count(self, table_name: str = None, where: str = None) -> int:
         try:
             if table_name is None:
@@ -34,9 +34,16 @@ class SQLite3(
 ):
     """Comprehensive SQLite database management class."""
 
-    def __init__(self, db_path: str, use_temp: bool = False):
-        """Initializes database with option for temporary copy."""
-        _ConnectionMixin.__init__(self, db_path, use_temp)
+    def __init__(
+        self, db_path: str, use_temp: bool = False, pool_size: int = 0
+    ):
+        """
+        Initializes database with option for temporary copy.
+
+        pool_size > 0 enables a pool of read-only connections used by
+        get_rows/load_array, so that reads from several threads run in parallel.
+        """
+        _ConnectionMixin.__init__(self, db_path, use_temp, pool_size)
 
     def __call__(
         self,
@@ -22,13 +22,25 @@ Prerequisites:
     * SQLite3 database connection
     * Table schema must exist
     * Foreign key constraints must be enabled if using inherit_foreign
+
+Example:
+    # Columnar bulk load; foreign keys are resolved with one join per key
+    db.insert_many("epochs", df, batch_size=100_000)
+    db.bulk_insert("epochs", {"subject_id": ids, "value": values})
 """
 
 from typing import Any as _Any
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 from .._BaseMixins._BaseBatchMixin import _BaseBatchMixin
 import sqlite3
 
+import numpy as np
+import pandas as pd
+
+# journal_mode is left as is (WAL): switching it needs an exclusive lock and
+# fails while pooled readers (see checkout) hold the database open
+_BULK_PRAGMAS = {"synchronous": "OFF"}
+
 class _BatchMixin:
     """Batch operations functionality"""
 
@@ -36,7 +48,7 @@ class _BatchMixin:
         self,
         sql_command,
         table_name: str,
-        rows: List[Dict[str, _Any]],
+        rows: Union[List[Dict[str, _Any]], pd.DataFrame, Dict[str, _Any]],
         batch_size: int = 1000,
         inherit_foreign: bool = True,
         where: Optional[str] = None,
@@ -119,7 +131,9 @@ class _BatchMixin:
                         print(
                             f"Warning: Where clause evaluation failed for row: {e}"
                         )
-            rows = filtered_rows
+                rows = filtered_rows
+                if not rows:
+                    return
             schema = self.get_table_schema(table_name)
             table_columns = set(schema["name"])
             valid_columns = [col for col in rows[0].keys()]
@@ -153,6 +167,198 @@ class _BatchMixin:
             self.rollback()
             raise ValueError(f"Batch operation failed: {e}")
 
+    def _run_bulk(
+        self,
+        sql_command: str,
+        table_name: str,
+        data: Union[pd.DataFrame, Dict[str, _Any]],
+        batch_size: int = 100_000,
+        inherit_foreign: bool = True,
+        where: Optional[str] = None,
+        fast_pragmas: bool = True,
+    ) -> int:
+        """Columnar counterpart of _run_many; see bulk_insert."""
+        if batch_size <= 0:
+            raise ValueError("Batch size must be positive")
+        assert sql_command.upper() in ["INSERT", "REPLACE", "INSERT OR REPLACE"]
+
+        columns = _to_columns(data)
+        n_rows = len(next(iter(columns.values()))) if columns else 0
+
+        table_columns = set(self.get_table_schema(table_name)["name"])
+        columns = {
+            col: values
+            for col, values in columns.items()
+            if col in table_columns and col.isidentifier()
+        }
+        if not columns:
+            raise ValueError("No valid columns found")
+        if n_rows == 0:
+            return 0
+
+        self._check_writable()
+        quoted_table = f'"{table_name.replace(chr(34), chr(34) * 2)}"'
+
+        with self.lock:
+            self.conn.commit()
+            restore = {}
+            try:
+                if fast_pragmas:
+                    restore = self._set_pragmas(_BULK_PRAGMAS)
+                self.cursor.execute("BEGIN TRANSACTION")
+
+                if inherit_foreign:
+                    self._inherit_foreign_bulk(quoted_table, columns, table_columns)
+
+                col_names = list(columns.keys())
+                col_list = ",".join(col_names)
+                placeholders = ",".join(["?"] * len(col_names))
+                rows = _iter_rows(list(columns.values()), n_rows, batch_size)
+
+                if where:
+                    # Rows are staged in a temp table and filtered in one statement
+                    stage = "_mngs_bulk_stage"
+                    self.cursor.execute(f"DROP TABLE IF EXISTS temp.{stage}")
+                    self.cursor.execute(
+                        f"CREATE TEMP TABLE {stage} AS "
+                        f"SELECT {col_list} FROM {quoted_table} WHERE 0"
+                    )
+                    self.cursor.executemany(
+                        f"INSERT INTO temp.{stage} ({col_list}) VALUES ({placeholders})",
+                        rows,
+                    )
+                    self.cursor.execute(
+                        f"{sql_command} INTO {quoted_table} ({col_list}) "
+                        f"SELECT {col_list} FROM temp.{stage} WHERE {where}"
+                    )
+                    n_inserted = self.cursor.rowcount
+                    self.cursor.execute(f"DROP TABLE temp.{stage}")
+                else:
+                    self.cursor.executemany(
+                        f"{sql_command} INTO {quoted_table} ({col_list}) VALUES ({placeholders})",
+                        rows,
+                    )
+                    n_inserted = self.cursor.rowcount
+
+                self.conn.commit()
+
+            except sqlite3.Error as e:
+                self.conn.rollback()
+                raise ValueError(f"Bulk operation failed: {e}")
+
+            except Exception:
+                self.conn.rollback()
+                raise
+
+            finally:
+                self._set_pragmas(restore)
+
+        return n_inserted
+
+    def _set_pragmas(self, pragmas: Dict[str, str]) -> Dict[str, str]:
+        """Sets PRAGMAs outside of transactions and returns their previous values."""
+        previous = {}
+        for key, value in pragmas.items():
+            previous[key] = self.cursor.execute(f"PRAGMA {key}").fetchone()[0]
+            self.cursor.execute(f"PRAGMA {key} = {value}").fetchall()
+        return previous
+
+    def _inherit_foreign_bulk(
+        self,
+        quoted_table: str,
+        columns: Dict[str, np.ndarray],
+        table_columns: set,
+    ) -> None:
+        """
+        Set-based version of the per-row foreign key lookup in _run_many.
+
+        Missing values of from_col are filled with ref_table.from_col matched on
+        to_col; the distinct keys are joined against ref_table in one query.
+        """
+        foreign_keys = self.cursor.execute(
+            f"PRAGMA foreign_key_list({quoted_table})"
+        ).fetchall()
+
+        for fk in foreign_keys:
+            ref_table, from_col, to_col = fk[2], fk[3], fk[4]
+            if to_col not in columns or from_col not in table_columns:
+                continue
+
+            current = pd.Series(
+                columns.get(from_col, np.full(len(columns[to_col]), None, dtype=object))
+            )
+            missing = current.isna().to_numpy()
+            if not missing.any():
+                continue
+
+            keys = pd.unique(pd.Series(columns[to_col])[missing].dropna())
+            if len(keys) == 0:
+                continue
+
+            self.cursor.execute("DROP TABLE IF EXISTS temp._mngs_fk_keys")
+            self.cursor.execute("CREATE TEMP TABLE _mngs_fk_keys (key PRIMARY KEY)")
+            self.cursor.executemany(
+                "INSERT OR IGNORE INTO temp._mngs_fk_keys (key) VALUES (?)",
+                ((key,) for key in _to_sql_values(np.asarray(keys))),
+            )
+            mapping = dict(
+                self.cursor.execute(
+                    f'SELECT k.key, r."{from_col}" FROM temp._mngs_fk_keys AS k '
+                    f'JOIN "{ref_table}" AS r ON r."{to_col}" = k.key'
+                ).fetchall()
+            )
+            self.cursor.execute("DROP TABLE temp._mngs_fk_keys")
+
+            filled = pd.Series(columns[to_col]).map(mapping)
+            columns[from_col] = (
+                current.astype(object).where(~missing, filled).to_numpy()
+            )
+
+    def bulk_insert(
+        self,
+        table_name: str,
+        data: Union[pd.DataFrame, Dict[str, _Any]],
+        batch_size: int = 100_000,
+        inherit_foreign: bool = True,
+        where: Optional[str] = None,
+        fast_pragmas: bool = True,
+        replace: bool = False,
+    ) -> int:
+        """
+        Inserts columnar data in a single transaction.
+
+        Rows are converted to SQL values batch by batch and streamed from a
+        generator into one executemany call, so no per-row Python structures are
+        kept for the whole input.
+
+        Parameters:
+            table_name (str): Target table.
+            data (pd.DataFrame | dict): DataFrame or dict of equal-length arrays.
+                Columns not in the table are ignored.
+            batch_size (int): Number of rows converted at a time.
+            inherit_foreign (bool): Fills missing foreign key columns with one
+                join per foreign key, as insert_many does row by row.
+            where (str, optional): SQL condition on the inserted columns; rows
+                are staged in a temp table and filtered in one statement.
+            fast_pragmas (bool): Sets synchronous=OFF during the load and
+                restores it afterwards. The WAL journal is kept, so pooled
+                readers may stay open; a power loss during the load may lose
+                the latest commits.
+            replace (bool): Uses REPLACE instead of INSERT.
+
+        Returns:
+            int: Number of inserted rows.
+        """
+        return self._run_bulk(
+            sql_command="REPLACE" if replace else "INSERT",
+            table_name=table_name,
+            data=data,
+            batch_size=batch_size,
+            inherit_foreign=inherit_foreign,
+            where=where,
+            fast_pragmas=fast_pragmas,
+        )
+
     def update_many(
         self,
         table_name: str,
@@ -175,11 +381,22 @@ class _BatchMixin:
     def insert_many(
         self,
         table_name: str,
-        rows: List[Dict[str, _Any]],
+        rows: Union[List[Dict[str, _Any]], pd.DataFrame, Dict[str, _Any]],
         batch_size: int = 1000,
         inherit_foreign: bool = True,
         where: Optional[str] = None,
     ) -> None:
+        if isinstance(rows, (pd.DataFrame, dict)):
+            self._run_bulk(
+                sql_command="INSERT",
+                table_name=table_name,
+                data=rows,
+                batch_size=max(batch_size, 1),
+                inherit_foreign=inherit_foreign,
+                where=where,
+            )
+            return
+
         with self.transaction():
             self._run_many(
                 sql_command="INSERT",
@@ -193,11 +410,22 @@ class _BatchMixin:
     def replace_many(
         self,
         table_name: str,
-        rows: List[Dict[str, _Any]],
+        rows: Union[List[Dict[str, _Any]], pd.DataFrame, Dict[str, _Any]],
         batch_size: int = 1000,
         inherit_foreign: bool = True,
         where: Optional[str] = None,
     ) -> None:
+        if isinstance(rows, (pd.DataFrame, dict)):
+            self._run_bulk(
+                sql_command="REPLACE",
+                table_name=table_name,
+                data=rows,
+                batch_size=max(batch_size, 1),
+                inherit_foreign=inherit_foreign,
+                where=where,
+            )
+            return
+
         with self.transaction():
             self._run_many(
                 sql_command="REPLACE",
@@ -237,4 +465,53 @@ class _BatchMixin:
             self.execute(query, tuple(updates.values()))
 
 
+def _to_columns(data) -> Dict[str, np.ndarray]:
+    """DataFrame or dict of arrays to an ordered dict of 1D arrays."""
+    if isinstance(data, pd.DataFrame):
+        return {str(col): data[col].to_numpy() for col in data.columns}
+    if isinstance(data, dict):
+        columns = {}
+        for col, values in data.items():
+            values = np.asarray(values) if not isinstance(values, pd.Series) else values.to_numpy()
+            if values.ndim != 1:
+                raise ValueError(f"Column {col} must be one-dimensional")
+            columns[str(col)] = values
+        if len({len(v) for v in columns.values()}) > 1:
+            raise ValueError("All columns must have the same length")
+        return columns
+    raise TypeError("data must be a pandas DataFrame or a dict of arrays")
+
+
+def _to_sql_values(values: np.ndarray) -> list:
+    """Converts a 1D array to a list of Python objects sqlite3 can bind."""
+    if values.dtype.kind in "Mm":
+        # Element-wise, as Series.astype(str) drops "00:00:00" when all
+        # values of a batch are at midnight
+        return [None if pd.isna(v) else str(v) for v in pd.Series(values)]
+    if values.dtype.kind == "O":
+        return [
+            None
+            if _is_scalar_na(v)
+            else str(v) if isinstance(v, pd.Timestamp)
+            else v.item() if isinstance(v, np.generic)
+            else v
+            for v in values
+        ]
+    return values.tolist()
+
+
+def _is_scalar_na(value) -> bool:
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+def _iter_rows(columns: List[np.ndarray], n_rows: int, batch_size: int):
+    """Yields row tuples, converting batch_size rows of each column at a time."""
+    for start in range(0, n_rows, batch_size):
+        stop = min(start + batch_size, n_rows)
+        yield from zip(*[_to_sql_values(col[start:stop]) for col in columns])
+
+
 # EOF
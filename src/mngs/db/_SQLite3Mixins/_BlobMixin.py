@@ -5,11 +5,19 @@
 
 __file__ = "/home/ywatanabe/proj/mngs_repo/src/mngs/db/_SQLite3Mixins/_BlobMixin.py"
 
+import ast
 import sqlite3
 from typing import Any as _Any
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
+from .._array_codec import (
+    _unpack_header,
+    decode_array,
+    decode_arrays,
+    encode_array,
+    is_encoded_array,
+)
 from .._BaseMixins._BaseBlobMixin import _BaseBlobMixin
 
 class _BlobMixin:
@@ -24,13 +32,30 @@ class _BlobMixin:
         where: str = None,
         additional_columns: Dict[str, _Any] = None,
         batch_size: int = 1000,
+        codec: Optional[str] = None,
+        level: Optional[int] = None,
+        shuffle: bool = True,
     ) -> None:
+        """
+        Saves array(s) as BLOBs with {column}_dtype and {column}_shape metadata.
+
+        With codec ("none", "zlib", "zstd", "lz4" or "blosc"), BLOBs are
+        written by mngs.db.encode_array: a binary dtype/shape header followed
+        by the optionally byte-shuffled and compressed payload. load_array
+        detects the header, so both formats can be read back. With ids,
+        updates are sent with executemany in batches of batch_size.
+        """
         with self.lock:
             if not isinstance(data, (np.ndarray, list)):
                 raise ValueError(
                     "Input must be a NumPy array or list of arrays"
                 )
 
+            def _to_blob(arr):
+                if codec is None:
+                    return arr.tobytes()
+                return encode_array(arr, codec=codec, level=level, shuffle=shuffle)
+
             try:
                 if ids is not None:
                     if isinstance(ids, int):
@@ -41,34 +66,36 @@ class _BlobMixin:
                             "Length of ids must match number of arrays"
                         )
 
-                    for id_, arr in zip(ids, data):
-                        if not isinstance(arr, np.ndarray):
-                            raise ValueError(
-                                f"Element for id {id_} must be a NumPy array"
+                    columns = [column, f"{column}_dtype", f"{column}_shape"]
+                    extra_values = []
+                    if additional_columns:
+                        columns = list(additional_columns.keys()) + columns
+                        extra_values = list(additional_columns.values())
+
+                    update_cols = [f"{col}=?" for col in columns]
+                    query = f"UPDATE {table_name} SET {','.join(update_cols)} WHERE id=?"
+
+                    for idx in range(0, len(ids), batch_size):
+                        params = []
+                        for id_, arr in zip(
+                            ids[idx : idx + batch_size],
+                            data[idx : idx + batch_size],
+                        ):
+                            if not isinstance(arr, np.ndarray):
+                                raise ValueError(
+                                    f"Element for id {id_} must be a NumPy array"
+                                )
+                            params.append(
+                                tuple(extra_values)
+                                + (_to_blob(arr), str(arr.dtype), str(arr.shape), id_)
                             )
-
-                        binary = arr.tobytes()
-                        columns = [
-                            column,
-                            f"{column}_dtype",
-                            f"{column}_shape",
-                        ]
-                        values = [binary, str(arr.dtype), str(arr.shape)]
-
-                        if additional_columns:
-                            columns = list(additional_columns.keys()) + columns
-                            values = list(additional_columns.values()) + values
-
-                        update_cols = [f"{col}=?" for col in columns]
-                        query = f"UPDATE {table_name} SET {','.join(update_cols)} WHERE id=?"
-                        values.append(id_)
-                        self.execute(query, tuple(values))
+                        self.executemany(query, params)
 
                 else:
                     if not isinstance(data, np.ndarray):
                         raise ValueError("Single input must be a NumPy array")
 
-                    binary = data.tobytes()
+                    binary = _to_blob(data)
                     columns = [column, f"{column}_dtype", f"{column}_shape"]
                     values = [binary, str(data.dtype), str(data.shape)]
 
@@ -89,7 +116,7 @@ class _BlobMixin:
             except Exception as err:
                 raise ValueError(f"Failed to save array: {err}")
 
-    def load_array(
+    def iter_arrays(
         self,
         table_name: str,
         column: str,
@@ -99,71 +126,205 @@ class _BlobMixin:
         batch_size: int = 128,
         dtype: np.dtype = None,
         shape: Optional[Tuple] = None,
-    ) -> Optional[np.ndarray]:
+    ) -> Iterator[Tuple[List[int], np.ndarray]]:
+        """
+        Yields (ids, arrays) per batch, where arrays has shape (len(ids), *shape).
+
+        ids="all" streams the table with one query (ordered by order_by, or by
+        id); otherwise the requested id order, including repeats, is kept and
+        order_by is ignored. where is applied in SQL in both cases. Rows
+        missing from the table or excluded by where are skipped.
+        """
+        with self.checkout() as conn:
+            yield from self._iter_arrays(
+                conn, table_name, column, ids, where, order_by, batch_size, dtype, shape
+            )
+
+    def _iter_arrays(
+        self, conn, table_name, column, ids, where, order_by, batch_size, dtype, shape
+    ):
+        if batch_size <= 0:
+            raise ValueError("Batch size must be positive")
+
+        cursor = conn.cursor()
         try:
-            if ids == "all":
-                query = f"SELECT id FROM {table_name}"
+            table_columns = {
+                row[1] for row in cursor.execute(f"PRAGMA table_info({table_name})")
+            }
+            has_metadata = {f"{column}_dtype", f"{column}_shape"} <= table_columns
+            if not has_metadata and dtype is None:
+                dtype = np.float64
+            select = (
+                f"SELECT id, {column}, {column}_dtype, {column}_shape FROM {table_name}"
+                if has_metadata
+                else f"SELECT id, {column}, NULL, NULL FROM {table_name}"
+            )
+
+            if isinstance(ids, str) and ids == "all":
+                query = select
                 if where:
                     query += f" WHERE {where}"
-                self.cursor.execute(query)
-                ids = [row[0] for row in self.cursor.fetchall()]
-            elif isinstance(ids, int):
-                ids = [ids]
-
-            id_to_data = {}
-            unique_ids = list(set(ids))
-
-            for idx in range(0, len(unique_ids), batch_size):
-                batch_ids = unique_ids[idx : idx + batch_size]
-                placeholders = ",".join("?" for _ in batch_ids)
-
-                try:
-                    query = f"""
-                        SELECT id, {column},
-                               {column}_dtype,
-                               {column}_shape
-                        FROM {table_name}
-                        WHERE id IN ({placeholders})
-                    """
-                    self.cursor.execute(query, tuple(batch_ids))
-                    has_metadata = True
-                except sqlite3.OperationalError:
-                    query = f"SELECT id, {column} FROM {table_name} WHERE id IN ({placeholders})"
-                    self.cursor.execute(query, tuple(batch_ids))
-                    has_metadata = False
+                query += f" ORDER BY {order_by if order_by else 'id'}"
+                cursor.execute(query)
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield self._decode_array_batch(rows, dtype, shape)
+            else:
+                if isinstance(ids, (int, np.integer)):
+                    ids = [ids]
+                ids = [int(id_) for id_ in ids]
+                for idx in range(0, len(ids), batch_size):
+                    batch_ids = ids[idx : idx + batch_size]
+                    unique_ids = list(dict.fromkeys(batch_ids))
+                    placeholders = ",".join("?" for _ in unique_ids)
+                    query = f"{select} WHERE id IN ({placeholders})"
+                    if where:
+                        query += f" AND ({where})"
+                    cursor.execute(query, tuple(unique_ids))
+                    id_to_row = {row[0]: row for row in cursor.fetchall()}
+                    rows = [
+                        id_to_row[id_] for id_ in batch_ids if id_ in id_to_row
+                    ]
+                    if rows:
+                        yield self._decode_array_batch(rows, dtype, shape)
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _decode_array_batch(rows, dtype=None, shape=None):
+        """
+        Decodes rows of (id, blob, dtype_str, shape_str) into one stacked array.
+
+        Rows may mix raw BLOBs and BLOBs encoded with different codecs; they
+        are grouped by format, each group is decoded in one go, and the
+        arrays are put back in row order. Only the dtype and shape must agree.
+        """
+        groups = {}
+        row_meta = []
+        for ii, row in enumerate(rows):
+            blob = row[1]
+            if is_encoded_array(blob):
+                row_dtype, row_shape, _, _, header_len = _unpack_header(blob)
+                group_key = bytes(blob[:header_len])
+            elif row[2] is not None and row[3] is not None:
+                row_dtype = np.dtype(row[2])
+                row_shape = tuple(ast.literal_eval(row[3]))
+                group_key = None
+            else:
+                row_dtype = np.dtype(dtype)
+                row_shape = (
+                    tuple(shape)
+                    if shape is not None
+                    else (len(blob) // row_dtype.itemsize,)
+                )
+                group_key = None
+            row_meta.append((row_dtype.str, row_shape))
+            groups.setdefault(group_key, []).append(ii)
+
+        metadata = set(row_meta)
+        if len(metadata) != 1:
+            raise ValueError(
+                f"Arrays in a batch differ in dtype or shape: {sorted(map(str, metadata))}"
+            )
+        dtype_str, shape = metadata.pop()
+        dtype = np.dtype(dtype_str)
+        ids = [row[0] for row in rows]
+
+        def _decode_group(group_key, indices, out=None):
+            blobs = [rows[ii][1] for ii in indices]
+            if group_key is not None:
+                return decode_arrays(blobs, out=out)
+            # One copy for the group into a bytearray, so that the arrays are
+            # writable like decoded ones; frombuffer over it is zero-copy
+            arrays = np.frombuffer(bytearray().join(blobs), dtype=dtype)
+            return arrays.reshape(len(blobs), *shape)
+
+        if len(groups) == 1:
+            (group_key, indices), = groups.items()
+            return ids, _decode_group(group_key, indices)
+
+        arrays = np.empty((len(rows),) + shape, dtype=dtype)
+        for group_key, indices in groups.items():
+            if indices == list(range(indices[0], indices[-1] + 1)):
+                # Contiguous rows are decoded straight into the output
+                out = arrays[indices[0] : indices[-1] + 1]
+                if group_key is not None:
+                    _decode_group(group_key, indices, out=out)
+                else:
+                    out[:] = _decode_group(group_key, indices)
+            else:
+                arrays[indices] = _decode_group(group_key, indices)
+        return ids, arrays
 
-                if where:
-                    query += f" AND {where}"
-                if order_by:
-                    query += f" ORDER BY {order_by}"
-
-                results = self.cursor.fetchall()
-                if results:
-                    for result in results:
-                        if has_metadata:
-                            id_val, blob, dtype_str, shape_str = result
-                            data = np.frombuffer(
-                                blob, dtype=np.dtype(dtype_str)
-                            ).reshape(eval(shape_str))
-                        else:
-                            id_val, blob = result
-                            data = (
-                                np.frombuffer(blob, dtype=dtype)
-                                if dtype
-                                else np.frombuffer(blob)
-                            )
-                            if shape:
-                                data = data.reshape(shape)
-                        id_to_data[id_val] = data
+    def load_array(
+        self,
+        table_name: str,
+        column: str,
+        ids: Union[int, List[int], str] = "all",
+        where: str = None,
+        order_by: str = None,
+        batch_size: int = 128,
+        dtype: np.dtype = None,
+        shape: Optional[Tuple] = None,
+        out: Optional[np.ndarray] = None,
+    ) -> Optional[np.ndarray]:
+        """
+        Loads arrays stored by save_array, stacked along the first axis.
+
+        Batches from iter_arrays are written straight into the output, so peak
+        memory is the output plus one batch. Pass out (e.g., a np.memmap or
+        np.lib.format.open_memmap) to fill a preallocated array; the filled
+        leading part of out is returned. Without out, the output is allocated
+        from the first batch and the row count.
+        """
+        try:
+            n_filled = 0
+            with self.checkout() as conn:
+                for _, arrays in self._iter_arrays(
+                    conn,
+                    table_name,
+                    column,
+                    ids,
+                    where,
+                    order_by,
+                    batch_size,
+                    dtype,
+                    shape,
+                ):
+                    if out is None:
+                        n_rows = self._count_array_rows(conn, table_name, ids, where)
+                        out = np.empty(
+                            (n_rows,) + arrays.shape[1:], dtype=arrays.dtype
+                        )
+                    n_batch = len(arrays)
+                    if out.shape[0] < n_filled + n_batch:
+                        raise ValueError(
+                            f"out has {out.shape[0]} rows but more rows were loaded"
+                        )
+                    out[n_filled : n_filled + n_batch] = arrays
+                    n_filled += n_batch
 
-            all_data = [
-                id_to_data[id_val] for id_val in ids if id_val in id_to_data
-            ]
-            return np.stack(all_data, axis=0) if all_data else None
+            if n_filled == 0:
+                return None
+            return out[:n_filled]
 
         except Exception as err:
             raise ValueError(f"Failed to load array: {err}")
 
+    @staticmethod
+    def _count_array_rows(conn, table_name, ids, where=None) -> int:
+        """Upper bound on the number of rows load_array returns."""
+        if isinstance(ids, str) and ids == "all":
+            query = f"SELECT COUNT(*) FROM {table_name}"
+            if where:
+                query += f" WHERE {where}"
+            return conn.execute(query).fetchone()[0]
+        if isinstance(ids, (int, np.integer)):
+            return 1
+        return len(ids)
+
     def binary_to_array(
         self,
         binary_data,
@@ -175,12 +336,16 @@ class _BlobMixin:
         if binary_data is None:
             return None
 
+        if is_encoded_array(binary_data):
+            return decode_array(binary_data)
+
+        # Copied into a bytearray so that arrays are writable, as decoded ones
         if dtype_str and shape_str:
             return np.frombuffer(
-                binary_data, dtype=np.dtype(dtype_str)
-            ).reshape(eval(shape_str))
+                bytearray(binary_data), dtype=np.dtype(dtype_str)
+            ).reshape(ast.literal_eval(shape_str))
         elif dtype and shape:
-            return np.frombuffer(binary_data, dtype=dtype).reshape(shape)
+            return np.frombuffer(bytearray(binary_data), dtype=dtype).reshape(shape)
         return binary_data
 
     def get_array_dict(self, df, columns=None, dtype=None, shape=None):
@@ -9,6 +9,8 @@ __file__ = "/home/ywatanabe/proj/mngs_repo/src/mngs/db/_SQLite3Mixins/_Connectio
 1. Functionality:
    - Manages SQLite database connections with thread-safe operations
    - Handles database journal files and transaction states
+   - Optionally keeps a bounded pool of read-only WAL connections so that
+     reads from several threads run in parallel while writes stay serialized
 2. Input:
    - Database file path
 3. Output:
@@ -18,6 +20,7 @@ __file__ = "/home/ywatanabe/proj/mngs_repo/src/mngs/db/_SQLite3Mixins/_Connectio
    - threading
 """
 
+import queue
 import sqlite3
 import threading
 from typing import Optional
@@ -30,12 +33,21 @@ import contextlib
 class _ConnectionMixin:
     """Connection management functionality"""
 
-    def __init__(self, db_path: str, use_temp_db: bool = False):
+    def __init__(
+        self, db_path: str, use_temp_db: bool = False, pool_size: int = 0
+    ):
+        if pool_size < 0:
+            raise ValueError("pool_size must be >= 0")
         self.lock = threading.Lock()
         self._maintenance_lock = threading.Lock()
         self.db_path = db_path
         self.conn = None
         self.cursor = None
+        self.temp_path = None
+        self.pool_size = pool_size
+        self._pool = queue.LifoQueue()
+        self._pool_lock = threading.Lock()
+        self._n_pool_conns = 0
         if db_path:
             self.connect(db_path, use_temp_db)
 
@@ -60,7 +72,10 @@ class _ConnectionMixin:
 
         path_to_connect = self._create_temp_copy(db_path) if use_temp_db else db_path
 
-        self.conn = sqlite3.connect(path_to_connect, timeout=60.0)
+        self._connected_path = path_to_connect
+        self.conn = sqlite3.connect(
+            path_to_connect, timeout=60.0, check_same_thread=False
+        )
         self.cursor = self.conn.cursor()
 
         with self.lock:
@@ -73,7 +88,89 @@ class _ConnectionMixin:
             self.cursor.execute("PRAGMA cache_size = -2000")
             self.conn.commit()
 
+    def _connect_reader(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            f"file:{os.path.abspath(self._connected_path)}?mode=ro",
+            uri=True,
+            timeout=60.0,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA busy_timeout = 60000")
+        conn.execute("PRAGMA mmap_size = 30000000000")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+
+    @contextlib.contextmanager
+    def checkout(self, readonly: bool = True):
+        """
+        Checks out a connection for the duration of the with block.
+
+        With pool_size > 0, readonly checkouts take one of up to pool_size
+        read-only connections (created lazily, blocking when all are in use),
+        so that reads from different threads do not share a cursor. WAL mode
+        lets them run while the main connection writes. Writable checkouts
+        return the main connection under the write lock.
+
+        Without a pool, the main connection is returned as before.
+
+        Example:
+            with db.checkout() as conn:
+                rows = conn.execute("SELECT * FROM t").fetchall()
+        """
+        if not self.conn:
+            raise ConnectionError("Database not connected")
+
+        if not readonly:
+            with self.lock:
+                yield self.conn
+            return
+
+        if self.pool_size == 0:
+            yield self.conn
+            return
+
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._pool_lock:
+                if self._n_pool_conns < self.pool_size:
+                    self._n_pool_conns += 1
+                    create = True
+                else:
+                    create = False
+            if create:
+                try:
+                    conn = self._connect_reader()
+                except sqlite3.Error:
+                    with self._pool_lock:
+                        self._n_pool_conns -= 1
+                    raise
+            else:
+                conn = self._pool.get()
+
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._pool.put(conn)
+
+    def _close_pool(self) -> None:
+        with self._pool_lock:
+            while True:
+                try:
+                    conn = self._pool.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+                self._n_pool_conns -= 1
+
     def close(self) -> None:
+        self._close_pool()
         if self.cursor:
             self.cursor.close()
         if self.conn:
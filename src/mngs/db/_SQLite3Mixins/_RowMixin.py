@@ -6,7 +6,7 @@
 __file__ = "/home/ywatanabe/proj/mngs_repo/src/mngs/db/_SQLite3Mixins/_RowMixin.py"
 
 import sqlite3
-from typing import List
+from typing import Iterator, List
 from typing import Optional
 import pandas as pd
 from .._BaseMixins._BaseRowMixin import _BaseRowMixin
@@ -23,7 +23,26 @@ class _RowMixin:
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         return_as: str = "dataframe",
+        chunksize: Optional[int] = None,
     ):
+        """
+        Returns rows as a DataFrame, list of tuples or list of dicts.
+
+        With chunksize, an iterator of batches is returned instead
+        (see iter_rows).
+        """
+        if chunksize is not None:
+            return self.iter_rows(
+                table_name,
+                columns=columns,
+                where=where,
+                order_by=order_by,
+                limit=limit,
+                offset=offset,
+                return_as=return_as,
+                chunksize=chunksize,
+            )
+
         if columns is None:
             columns_str = "*"
         elif isinstance(columns, str):
@@ -41,15 +60,21 @@ class _RowMixin:
             if limit is not None:
                 query_parts.append(f"LIMIT {limit}")
             if offset is not None:
+                if limit is None:
+                    query_parts.append("LIMIT -1")
                 query_parts.append(f"OFFSET {offset}")
 
             query = " ".join(query_parts)
-            self.cursor.execute(query)
-
-            column_names = [
-                description[0] for description in self.cursor.description
-            ]
-            data = self.cursor.fetchall()
+            with self.checkout() as conn:
+                cursor = conn.cursor()
+                try:
+                    cursor.execute(query)
+                    column_names = [
+                        description[0] for description in cursor.description
+                    ]
+                    data = cursor.fetchall()
+                finally:
+                    cursor.close()
 
             if return_as == "list":
                 return data
@@ -61,6 +86,134 @@ class _RowMixin:
         except sqlite3.Error as error:
             raise sqlite3.Error(f"Query execution failed: {str(error)}")
 
+    def iter_rows(
+        self,
+        table_name: str,
+        columns: List[str] = None,
+        where: str = None,
+        order_by: str = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        return_as: str = "dataframe",
+        chunksize: int = 10_000,
+        keyset: bool = False,
+        key: Optional[str] = None,
+    ) -> Iterator:
+        """
+        Yields rows in batches of up to chunksize, formatted as in get_rows.
+
+        By default one query is streamed with fetchmany. With keyset=True,
+        each batch is a separate query continuing after the last seen key
+        (WHERE key > ? ORDER BY key LIMIT chunksize), which keeps every batch
+        an index seek rather than an OFFSET scan and holds no read transaction
+        open between batches. key defaults to the single-column primary key,
+        or rowid; order_by, limit and offset are not supported with keyset.
+        """
+        if chunksize <= 0:
+            raise ValueError("chunksize must be positive")
+        if keyset and (order_by or limit is not None or offset is not None):
+            raise ValueError("order_by, limit and offset cannot be used with keyset")
+
+        if columns is None:
+            columns_str = "*"
+        elif isinstance(columns, str):
+            columns_str = f'"{columns}"'
+        else:
+            columns_str = ", ".join(f'"{col}"' for col in columns)
+
+        try:
+            with self.checkout() as conn:
+                cursor = conn.cursor()
+                try:
+                    if keyset:
+                        batches = self._iter_keyset_batches(
+                            cursor, table_name, columns_str, where, chunksize, key
+                        )
+                    else:
+                        batches = self._iter_fetchmany_batches(
+                            cursor,
+                            table_name,
+                            columns_str,
+                            where,
+                            order_by,
+                            limit,
+                            offset,
+                            chunksize,
+                        )
+                    for column_names, data in batches:
+                        yield self._format_rows(data, column_names, return_as)
+                finally:
+                    cursor.close()
+
+        except sqlite3.Error as error:
+            raise sqlite3.Error(f"Query execution failed: {str(error)}")
+
+    @staticmethod
+    def _iter_fetchmany_batches(
+        cursor, table_name, columns_str, where, order_by, limit, offset, chunksize
+    ):
+        query_parts = [f"SELECT {columns_str} FROM {table_name}"]
+        if where:
+            query_parts.append(f"WHERE {where}")
+        if order_by:
+            query_parts.append(f"ORDER BY {order_by}")
+        if limit is not None:
+            query_parts.append(f"LIMIT {limit}")
+        if offset is not None:
+            if limit is None:
+                query_parts.append("LIMIT -1")
+            query_parts.append(f"OFFSET {offset}")
+
+        cursor.execute(" ".join(query_parts))
+        column_names = [description[0] for description in cursor.description]
+        while True:
+            data = cursor.fetchmany(chunksize)
+            if not data:
+                break
+            yield column_names, data
+
+    @staticmethod
+    def _iter_keyset_batches(cursor, table_name, columns_str, where, chunksize, key):
+        if key is None:
+            pk_columns = [
+                row[1]
+                for row in cursor.execute(f"PRAGMA table_info({table_name})")
+                if row[5] > 0
+            ]
+            key = f'"{pk_columns[0]}"' if len(pk_columns) == 1 else "rowid"
+
+        base_query = f"SELECT {key} AS _mngs_key, {columns_str} FROM {table_name}"
+        conditions = [f"({where})"] if where else []
+
+        last_key = None
+        while True:
+            batch_conditions = conditions + (
+                [f"{key} > ?"] if last_key is not None else []
+            )
+            query = base_query
+            if batch_conditions:
+                query += " WHERE " + " AND ".join(batch_conditions)
+            query += f" ORDER BY {key} LIMIT {chunksize}"
+
+            cursor.execute(query, (last_key,) if last_key is not None else ())
+            column_names = [description[0] for description in cursor.description][1:]
+            data = cursor.fetchall()
+            if not data:
+                break
+            last_key = data[-1][0]
+            yield column_names, [row[1:] for row in data]
+            if len(data) < chunksize:
+                break
+
+    @staticmethod
+    def _format_rows(data, column_names, return_as):
+        if return_as == "list":
+            return data
+        elif return_as == "dict":
+            return [dict(zip(column_names, row)) for row in data]
+        else:
+            return pd.DataFrame(data, columns=column_names)
+
     def get_row_count(self, table_name: str = None, where: str = None) -> int:
         if table_name is None:
             raise ValueError("Table name must be specified")
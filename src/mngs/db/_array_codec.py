@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-17 14:48:05 (ywatanabe)"
+# File: ./mngs_repo/src/mngs/db/_array_codec.py
+
+__file__ = "/home/ywatanabe/proj/mngs_repo/src/mngs/db/_array_codec.py"
+
+"""
+Functionality:
+    - Encodes NumPy arrays into self-describing BLOBs with a compact binary
+      header, optional byte shuffling and optional compression
+    - Decodes single BLOBs or whole batches of BLOBs into one stacked array
+Input:
+    - NumPy arrays / BLOBs (bytes, memoryview)
+Output:
+    - BLOBs / NumPy arrays
+Prerequisites:
+    - numpy
+    - Optional: zstandard (codec="zstd"), lz4 (codec="lz4"), blosc (codec="blosc")
+
+Format:
+    b"MNGA" | version (u8) | codec (u8) | flags (u8) | len(dtype) (u8) |
+    dtype.str (ascii) | ndim (u8) | shape (ndim x u64, little endian) | payload
+
+Example:
+    blob = encode_array(np.random.randn(64, 1000).astype(np.float32), codec="zstd")
+    arr = decode_array(blob)
+"""
+
+import struct
+import zlib
+from typing import Optional, Sequence
+
+import numpy as np
+
+MAGIC = b"MNGA"
+VERSION = 1
+CODECS = {"none": 0, "zlib": 1, "zstd": 2, "lz4": 3, "blosc": 4}
+_CODEC_NAMES = {vv: kk for kk, vv in CODECS.items()}
+_FLAG_SHUFFLE = 1
+
+
+def _import_codec(codec):
+    try:
+        if codec == "zstd":
+            import zstandard
+
+            return zstandard
+        if codec == "lz4":
+            import lz4.frame
+
+            return lz4.frame
+        if codec == "blosc":
+            import blosc
+
+            return blosc
+    except ImportError:
+        raise ImportError(
+            f'codec="{codec}" requires the optional package '
+            f'"{ {"zstd": "zstandard", "lz4": "lz4", "blosc": "blosc"}[codec] }"'
+        )
+
+
+def _compress(data, codec, level, typesize):
+    if codec == "none":
+        return bytes(data)
+    if codec == "zlib":
+        return zlib.compress(data, 6 if level is None else level)
+    module = _import_codec(codec)
+    if codec == "zstd":
+        return module.ZstdCompressor(level=3 if level is None else level).compress(data)
+    if codec == "lz4":
+        return module.compress(data, compression_level=0 if level is None else level)
+    if codec == "blosc":
+        # Bytes are shuffled by encode_array, so blosc's own shuffle is off
+        return module.compress(
+            bytes(data),
+            typesize=typesize,
+            clevel=5 if level is None else level,
+            shuffle=module.NOSHUFFLE,
+        )
+
+
+def _decompress(payload, codec):
+    if codec == "none":
+        return payload
+    if codec == "zlib":
+        return zlib.decompress(payload)
+    module = _import_codec(codec)
+    if codec == "zstd":
+        return module.ZstdDecompressor().decompress(payload)
+    if codec == "lz4":
+        return module.decompress(payload)
+    if codec == "blosc":
+        return module.decompress(payload)
+
+
+def _pack_header(dtype, shape, codec, shuffle):
+    dtype_str = dtype.str.encode("ascii")
+    flags = _FLAG_SHUFFLE if shuffle else 0
+    return (
+        MAGIC
+        + struct.pack("<BBBB", VERSION, CODECS[codec], flags, len(dtype_str))
+        + dtype_str
+        + struct.pack(f"<B{len(shape)}Q", len(shape), *shape)
+    )
+
+
+def _unpack_header(blob):
+    """Returns (dtype, shape, codec, shuffle, header_len)."""
+    if bytes(blob[:4]) != MAGIC:
+        raise ValueError("Not an encoded array (missing header)")
+    version, codec_id, flags, len_dtype = struct.unpack_from("<BBBB", blob, 4)
+    if version != VERSION:
+        raise ValueError(f"Unsupported array codec version: {version}")
+    offset = 8
+    dtype = np.dtype(bytes(blob[offset : offset + len_dtype]).decode("ascii"))
+    offset += len_dtype
+    (ndim,) = struct.unpack_from("<B", blob, offset)
+    offset += 1
+    shape = struct.unpack_from(f"<{ndim}Q", blob, offset)
+    offset += 8 * ndim
+    return dtype, tuple(shape), _CODEC_NAMES[codec_id], bool(flags & _FLAG_SHUFFLE), offset
+
+
+def is_encoded_array(blob) -> bool:
+    """Whether blob was written by encode_array."""
+    return blob is not None and len(blob) >= 4 and bytes(blob[:4]) == MAGIC
+
+
+def encode_array(
+    arr: np.ndarray,
+    codec: str = "zlib",
+    level: Optional[int] = None,
+    shuffle: bool = True,
+) -> bytes:
+    """
+    Encodes an array into a BLOB with a binary dtype/shape header.
+
+    Parameters:
+        arr (np.ndarray): Array to encode.
+        codec (str): "none", "zlib", "zstd", "lz4" or "blosc".
+        level (int, optional): Compression level; codec default when None.
+        shuffle (bool): Byte-shuffles elements before compression, which
+            groups exponent/high bytes of floats together and usually
+            improves the ratio markedly for numeric data.
+
+    Returns:
+        bytes: Header followed by the (compressed) payload.
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Unknown codec: {codec}. Choose from {list(CODECS)}")
+    arr = np.ascontiguousarray(arr)
+    if arr.dtype.hasobject:
+        raise ValueError("Object arrays cannot be encoded")
+    shuffle = shuffle and arr.dtype.itemsize > 1
+
+    data = arr.view(np.uint8).reshape(-1)
+    if shuffle:
+        data = data.reshape(-1, arr.dtype.itemsize).T.copy().reshape(-1)
+
+    header = _pack_header(arr.dtype, arr.shape, codec, shuffle)
+    return header + _compress(memoryview(data), codec, level, arr.dtype.itemsize)
+
+
+def decode_array(blob) -> np.ndarray:
+    """Decodes a BLOB written by encode_array."""
+    return decode_arrays([blob])[0]
+
+
+def decode_arrays(blobs: Sequence, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Decodes BLOBs sharing one dtype/shape into an array of shape (len(blobs), *shape).
+
+    The header is parsed once; each decompressed payload is copied into its
+    row of the output buffer (or of one scratch buffer when shuffled), and
+    byte unshuffling is done for the whole batch at once.
+
+    Parameters:
+        blobs (Sequence): BLOBs written by encode_array with the same header.
+        out (np.ndarray, optional): C-contiguous output of the right shape/dtype.
+
+    Returns:
+        np.ndarray: Stacked arrays.
+    """
+    if len(blobs) == 0:
+        raise ValueError("No blobs to decode")
+
+    dtype, shape, codec, shuffle, header_len = _unpack_header(blobs[0])
+    header = bytes(blobs[0][:header_len])
+    n_bytes = dtype.itemsize * int(np.prod(shape, dtype=np.int64))
+
+    if out is None:
+        out = np.empty((len(blobs),) + shape, dtype=dtype)
+    elif (
+        out.shape != (len(blobs),) + shape
+        or out.dtype != dtype
+        or not out.flags.c_contiguous
+    ):
+        raise ValueError(
+            f"out must be C-contiguous with shape {(len(blobs),) + shape} and dtype {dtype}"
+        )
+
+    # Byte view of out, one row per array
+    out_bytes = out.reshape(len(blobs), n_bytes // dtype.itemsize).view(np.uint8)
+    buffer = np.empty_like(out_bytes) if shuffle else out_bytes
+    for ii, blob in enumerate(blobs):
+        if bytes(blob[:header_len]) != header:
+            raise ValueError(
+                "Arrays in a batch differ in dtype, shape or codec; decode them separately"
+            )
+        raw = _decompress(memoryview(blob)[header_len:], codec)
+        if len(raw) != n_bytes:
+            raise ValueError(f"Corrupted array: expected {n_bytes} bytes, got {len(raw)}")
+        buffer[ii] = np.frombuffer(raw, dtype=np.uint8)
+
+    if shuffle:
+        out_bytes.reshape(len(blobs), -1, dtype.itemsize)[:] = buffer.reshape(
+            len(blobs), dtype.itemsize, -1
+        ).transpose(0, 2, 1)
+
+    return out
+
+
+# EOF
@@ -3,9 +3,11 @@
 # Time-stamp: "2024-11-11 14:16:58 (ywatanabe)"
 # File: ./mngs_repo/src/mngs/db/_delete_duplicates.py
 
+import hashlib
 import sqlite3
 from typing import List, Optional, Tuple, Union
 import pandas as pd
+from tqdm import tqdm
 
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
@@ -23,6 +25,13 @@ Output:
     - Updated SQLite database with duplicates removed
 Prerequisites:
     - sqlite3, pandas, tqdm, mngs
+
+Example:
+    # In-database dedup keeping the first row (lowest rowid) of each group
+    n_rows, n_duplicates = delete_duplicates(
+        "./data.db", "epochs", columns="all", include_blob=True,
+        method="rowid", dry_run=False,
+    )
 """
 
 
@@ -322,6 +331,97 @@ def _delete_entry(
 #         conn.close()
 
 
+def _blob_digest(blob) -> Optional[bytes]:
+    if blob is None:
+        return None
+    return hashlib.blake2b(bytes(blob), digest_size=16).digest()
+
+
+def _delete_duplicates_rowid(
+    conn: sqlite3.Connection,
+    table_name: str,
+    columns: List[str],
+    chunk_size: int = 100_000,
+    dry_run: bool = True,
+) -> Tuple[int, int]:
+    """
+    Set-based deletion of duplicates, keeping the row with the lowest rowid.
+
+    The rowids to keep are collected with one GROUP BY inside SQLite, and the
+    rest are deleted in rowid-range chunks, so the table is never loaded into
+    Python. BLOB columns are grouped by a 128-bit digest of their content.
+    Unlike the temp_table method, all columns of the kept rows are preserved.
+    """
+    cursor = conn.cursor()
+    column_types = {
+        col[1]: col[2] for col in cursor.execute(f"PRAGMA table_info({table_name})")
+    }
+    try:
+        cursor.execute(f"SELECT rowid FROM {table_name} LIMIT 1")
+    except sqlite3.OperationalError:
+        raise ValueError(f"{table_name} has no rowid (WITHOUT ROWID table)")
+
+    conn.create_function("_mngs_digest", 1, _blob_digest, deterministic=True)
+    group_by = ", ".join(
+        f"_mngs_digest({col})" if column_types.get(col, "").lower() == "blob" else col
+        for col in columns
+    )
+
+    min_rowid, max_rowid, total_rows = cursor.execute(
+        f"SELECT MIN(rowid), MAX(rowid), COUNT(*) FROM {table_name}"
+    ).fetchone()
+    if total_rows == 0:
+        print("Table is empty.")
+        return 0, 0
+
+    print("Collecting first rows of each duplicate group...")
+    cursor.execute("DROP TABLE IF EXISTS temp._mngs_keep")
+    cursor.execute(
+        "CREATE TEMP TABLE _mngs_keep (rid INTEGER PRIMARY KEY)"
+    )
+    cursor.execute(
+        f"INSERT INTO temp._mngs_keep "
+        f"SELECT MIN(rowid) FROM {table_name} GROUP BY {group_by}"
+    )
+    n_unique = cursor.execute("SELECT COUNT(*) FROM temp._mngs_keep").fetchone()[0]
+    total_duplicates = total_rows - n_unique
+    print(
+        f"{total_duplicates} of {total_rows} rows "
+        f"({100 * total_duplicates / total_rows:.2f}%) are duplicates"
+    )
+
+    if dry_run or total_duplicates == 0:
+        if dry_run:
+            print(f"[DRY RUN] Would delete {total_duplicates} entries")
+        cursor.execute("DROP TABLE temp._mngs_keep")
+        return total_rows, total_duplicates
+
+    delete_query = f"""
+        DELETE FROM {table_name}
+        WHERE rowid BETWEEN ? AND ?
+        AND rowid NOT IN (SELECT rid FROM temp._mngs_keep)
+    """
+    total_deleted = 0
+    pbar = tqdm(total=max_rowid - min_rowid + 1, desc="Deleting duplicates")
+    for start in range(min_rowid, max_rowid + 1, chunk_size):
+        stop = min(start + chunk_size - 1, max_rowid)
+        cursor.execute(delete_query, (start, stop))
+        conn.commit()
+        total_deleted += cursor.rowcount
+        pbar.update(stop - start + 1)
+        pbar.set_postfix(deleted=total_deleted)
+    pbar.close()
+
+    cursor.execute("DROP TABLE temp._mngs_keep")
+    conn.commit()
+
+    print(f"Total rows processed: {total_rows}")
+    print(f"Total unique rows: {n_unique}")
+    print(f"Total duplicates removed: {total_deleted}")
+
+    return total_rows, total_deleted
+
+
 def delete_duplicates(
     lpath_db: str,
     table_name: str,
@@ -329,11 +429,49 @@ def delete_duplicates(
     include_blob: bool = False,
     chunk_size: int = 10_000,
     dry_run: bool = True,
+    method: str = "temp_table",
 ) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Delete duplicate entries from an SQLite database table.
+
+    Parameters
+    ----------
+    lpath_db : str
+        Path to the SQLite database file.
+    table_name : str
+        Name of the table to remove duplicates from.
+    columns : Union[str, List[str]], optional
+        Columns to consider when identifying duplicates. Default is "all".
+    include_blob : bool, optional
+        Whether to include BLOB columns when considering duplicates. Default is False.
+    chunk_size : int, optional
+        Number of rows (rowid range, for method="rowid") per chunk. Default is 10_000.
+    dry_run : bool, optional
+        If True, only reports what would be deleted. Default is True.
+    method : str, optional
+        "temp_table" rebuilds the table from SELECT DISTINCT over the columns.
+        "rowid" deletes all but the lowest rowid of each group in place, with
+        the grouping done inside SQLite; BLOBs are compared by digest.
+
+    Returns
+    -------
+    Tuple[Optional[int], Optional[int]]
+        Number of processed rows and number of duplicates.
+    """
+    if method not in ["temp_table", "rowid"]:
+        raise ValueError(f"Unknown method: {method}")
+
+    conn = None
     try:
         conn = sqlite3.connect(lpath_db)
         cursor = conn.cursor()
 
+        if method == "rowid":
+            columns = _determine_columns(cursor, table_name, columns, include_blob)
+            return _delete_duplicates_rowid(
+                conn, table_name, columns, chunk_size=chunk_size, dry_run=dry_run
+            )
+
         # Vacuum the database to free up space
         if not dry_run:
             cursor.execute("VACUUM")
@@ -394,7 +532,8 @@ def delete_duplicates(
         return None, None
 
     finally:
-        conn.close()
+        if conn is not None:
+            conn.close()
 
 
 # EOF
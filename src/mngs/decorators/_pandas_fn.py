@@ -26,6 +26,7 @@ __file__ = "/home/ywatanabe/proj/mngs_repo/src/mngs/decorators/_pandas_fn.py"
 from ._converters import (
     _conversion_warning,
     _return_if,
+    is_cuda,
     is_torch,
     to_numpy,
     to_torch,
@@ -8,9 +8,10 @@ from ._hilbert import hilbert
 from ._misc import ensure_3d
 from ._mne import get_eeg_pos
 from ._modulation_index import modulation_index
-from ._pac import pac
+from ._pac import pac, pac_windowed, pac_windows
 from ._psd import psd
 from ._resample import resample
+from ._stream import stream
 from ._time import time
 from ._transform import to_segments, to_sktime_df
 from ._wavelet import wavelet
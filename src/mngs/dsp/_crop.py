@@ -4,8 +4,17 @@
 # File: ./mngs_repo/src/mngs/dsp/_crop.py
 
 import numpy as np
-
-def crop(sig_2d, window_length, overlap_factor=0.0, axis=-1, time=None):
+from numpy.lib.stride_tricks import sliding_window_view
+
+def crop(
+    sig_2d,
+    window_length,
+    overlap_factor=0.0,
+    axis=-1,
+    time=None,
+    copy=True,
+    generator=False,
+):
     """
     Crops the input signal into overlapping windows of a specified length,
     allowing for an arbitrary axis and considering a time vector.
@@ -16,9 +25,15 @@ def crop(sig_2d, window_length, overlap_factor=0.0, axis=-1, time=None):
     - overlap_factor (float): The fraction of the window that consecutive windows overlap. For example, an overlap_factor of 0.5 means 50% overlap.
     - axis (int): The time axis along which to crop the sig_2d.
         - time (numpy.ndarray): The time vector associated with the signal. Its length should match the signal's length along the cropping axis.
+    - copy (bool): If False, returns read-only strided views of sig_2d (and time)
+      instead of copies, so overlapping windows share memory.
+    - generator (bool): If True, returns a generator yielding the windows (or
+      (window, time) pairs) one by one; windows are read-only views unless
+      copy=True.
 
     Returns:
-    - cropped_windows (numpy.ndarray): The cropped signal windows. The shape depends on the input shape and the specified axis.
+    - cropped_windows (numpy.ndarray): The cropped signal windows of shape
+      (n_windows, *sig_2d.shape), with window_length along axis + 1.
     """
     # Ensure axis is in a valid range
     if axis < 0:
@@ -35,42 +50,63 @@ def crop(sig_2d, window_length, overlap_factor=0.0, axis=-1, time=None):
                 "Length of time vector does not match signal's dimension along the specified axis."
             )
 
-    # Move the target axis to the last position
-    axes = np.arange(sig_2d.ndim)
-    axes[axis], axes[-1] = axes[-1], axes[axis]
-    sig_2d_permuted = np.transpose(sig_2d, axes)
-
     # Compute the number of windows and the step size
-    seq_len = sig_2d_permuted.shape[-1]
+    seq_len = sig_2d.shape[axis]
     step = int(window_length * (1 - overlap_factor))
+    if step < 1:
+        raise ValueError(
+            "overlap_factor is too large; consecutive windows must be at least one sample apart."
+        )
+    window_length = min(window_length, seq_len)
     n_windows = max(
         1, ((seq_len - window_length) // step + 1)
     )  # Ensure at least 1 window
 
-    # Crop the sig_2d into windows
-    cropped_windows = []
-    cropped_times = []
-    for i in range(n_windows):
-        start = i * step
-        end = start + window_length
-        cropped_windows.append(sig_2d_permuted[..., start:end])
-        if time is not None:
-            cropped_times.append(time[start:end])
+    if generator:
+        return _iter_windows(
+            sig_2d, window_length, step, n_windows, axis, time, copy
+        )
 
-    # Convert list of windows back to numpy array
-    cropped_windows = np.array(cropped_windows)
-    cropped_times = np.array(cropped_times)
+    # Strided views: (n_windows, ..., window_length at axis + 1, ...)
+    cropped_windows = sliding_window_view(sig_2d, window_length, axis=axis)
+    index = [slice(None)] * cropped_windows.ndim
+    index[axis] = slice(0, (n_windows - 1) * step + 1, step)
+    cropped_windows = cropped_windows[tuple(index)]
+    cropped_windows = np.moveaxis(cropped_windows, [axis, -1], [0, axis + 1])
 
-    # Move the last axis back to its original position if necessary
-    if axis != sig_2d.ndim - 1:
-        # Compute the inverse permutation
-        inv_axes = np.argsort(axes)
-        cropped_windows = np.transpose(cropped_windows, axes=inv_axes)
+    if copy:
+        cropped_windows = cropped_windows.copy()
 
     if time is None:
         return cropped_windows
-    else:
-        return cropped_windows, cropped_times
+
+    cropped_times = sliding_window_view(np.asarray(time), window_length)
+    cropped_times = cropped_times[: (n_windows - 1) * step + 1 : step]
+    if copy:
+        cropped_times = cropped_times.copy()
+    return cropped_windows, cropped_times
+
+def _iter_windows(sig_2d, window_length, step, n_windows, axis, time, copy):
+    # Views are read-only, as in the array path
+    if time is not None:
+        time = np.asarray(time)
+    index = [slice(None)] * sig_2d.ndim
+    for i in range(n_windows):
+        start = i * step
+        end = start + window_length
+        index[axis] = slice(start, end)
+        window = _window(sig_2d[tuple(index)], copy)
+        if time is None:
+            yield window
+        else:
+            yield window, _window(time[start:end], copy)
+
+def _window(view, copy):
+    if copy:
+        return view.copy()
+    view = view.view()
+    view.setflags(write=False)
+    return view
 
 def main():
     import random
@@ -3,6 +3,8 @@
 # Time-stamp: "2024-11-05 00:24:54 (ywatanabe)"
 # File: ./mngs_repo/src/mngs/dsp/_detect_ripples.py
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 from scipy.signal import find_peaks
@@ -23,14 +25,18 @@ def detect_ripples(
     smoothing_sigma_ms=4,
     min_duration_ms=10,
     return_preprocessed_signal=False,
+    n_jobs=1,
 ):
     """
     xx: 2-dimensional (n_chs, seq_len) or 3-dimensional (batch_size, n_chs, seq_len) wide-band signal.
+    n_jobs: Number of threads detecting events over groups of channels (for long recordings).
     """
+    # Checked here, as ValueErrors below are caught
+    _check_n_jobs(n_jobs)
 
     try:
         xx_r, fs_r = _preprocess(xx, fs, low_hz, high_hz, smoothing_sigma_ms)
-        df = _find_events(xx_r, fs_r, sd, min_duration_ms)
+        df = _find_events(xx_r, fs_r, sd, min_duration_ms, n_jobs=n_jobs)
         df = _drop_ripples_at_edges(df, low_hz, xx_r, fs_r)
         df = _calc_relative_peak_position(df)
         # df = _calc_incidence(df, xx_r, fs_r)
@@ -89,71 +95,96 @@ def _preprocess(xx, fs, low_hz, high_hz, smoothing_sigma_ms=4):
 
     return xx, fs_tgt
 
-def _find_events(xx_r, fs_r, sd, min_duration_ms):
-    def _find_events_1d(xx_ri, fs_r, sd, min_duration_ms):
-        # Finds peaks over the designated standard deviation
-        peaks, properties = find_peaks(xx_ri, height=sd)
-
-        # Determines the range around each peak (customize as needed)
-        peaks_all = []
-        peak_ranges = []
-        peak_amplitudes_sd = []
-
-        for peak in peaks:
-            left_bound = np.where(xx_ri[:peak] < 0)[0]
-            right_bound = np.where(xx_ri[peak:] < 0)[0]
-
-            left_ips = left_bound.max() if left_bound.size > 0 else peak
-            right_ips = (
-                peak + right_bound.min() if right_bound.size > 0 else peak
-            )
+def _find_event_indices(xx, sd):
+    """
+    Finds events on all channels of xx (n_chs, seq_len) at once.
 
-            # Avoid duplicates: Check if the current peak range is already listed
-            if not any(
-                (left_ips == start and right_ips == end)
-                for start, end in peak_ranges
-            ):
-                peaks_all.append(peak)
-                peak_ranges.append((left_ips, right_ips))
-                peak_amplitudes_sd.append(xx_ri[peak])
-
-        # Converts to DataFrame
-        if peak_ranges:
-            starts, ends = zip(*peak_ranges) if peak_ranges else ([], [])
-            df = pd.DataFrame(
-                {
-                    "start_s": np.hstack(starts) / fs_r,
-                    "peak_s": np.hstack(peaks_all) / fs_r,
-                    "end_s": np.hstack(ends) / fs_r,
-                    "peak_amp_sd": np.hstack(peak_amplitudes_sd),
-                }
-            ).round(3)
-        else:
-            df = pd.DataFrame(
-                columns=["start_s", "peak_s", "end_s", "peak_amp_sd"]
-            )
+    Each event spans from the last negative sample before its peak to the
+    first negative sample from the peak on (or the peak itself when there is
+    none). Bounds are looked up for all peaks with one searchsorted over the
+    negative samples of the flattened array; peaks sharing a range are
+    merged, keeping the first one.
 
-        # Duration
-        df["duration_s"] = df.end_s - df.start_s
+    Returns (i_chs, starts, peaks, ends, peak_amps) in samples.
+    """
+    n_chs, seq_len = xx.shape
+
+    # Peaks over the designated standard deviation
+    peaks = [find_peaks(xx_ri, height=sd)[0] for xx_ri in xx]
+    i_chs = np.repeat(np.arange(n_chs), [len(pp) for pp in peaks])
+    peaks = np.concatenate(peaks).astype(np.int64)
+
+    # Negative samples, with sentinels so that every peak has neighbors
+    neg = np.flatnonzero(xx.ravel() < 0)
+    neg = np.concatenate([[-1], neg, [n_chs * seq_len]])
+
+    ch_starts = i_chs * seq_len
+    pos = np.searchsorted(neg, ch_starts + peaks)
+    left = neg[pos - 1] - ch_starts
+    right = neg[pos] - ch_starts
+    starts = np.where(0 <= left, left, peaks)
+    ends = np.where(right < seq_len, right, peaks)
+
+    # Avoid duplicates: one event per (channel, start, end)
+    _, i_first = np.unique(
+        np.stack([i_chs, starts, ends], axis=1), axis=0, return_index=True
+    )
+    i_first.sort()
 
-        # Filters events with short duration
-        df = df[df.duration_s > (min_duration_ms * 1e-3)]
+    i_chs, starts, peaks, ends = (
+        i_chs[i_first],
+        starts[i_first],
+        peaks[i_first],
+        ends[i_first],
+    )
+    return i_chs, starts, peaks, ends, xx[i_chs, peaks]
 
-        return df
+def _check_n_jobs(n_jobs):
+    if not isinstance(n_jobs, (int, np.integer)) or n_jobs < 1:
+        raise ValueError(f"n_jobs must be an integer >= 1. Received: {n_jobs}")
 
+def _find_events(xx_r, fs_r, sd, min_duration_ms, n_jobs=1):
+    _check_n_jobs(n_jobs)
     if xx_r.ndim == 1:
         xx_r = xx_r[np.newaxis, :]
     assert xx_r.ndim == 2
 
-    dfs = []
-    for i_ch in range(len(xx_r)):
-        xx_ri = xx_r[i_ch]
-        df_i = _find_events_1d(xx_ri, fs_r, sd, min_duration_ms)
-        df_i.index = [i_ch for _ in range(len(df_i))]
-        dfs.append(df_i)
-    dfs = pd.concat(dfs)
+    # Groups of channels, detected in parallel when n_jobs > 1
+    bounds = np.linspace(0, len(xx_r), min(n_jobs, len(xx_r)) + 1).astype(int)
+    groups = [(ss, ee) for ss, ee in zip(bounds[:-1], bounds[1:])]
+
+    def _detect(group):
+        ss, ee = group
+        i_chs, *events = _find_event_indices(xx_r[ss:ee], sd)
+        return (i_chs + ss, *events)
+
+    if len(groups) == 1:
+        results = [_detect(groups[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+            results = list(executor.map(_detect, groups))
+
+    i_chs, starts, peaks, ends, peak_amps = [
+        np.concatenate(arrays) for arrays in zip(*results)
+    ]
 
-    return dfs
+    df = pd.DataFrame(
+        {
+            "start_s": starts / fs_r,
+            "peak_s": peaks / fs_r,
+            "end_s": ends / fs_r,
+            "peak_amp_sd": peak_amps,
+        },
+        index=i_chs,
+    ).round(3)
+
+    # Duration
+    df["duration_s"] = df.end_s - df.start_s
+
+    # Filters events with short duration
+    df = df[df.duration_s > (min_duration_ms * 1e-3)]
+
+    return df
 
 def _drop_ripples_at_edges(df, low_hz, xx_r, fs_r):
     edge_s = 1 / low_hz * 3
@@ -20,8 +20,14 @@ from ..decorators import torch_fn
 def hilbert(
     x,
     dim=-1,
+    fast=False,
 ):
-    y = Hilbert(x.shape[-1], dim=dim)(x)
+    """
+    Returns phase and amplitude of the analytic signal of x.
+
+    fast=True uses the non-differentiable rfft path of mngs.nn.Hilbert.
+    """
+    y = Hilbert(x.shape[dim], dim=dim, fast=fast)(x)
     return y[..., 0], y[..., 1]
 
 if __name__ == "__main__":
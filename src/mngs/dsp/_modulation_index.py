@@ -10,12 +10,21 @@ from ..nn._ModulationIndex import ModulationIndex
 
 
 @torch_fn
-def modulation_index(pha, amp, n_bins=18, amp_prob=False):
+def modulation_index(
+    pha, amp, n_bins=18, amp_prob=False, method="onehot", chunk_size=None
+):
     """
     pha: (batch_size, n_chs, n_freqs_pha, n_segments, seq_len)
     amp: (batch_size, n_chs, n_freqs_amp, n_segments, seq_len)
+    method: "onehot" or "scatter" (memory-bounded; see mngs.nn.ModulationIndex)
+    chunk_size: number of time points per chunk for the "scatter" method
     """
-    return ModulationIndex(n_bins=n_bins, amp_prob=amp_prob)(pha, amp)
+    return ModulationIndex(
+        n_bins=n_bins,
+        amp_prob=amp_prob,
+        method=method,
+        chunk_size=chunk_size,
+    )(pha, amp)
 
 def _reshape(x, batch_size=2, n_chs=4):
     return (
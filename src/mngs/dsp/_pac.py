@@ -30,13 +30,17 @@ def pac(
     amp_start_hz=60,
     amp_end_hz=160,
     amp_n_bands=100,
-    device="cuda",
+    device=None,
     batch_size=1,
     batch_size_ch=-1,
     fp16=False,
     trainable=False,
     n_perm=None,
     amp_prob=False,
+    mi_method="onehot",
+    mi_chunk_size=None,
+    surrogate_mem_gb=None,
+    hilbert_fast=False,
 ):
     """
     Compute the phase-amplitude coupling (PAC) for signals. This function automatically handles inputs as
@@ -51,6 +55,14 @@ def pac(
     - amp_start_hz (float, optional): Start frequency for amplitude bands. Default is 60 Hz.
     - amp_end_hz (float, optional): End frequency for amplitude bands. Default is 160 Hz.
     - amp_n_bands (int, optional): Number of amplitude bands. Default is 100.
+    - device (str, optional): Device for computation. Default is None ("cuda" if available, otherwise "cpu").
+    - mi_method (str, optional): Modulation Index engine, "onehot" or "scatter". "scatter" keeps
+      peak memory independent of seq_len and is recommended on CPU. Default is "onehot".
+    - mi_chunk_size (int, optional): Time chunk size for the "scatter" engine. Default is None (no chunking).
+    - surrogate_mem_gb (float, optional): Memory budget per block of surrogates when n_perm is given.
+      Default is None (half of the free memory on the device).
+    - hilbert_fast (bool, optional): Uses the rfft-based, non-differentiable Hilbert transform
+      (ignored when trainable is True). Default is False.
 
     Returns:
     - torch.Tensor: PAC values. Shape: (batch_size, n_chs, pha_n_bands, amp_n_bands)
@@ -66,20 +78,8 @@ def pac(
         pac, pha_mids_hz, amp_mids_hz = mngs.dsp.pac(xx, fs)
     """
 
-    def process_ch_batching(m, x, batch_size_ch, device):
-        n_chs = x.shape[1]
-        n_batches = (n_chs + batch_size_ch - 1) // batch_size_ch
-
-        agg = []
-        for ii in range(n_batches):
-            start, end = batch_size_ch * ii, min(
-                batch_size_ch * (ii + 1), n_chs
-            )
-            _pac = m(x[:, start:end, :].to(device)).detach().cpu()
-            agg.append(_pac)
-
-        # return np.concatenate(agg, axis=1)
-        return torch.cat(agg, dim=1)
+    if device is None:
+        device = "cuda" if torch.cuda.is_available() else "cpu"
 
     m = PAC(
         x.shape[-1],
@@ -94,18 +94,184 @@ def pac(
         trainable=trainable,
         n_perm=n_perm,
         amp_prob=amp_prob,
+        mi_method=mi_method,
+        mi_chunk_size=mi_chunk_size,
+        surrogate_mem_gb=surrogate_mem_gb,
+        hilbert_fast=hilbert_fast,
     ).to(device)
 
     if batch_size_ch == -1:
         return m(x.to(device)), m.PHA_MIDS_HZ, m.AMP_MIDS_HZ
     else:
         return (
-            process_ch_batching(m, x, batch_size_ch, device),
+            _process_ch_batching(m, x, batch_size_ch, device),
             m.PHA_MIDS_HZ,
             m.AMP_MIDS_HZ,
         )
 
 
+def _process_ch_batching(m, x, batch_size_ch, device):
+    n_chs = x.shape[1]
+    n_batches = (n_chs + batch_size_ch - 1) // batch_size_ch
+
+    agg = []
+    for ii in range(n_batches):
+        start, end = batch_size_ch * ii, min(batch_size_ch * (ii + 1), n_chs)
+        _pac = m(x[:, start:end].to(device)).detach().cpu()
+        agg.append(_pac)
+
+    return torch.cat(agg, dim=1)
+
+
+def _calc_window_starts(seq_len, window_len, step):
+    if seq_len < window_len:
+        raise ValueError(
+            f"The recording ({seq_len} samples) is shorter than the window ({window_len} samples)."
+        )
+    starts = list(range(0, seq_len - window_len + 1, step))
+    # The last window is aligned to the end so that the whole recording is covered
+    if starts[-1] + window_len < seq_len:
+        starts.append(seq_len - window_len)
+    return starts
+
+
+def _iter_pac_windows(m, x, window_len, step, device, batch_size_ch):
+    for start in _calc_window_starts(x.shape[-1], window_len, step):
+        end = start + window_len
+        _x = x[..., start:end]
+        if not torch.is_tensor(_x):
+            _x = torch.as_tensor(np.ascontiguousarray(_x))
+        _x = _x.float()
+
+        with torch.no_grad():
+            if batch_size_ch == -1:
+                _pac = m(_x.to(device)).detach().cpu()
+            else:
+                _pac = _process_ch_batching(m, _x, batch_size_ch, device)
+
+        yield start, end, _pac
+
+
+def _init_windowed_pac(fs, window_sec, step_sec, device, **pac_kwargs):
+    if device is None:
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+
+    window_len = int(round(window_sec * fs))
+    if step_sec is None:
+        # PAC discards 1/8 of a window on each side as filter edges,
+        # so stepping by the remaining core stitches the windows seamlessly
+        step = window_len - 2 * (window_len // 8)
+    else:
+        step = int(round(step_sec * fs))
+    if step <= 0:
+        raise ValueError(f"step should be positive. Received: {step} samples")
+
+    m = PAC(window_len, fs, **pac_kwargs).to(device)
+    m.eval()
+    return m, window_len, step, device
+
+
+def pac_windows(
+    x,
+    fs,
+    window_sec,
+    step_sec=None,
+    device=None,
+    batch_size_ch=-1,
+    **pac_kwargs,
+):
+    """
+    Computes PAC over fixed-length time windows of a long recording, lazily.
+
+    One PAC module of length window_sec is built and reused across windows, and
+    only one window is converted to a tensor at a time. Memory therefore does not
+    depend on the recording length, and x may be a numpy memmap.
+
+    Arguments:
+    - x (np.ndarray | torch.Tensor): (batch_size, n_chs, seq_len) or
+      (batch_size, n_chs, n_segments, seq_len)
+    - fs (float): Sampling frequency.
+    - window_sec (float): Window length in seconds, including the edge margins
+      (1/8 of the window on each side) that PAC removes after filtering.
+    - step_sec (float, optional): Step between windows in seconds. Default is the
+      window length minus the edge margins, so that the analyzed parts abut.
+    - batch_size_ch (int, optional): Number of channels per batch within a window.
+    - **pac_kwargs: Keyword arguments for mngs.nn.PAC (e.g., pha_n_bands, n_perm).
+
+    Yields:
+    - tuple: (start, end, pac), where start and end are sample indices of the
+      window and pac is a CPU tensor of shape (batch_size, n_chs, pha_n_bands, amp_n_bands).
+
+    Example:
+        xx = np.load("long_recording.npy", mmap_mode="r")
+        for start, end, pac in mngs.dsp.pac_windows(xx, fs, window_sec=10):
+            ...
+    """
+    m, window_len, step, device = _init_windowed_pac(
+        fs, window_sec, step_sec, device, **pac_kwargs
+    )
+    yield from _iter_pac_windows(m, x, window_len, step, device, batch_size_ch)
+
+
+def pac_windowed(
+    x,
+    fs,
+    window_sec,
+    step_sec=None,
+    aggregate="mean",
+    device=None,
+    batch_size_ch=-1,
+    **pac_kwargs,
+):
+    """
+    Computes PAC over fixed-length time windows and aggregates the results.
+
+    See pac_windows for the arguments. With aggregate="mean", a running mean is
+    kept so that memory is constant regardless of the recording length. With
+    aggregate="stack", per-window PAC values are stacked along a new window axis
+    at dim 2.
+
+    Returns:
+    - PAC values: (batch_size, n_chs, pha_n_bands, amp_n_bands) for "mean", or
+      (batch_size, n_chs, n_windows, pha_n_bands, amp_n_bands) for "stack"
+    - Phase band centers
+    - Amplitude band centers
+    - Window start indices (np.ndarray)
+    """
+    if aggregate not in ("mean", "stack"):
+        raise ValueError(
+            f"aggregate should be 'mean' or 'stack'. Received: {aggregate}"
+        )
+
+    m, window_len, step, device = _init_windowed_pac(
+        fs, window_sec, step_sec, device, **pac_kwargs
+    )
+
+    starts, pac_sum, pacs = [], None, []
+    for start, _, _pac in _iter_pac_windows(
+        m, x, window_len, step, device, batch_size_ch
+    ):
+        starts.append(start)
+        if aggregate == "mean":
+            _pac = _pac.double()
+            pac_sum = _pac if pac_sum is None else pac_sum + _pac
+        else:
+            pacs.append(_pac)
+
+    if aggregate == "mean":
+        out = (pac_sum / len(starts)).float()
+    else:
+        out = torch.stack(pacs, dim=2)
+
+    pha_mids, amp_mids = m.PHA_MIDS_HZ, m.AMP_MIDS_HZ
+    if not torch.is_tensor(x):
+        out = out.numpy()
+        pha_mids = np.asarray(pha_mids.detach().cpu())
+        amp_mids = np.asarray(amp_mids.detach().cpu())
+
+    return out, pha_mids, amp_mids, np.array(starts)
+
+
 if __name__ == "__main__":
     import matplotlib.pyplot as plt
     import mngs
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-17 18:32:10 (ywatanabe)"
+# File: ./mngs_repo/src/mngs/dsp/_stream.py
+
+"""
+Functionality:
+    - Applies a chain of mngs.dsp operators to recordings that do not fit in
+      memory, block by block along time
+    - Reads blocks with context samples on both sides so that FIR edge
+      effects fall outside the kept part of each block
+    - Writes results to a preallocated, chunked .npy (memmap) or .hdf5 file
+Input:
+    - Memory-mapped .npy, .hdf5 or MNE raw file opened via mngs.io.load,
+      or an array-like / mne.io.Raw object
+Output:
+    - Path to the written file (or the array when spath is None)
+Prerequisites:
+    - numpy, h5py, mngs.io.load
+
+Example:
+    FS = 1000
+    mngs.dsp.stream(
+        "recording.npy",  # (n_chs, seq_len), possibly days long
+        [
+            lambda x: mngs.dsp.filt.bandpass(x, FS, np.array([[80, 140]])),
+            lambda x: mngs.dsp.hilbert(x)[1],  # amplitude
+        ],
+        "ripple_amp.hdf5",
+        block_len=60 * FS,
+        n_jobs=2,
+    )
+"""
+
+import math
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+
+import h5py
+import numpy as np
+import torch
+from tqdm import tqdm
+
+from ..io._load import load
+
+
+def _open_source(src, key=None):
+    """Returns (read_fn(start, stop), seq_len, fs, close_fn) for src."""
+    close = lambda: None
+    if isinstance(src, str):
+        src = load(src, lazy=True)
+        if isinstance(src, h5py.File):
+            close = src.close
+            if key is None:
+                if len(src) != 1:
+                    close()
+                    raise ValueError(
+                        f"key is required for HDF5 files with several datasets: {list(src)}"
+                    )
+                key = list(src)[0]
+            src = src[key]
+
+    # mne.io.Raw (not preloaded when opened via mngs.io.load(lazy=True))
+    if hasattr(src, "get_data") and hasattr(src, "info"):
+        return (
+            lambda start, stop: src.get_data(start=start, stop=stop),
+            src.n_times,
+            src.info["sfreq"],
+            close,
+        )
+
+    if isinstance(src, torch.Tensor):
+        src = src.detach().cpu().numpy()
+    return (lambda start, stop: src[..., start:stop]), src.shape[-1], None, close
+
+
+def _to_numpy(x):
+    if isinstance(x, torch.Tensor):
+        return x.detach().cpu().numpy()
+    return np.asarray(x)
+
+
+class _BlockWriter:
+    """Preallocated .npy memmap or chunked .hdf5 dataset, created from the first block."""
+
+    def __init__(self, spath, key="x", compression=None):
+        self.spath = spath
+        self.key = key
+        self.compression = compression
+        self.out = None
+        self.file = None
+        self.blocks = []
+
+    def create(self, shape, dtype, chunk_len):
+        if self.spath is None:
+            return
+        os.makedirs(os.path.dirname(self.spath) or ".", exist_ok=True)
+        if self.spath.endswith(".npy"):
+            self.out = np.lib.format.open_memmap(
+                self.spath, mode="w+", dtype=dtype, shape=shape
+            )
+        elif self.spath.endswith(".hdf5"):
+            self.file = h5py.File(self.spath, "w")
+            chunks = shape[:-1] + (max(1, min(chunk_len, shape[-1])),)
+            self.out = self.file.create_dataset(
+                self.key,
+                shape=shape,
+                dtype=dtype,
+                chunks=chunks,
+                compression=self.compression,
+            )
+        else:
+            raise ValueError("spath must be a .npy or .hdf5 file (or None)")
+
+    def write(self, index, block):
+        if self.spath is None:
+            self.blocks.append(block)
+        else:
+            self.out[index] = block
+
+    def close(self):
+        if isinstance(self.out, np.memmap):
+            self.out.flush()
+        if self.file is not None:
+            self.file.close()
+        self.out = self.file = None
+
+
+def stream(
+    src,
+    ops,
+    spath=None,
+    block_len=None,
+    overlap=None,
+    out_ratio=1,
+    reduce=None,
+    key=None,
+    out_key="x",
+    dtype=np.float32,
+    compression=None,
+    n_jobs=1,
+    verbose=True,
+):
+    """
+    Applies ops to a long recording block by block and writes the results to disk.
+
+    Parameters:
+    - src (str, array-like or mne.io.Raw): Signal of shape (..., seq_len). Paths
+      are opened with mngs.io.load(lazy=True): .npy as a memmap, .hdf5 as an
+      h5py dataset (see key) and EEG files without preloading.
+    - ops (callable or list of callables): Applied in order to each block (a
+      NumPy array of shape (..., n_samples)), e.g.
+      lambda x: mngs.dsp.filt.bandpass(x, fs, bands). Each must return an
+      array whose last axis is time.
+    - spath (str, optional): Output .npy or .hdf5 file. If None, the result is
+      returned in memory instead (for testing on small data).
+    - block_len (int): Samples per block (input rate); defaults to 2**20.
+    - overlap (int, optional): Context samples read on both sides of each
+      block and discarded after ops. It must cover half the longest FIR
+      kernel in ops. mngs.dsp.filt designs kernels up to a third of the input
+      length, hence the default block_len // 4.
+    - out_ratio (float or Fraction): Output / input sampling rate of the
+      chained ops, e.g. fs_out / fs for mngs.dsp.resample or Fraction(1, 3)
+      for scipy.signal.resample_poly(x, 1, 3). Output sample m stands for
+      input time m / out_ratio, so the output has ceil(seq_len * out_ratio)
+      samples, as when ops are applied to the whole signal. A ValueError is
+      raised when a block's output length does not match it.
+    - reduce (callable, optional): Applied to each trimmed block (e.g., PSD or
+      PAC); outputs are stacked along a new first axis of blocks instead of
+      concatenated along time. Only the seq_len // block_len full blocks are
+      reduced, so that every block has the same length; the trailing partial
+      block is dropped. block_len * out_ratio must then be an integer.
+    - key (str, optional): Dataset name when src is an HDF5 file with several datasets.
+    - out_key (str): Dataset name in the .hdf5 output.
+    - dtype: Output dtype.
+    - compression (str, optional): HDF5 compression filter (e.g., "gzip").
+    - n_jobs (int): Number of blocks processed in parallel (threads). Memory
+      use is about 2 * n_jobs blocks, whatever the recording length.
+    - verbose (bool): Shows a progress bar.
+
+    Returns:
+    - str or np.ndarray: spath, or the result when spath is None.
+    """
+    ops = list(ops) if isinstance(ops, (list, tuple)) else [ops]
+    ratio = Fraction(out_ratio).limit_denominator(2**16)
+    if ratio <= 0:
+        raise ValueError(f"out_ratio must be positive: {out_ratio}")
+    block_len = int(block_len or 2**20)
+    overlap = block_len // 4 if overlap is None else int(overlap)
+    if reduce is not None and (block_len * ratio).denominator != 1:
+        raise ValueError(
+            f"block_len * out_ratio must be an integer with reduce: {block_len} * {ratio}"
+        )
+
+    read, seq_len, _, close_src = _open_source(src, key=key)
+    if reduce is None:
+        n_blocks = (seq_len + block_len - 1) // block_len
+    else:
+        n_blocks = seq_len // block_len
+        if n_blocks == 0:
+            close_src()
+            raise ValueError(
+                f"reduce needs at least one full block: seq_len={seq_len} < block_len={block_len}"
+            )
+    n_out_total = math.ceil(seq_len * ratio)
+
+    def _process(i_block):
+        start = i_block * block_len
+        end = min(start + block_len, seq_len)
+        # Context starts on a multiple of the ratio's denominator so that it
+        # maps onto an exact output sample
+        ctx_start = max(0, start - overlap)
+        ctx_start -= ctx_start % ratio.denominator
+        ctx_end = min(seq_len, end + overlap)
+
+        x = np.asarray(read(ctx_start, ctx_end))
+        y = x
+        for op in ops:
+            y = op(y)
+        y = _to_numpy(y)
+
+        # Keeps the output samples of [start, end), i.e. m with start <= m / ratio < end
+        i_left = math.ceil(start * ratio) - int(ctx_start * ratio)
+        n_out = math.ceil(end * ratio) - math.ceil(start * ratio)
+        y = y[..., i_left : i_left + n_out]
+        if y.shape[-1] != n_out:
+            raise ValueError(
+                f"ops returned too few samples for out_ratio={ratio}: "
+                f"expected {n_out} output samples for input [{start}, {end}), "
+                f"got {y.shape[-1]}"
+            )
+
+        if reduce is not None:
+            y = _to_numpy(reduce(y))
+        return y.astype(dtype, copy=False)
+
+    writer = _BlockWriter(spath, key=out_key, compression=compression)
+    executor = ThreadPoolExecutor(max_workers=n_jobs) if 1 < n_jobs else None
+    pending = deque()
+    i_next = 0
+    i_out = 0
+
+    try:
+        for i_block in tqdm(range(n_blocks), disable=not verbose, desc="stream"):
+            # Keeps up to n_jobs blocks in flight ahead of the writer
+            while i_next < n_blocks and len(pending) < max(1, n_jobs):
+                if executor is None:
+                    pending.append(_process(i_next))
+                else:
+                    pending.append(executor.submit(_process, i_next))
+                i_next += 1
+            result = pending.popleft()
+            y = result if executor is None else result.result()
+
+            if i_block == 0:
+                if reduce is None:
+                    shape = y.shape[:-1] + (n_out_total,)
+                else:
+                    shape = (n_blocks,) + y.shape
+                writer.create(shape, dtype, chunk_len=max(1, y.shape[-1]))
+                block_shape = y.shape[:-1] if reduce is None else y.shape
+
+            if (y.shape[:-1] if reduce is None else y.shape) != block_shape:
+                raise ValueError(
+                    f"Block {i_block} has shape {y.shape}, inconsistent with block 0"
+                )
+
+            if reduce is None:
+                writer.write((Ellipsis, slice(i_out, i_out + y.shape[-1])), y)
+                i_out += y.shape[-1]
+            else:
+                writer.write(i_block, y)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        writer.close()
+        close_src()
+
+    if spath is not None:
+        return spath
+    if reduce is None:
+        return np.concatenate(writer.blocks, axis=-1)
+    return np.stack(writer.blocks)
+
+
+# EOF
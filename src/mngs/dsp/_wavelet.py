@@ -20,9 +20,15 @@ def wavelet(
     out_scale="linear",
     device="cuda",
     batch_size=32,
+    max_memory_mb=1024,
 ):
     m = (
-        Wavelet(fs, freq_scale=freq_scale, out_scale="linear")
+        Wavelet(
+            fs,
+            freq_scale=freq_scale,
+            out_scale="linear",
+            max_memory_mb=max_memory_mb,
+        )
         .to(device)
         .eval()
     )
@@ -8,5 +8,10 @@ from ._differential_bandpass_filters import (
     init_bandpass_filters,
 )
 from ._ensure_even_len import ensure_even_len
+from ._filter_kernel_cache import (
+    FilterKernelCache,
+    cache_filter_kernels,
+    filter_kernel_cache,
+)
 from ._zero_pad import zero_pad
 from .filter import design_filter, plot_filter_responses
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-17 11:02:48 (ywatanabe)"
+# File: ./mngs_repo/src/mngs/dsp/utils/_filter_kernel_cache.py
+
+"""
+Functionality:
+    - Process-wide LRU cache of designed FIR filter kernels
+    - Optional persistence of kernels to disk
+Input:
+    - Filter design parameters such as (filter type, seq_len, fs, bands)
+Output:
+    - Prebuilt kernel tensors
+Prerequisites:
+    - PyTorch package
+
+Example:
+    from mngs.dsp.utils import filter_kernel_cache
+    filter_kernel_cache.configure(max_size_mb=512, persist_dir="~/.cache/mngs/cache/filter_kernels/")
+    filter_kernel_cache.info()
+"""
+
+import functools
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import torch
+
+
+class FilterKernelCache:
+    """
+    LRU cache of filter kernel tensors with a size cap in bytes.
+
+    Kernels are kept in memory and, when persist_dir is set, also saved as
+    .pt files so that other processes can reuse them. Cached tensors are
+    returned as clones so that callers may modify them freely.
+    """
+
+    def __init__(self, max_size_mb=256, persist_dir=None, enabled=True):
+        self._lock = threading.Lock()
+        self._kernels = OrderedDict()
+        self._n_bytes = 0
+        self.n_hits = 0
+        self.n_misses = 0
+        self.persist_dir = None
+        self.configure(
+            max_size_mb=max_size_mb, persist_dir=persist_dir, enabled=enabled
+        )
+
+    def configure(self, max_size_mb=None, persist_dir=None, enabled=None):
+        """
+        Updates settings; arguments left as None are unchanged.
+
+        persist_dir="" disables persistence to disk.
+        """
+        with self._lock:
+            if max_size_mb is not None:
+                self.max_bytes = int(max_size_mb * 1024**2)
+            if persist_dir is not None:
+                self.persist_dir = (
+                    os.path.expanduser(persist_dir) if persist_dir else None
+                )
+            if enabled is not None:
+                self.enabled = enabled
+            self._evict()
+
+    def get_or_build(self, key, build_fn):
+        """Returns the cached kernels for key, building them with build_fn on a miss."""
+        if not self.enabled:
+            return build_fn()
+
+        with self._lock:
+            if key in self._kernels:
+                self._kernels.move_to_end(key)
+                self.n_hits += 1
+                return self._kernels[key].clone()
+
+        kernels = self._load_from_disk(key)
+        if kernels is None:
+            self.n_misses += 1
+            kernels = build_fn()
+            self._save_to_disk(key, kernels)
+        else:
+            self.n_hits += 1
+
+        self._add(key, kernels)
+        return kernels.clone()
+
+    def clear(self, disk=False):
+        with self._lock:
+            self._kernels.clear()
+            self._n_bytes = 0
+            self.n_hits = 0
+            self.n_misses = 0
+        if disk and self.persist_dir and os.path.isdir(self.persist_dir):
+            for fname in os.listdir(self.persist_dir):
+                if fname.endswith(".pt"):
+                    os.remove(os.path.join(self.persist_dir, fname))
+
+    def info(self):
+        return dict(
+            n_kernels=len(self._kernels),
+            size_mb=self._n_bytes / 1024**2,
+            max_size_mb=self.max_bytes / 1024**2,
+            n_hits=self.n_hits,
+            n_misses=self.n_misses,
+            persist_dir=self.persist_dir,
+        )
+
+    def _add(self, key, kernels):
+        kernels = kernels.detach().cpu()
+        n_bytes = kernels.element_size() * kernels.nelement()
+        if n_bytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._kernels:
+                return
+            self._kernels[key] = kernels
+            self._n_bytes += n_bytes
+            self._evict()
+
+    def _evict(self):
+        while self._kernels and self.max_bytes < self._n_bytes:
+            _, kernels = self._kernels.popitem(last=False)
+            self._n_bytes -= kernels.element_size() * kernels.nelement()
+
+    def _path(self, key):
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return os.path.join(self.persist_dir, f"{digest}.pt")
+
+    def _load_from_disk(self, key):
+        if not self.persist_dir:
+            return None
+        path = self._path(key)
+        try:
+            kernels = torch.load(path, weights_only=True)
+            if not isinstance(kernels, torch.Tensor):
+                raise TypeError(f"Not a tensor: {type(kernels)}")
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Corrupt or truncated file (torch.load raises UnpicklingError,
+            # RuntimeError, EOFError, OSError, ... depending on the damage);
+            # deleting it lets the caller rebuild and save a fresh copy
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            return None
+        os.utime(path)
+        return kernels
+
+    def _save_to_disk(self, key, kernels):
+        if not self.persist_dir:
+            return
+        os.makedirs(self.persist_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        torch.save(kernels.detach().cpu(), tmp_path)
+        os.replace(tmp_path, path)
+        self._evict_disk()
+
+    def _evict_disk(self):
+        entries = []
+        for fname in os.listdir(self.persist_dir):
+            if fname.endswith(".pt"):
+                stat = os.stat(os.path.join(self.persist_dir, fname))
+                entries.append((stat.st_mtime, stat.st_size, fname))
+        total = sum(size for _, size, _ in entries)
+        for _, size, fname in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.persist_dir, fname))
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+def _to_key(x):
+    if isinstance(x, (torch.Tensor, np.ndarray)):
+        x = np.asarray(x.detach().cpu() if torch.is_tensor(x) else x)
+        return (x.shape, tuple(np.round(x.astype(float).ravel(), 6)))
+    if isinstance(x, (list, tuple)):
+        return tuple(_to_key(xx) for xx in x)
+    if isinstance(x, (float, np.floating)):
+        return round(float(x), 6)
+    if isinstance(x, np.integer):
+        return int(x)
+    return x
+
+
+filter_kernel_cache = FilterKernelCache()
+
+
+def cache_filter_kernels(filter_type):
+    """
+    Decorator caching kernels returned by a kernel design function in filter_kernel_cache.
+
+    The cache key is built from filter_type and all arguments (e.g., seq_len, fs and bands).
+
+    Usage:
+        @staticmethod
+        @cache_filter_kernels("bandpass")
+        def init_kernels(seq_len, fs, bands):
+            ...
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (
+                filter_type,
+                _to_key(args),
+                tuple(sorted((kk, _to_key(vv)) for kk, vv in kwargs.items())),
+            )
+            return filter_kernel_cache.get_or_build(
+                key, lambda: func(*args, **kwargs)
+            )
+
+        return wrapper
+
+    return decorator
+
+
+# EOF
@@ -13,6 +13,7 @@ from datetime import datetime
 from glob import glob as _glob
 
 from ..io import flush as mngs_io_flush
+from ..io import flush_async_saves as mngs_io_flush_async_saves
 from ..io import save as mngs_io_save
 from ..str._printc import printc
 from ..utils._notify import notify as mngs_utils_notify
@@ -79,8 +80,18 @@ def _args_to_str(args_dict):
     else:
         return ""
 
+def _flush_async_saves():
+    # Pending mngs.io.save_async writes must land before SDIR is moved
+    try:
+        for path, error in mngs_io_flush_async_saves(raise_errors=False):
+            printc(f"Background save failed: {path}\n{error!r}", c="red")
+    except Exception as e:
+        print(e)
+
+
 def close(CONFIG, message=":)", notify=False, verbose=True, exit_status=None):
     try:
+        _flush_async_saves()
         CONFIG.EXIT_STATUS = exit_status
         CONFIG = CONFIG.to_dict()
         CONFIG = _process_timestamp(CONFIG, verbose=verbose)
@@ -36,10 +36,13 @@ from ._json2md import *
 from ._load_configs import *
 from ._load_modules import *
 from ._load import *
+from ._load_many import *
 from ._mv_to_tmp import *
 from ._path import *
 from ._reload import *
 from ._save import *
+from ._save_async import *
+from ._save_hdf5 import *
 from ._save_image import *
 from ._save_listed_dfs_as_csv import *
 from ._save_listed_scalars_as_csv import *
@@ -7,7 +7,7 @@ __file__ = "/home/ywatanabe/proj/mngs_repo/src/mngs/io/_load.py"
 
 import os
 
-from typing import Any
+from typing import Any, Optional
 from ..decorators import preserve_doc
 from ..str._clean_path import clean_path
 # from ._load_modules._catboost import _load_catboost
@@ -30,8 +30,33 @@ from ._load_modules._xml import _load_xml
 from ._load_modules._yaml import _load_yaml
 
 
+LAZY_LOAD_THRESHOLD_MB = 1024
+LAZY_LOAD_EXTENSIONS = [
+    "npy",
+    "npz",
+    "hdf5",
+    # EEG data (lazy: preload=False)
+    "vhdr",
+    "vmrk",
+    "edf",
+    "bdf",
+    "gdf",
+    "cnt",
+    "egi",
+    "eeg",
+    "set",
+]
+# Extensions loaded lazily by default above LAZY_LOAD_THRESHOLD_MB: only those
+# whose lazy object is a drop-in replacement (np.memmap is an ndarray)
+LAZY_LOAD_BY_SIZE_EXTENSIONS = ["npy"]
+
+
 def load(
-    lpath: str, show: bool = False, verbose: bool = False, **kwargs
+    lpath: str,
+    show: bool = False,
+    verbose: bool = False,
+    lazy: Optional[bool] = None,
+    **kwargs,
 ) -> Any:
     """
     Load data from various file formats.
@@ -46,6 +71,14 @@ def load(
         If True, display additional information during loading. Default is False.
     verbose : bool, optional
         If True, print verbose output during loading. Default is False.
+    lazy : bool, optional
+        For .npy, .npz and .hdf5 files, returns a memory-mapped array, a lazy
+        NpzFile or a read-only h5py.File (datasets are sliced on access)
+        instead of loading everything; EEG files are opened without
+        preloading. None (default) memory-maps .npy files larger than
+        LAZY_LOAD_THRESHOLD_MB and loads everything else eagerly; since the
+        other lazy objects are not drop-in replacements, they are returned
+        only with an explicit lazy=True.
     **kwargs : dict
         Additional keyword arguments to be passed to the specific loading function.
 
@@ -76,6 +109,7 @@ def load(
     >>> data = load('data.csv')
     >>> image = load('image.png')
     >>> model = load('model.pth')
+    >>> signal = load('recording.npy', lazy=True)[:, :4]
     """
     lpath = clean_path(lpath)
 
@@ -139,6 +173,14 @@ def load(
     ext = lpath.split(".")[-1] if "." in lpath else ""
     loader = preserve_doc(loaders_dict.get(ext, _load_txt))
 
+    if ext in LAZY_LOAD_EXTENSIONS:
+        if lazy is None:
+            lazy = (
+                ext in LAZY_LOAD_BY_SIZE_EXTENSIONS
+                and os.path.getsize(lpath) > LAZY_LOAD_THRESHOLD_MB * 1024**2
+            )
+        kwargs["lazy"] = lazy
+
     try:
         return loader(lpath, **kwargs)
     except (ValueError, FileNotFoundError) as e:
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-17 16:48:12 (ywatanabe)"
+# File: ./mngs_repo/src/mngs/io/_load_many.py
+
+__file__ = "./src/mngs/io/_load_many.py"
+
+"""
+1. Functionality:
+   - Loads many files concurrently with mngs.io.load
+   - Accepts a list of paths or an mngs.io.glob pattern with {} parse fields
+   - Preserves order and bounds the bytes being loaded/held at once
+2. Input:
+   - List of paths or glob pattern
+3. Output:
+   - Loaded objects, optionally paired with parsed fields
+4. Prerequisites:
+   - mngs.io.load, mngs.io.glob
+
+Example:
+    for df, fields in mngs.io.load_many("data/sub_{sub}/ses_{ses}.csv"):
+        print(fields["sub"], fields["ses"], df.shape)
+"""
+
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Iterator, List, Optional, Sequence, Union
+
+from tqdm import tqdm
+
+from ._glob import glob
+from ._load import load
+
+_PARSE_FIELD = re.compile(r"{[^}]*}")
+
+
+def _resolve_paths(paths_or_pattern, parse):
+    if isinstance(paths_or_pattern, str):
+        if parse is None:
+            parse = bool(_PARSE_FIELD.search(paths_or_pattern))
+        if parse:
+            return glob(paths_or_pattern, parse=True)
+        return glob(paths_or_pattern), None
+    if parse:
+        raise ValueError("parse=True requires a glob pattern, not a list of paths")
+    return list(paths_or_pattern), None
+
+
+def _file_size(path):
+    try:
+        return os.path.getsize(os.path.expanduser(path))
+    except OSError:
+        return 0
+
+
+def iter_load_many(
+    paths_or_pattern: Union[str, Sequence[str]],
+    n_jobs: int = 4,
+    backend: str = "thread",
+    max_memory_mb: float = 1024,
+    parse: Optional[bool] = None,
+    verbose: bool = False,
+    **kwargs,
+) -> Iterator[Any]:
+    """
+    Generator version of load_many; yields objects (or (obj, parsed) pairs)
+    in order as soon as they are loaded.
+
+    Only files fitting in max_memory_mb (by on-disk size) are loading or
+    waiting to be consumed at any time, so iterating over a large dataset
+    keeps memory bounded. See load_many for the parameters.
+    """
+    if backend not in ("thread", "process"):
+        raise ValueError('backend must be "thread" or "process"')
+
+    paths, parsed = _resolve_paths(paths_or_pattern, parse)
+    sizes = [_file_size(path) for path in paths]
+    max_bytes = max_memory_mb * 1024**2
+
+    Executor = ThreadPoolExecutor if backend == "thread" else ProcessPoolExecutor
+    executor = Executor(max_workers=max(1, min(n_jobs, len(paths))))
+    pending = deque()
+    pending_bytes = 0
+    i_next = 0
+    pbar = tqdm(total=len(paths), disable=not verbose, desc="load_many")
+
+    try:
+        while i_next < len(paths) or pending:
+            # A file larger than the budget is loaded alone
+            while i_next < len(paths) and (
+                not pending or pending_bytes + sizes[i_next] <= max_bytes
+            ):
+                future = executor.submit(load, paths[i_next], **kwargs)
+                pending.append((i_next, future))
+                pending_bytes += sizes[i_next]
+                i_next += 1
+
+            ii, future = pending.popleft()
+            obj = future.result()
+            pending_bytes -= sizes[ii]
+            pbar.update(1)
+            yield obj if parsed is None else (obj, parsed[ii])
+    finally:
+        pbar.close()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def load_many(
+    paths_or_pattern: Union[str, Sequence[str]],
+    n_jobs: int = 4,
+    backend: str = "thread",
+    max_memory_mb: float = 1024,
+    parse: Optional[bool] = None,
+    verbose: bool = False,
+    **kwargs,
+) -> List[Any]:
+    """
+    Loads many files concurrently, keeping their order.
+
+    Parameters
+    ----------
+    paths_or_pattern : str or list of str
+        Paths, or an mngs.io.glob pattern such as "data/sub_{sub}/run_{run}.npy".
+    n_jobs : int
+        Number of concurrent loads.
+    backend : str
+        "thread" (default) suits I/O-bound loads such as slow network file
+        systems; "process" also parallelizes CPU-bound parsing (e.g., large
+        CSVs) at the cost of pickling results back to the main process.
+    max_memory_mb : float
+        Upper bound on the on-disk size of files being loaded at once. Note
+        that parsed objects may be larger than their files (e.g., CSVs).
+    parse : bool, optional
+        Pairs each object with the fields parsed from its path. None (default)
+        enables it when the pattern has {} fields.
+    verbose : bool
+        Shows a progress bar.
+    **kwargs : dict
+        Passed to mngs.io.load.
+
+    Returns
+    -------
+    list
+        Objects in path order, or (obj, parsed) pairs when parse is enabled.
+
+    Examples
+    --------
+    >>> dfs = mngs.io.load_many(["a.csv", "b.csv"], backend="process")
+    >>> pairs = mngs.io.load_many("data/sub_{sub}/run_{run}.npy")
+    >>> arr, fields = pairs[0]  # fields == {"sub": "01", "run": "1"}
+    """
+    return list(
+        iter_load_many(
+            paths_or_pattern,
+            n_jobs=n_jobs,
+            backend=backend,
+            max_memory_mb=max_memory_mb,
+            parse=parse,
+            verbose=verbose,
+            **kwargs,
+        )
+    )
+
+
+# EOF
@@ -10,7 +10,7 @@ from typing import Any
 import mne
 
 
-def _load_eeg_data(path: str, **kwargs) -> Any:
+def _load_eeg_data(lpath: str, lazy: bool = False, **kwargs) -> Any:
     """
     Load EEG data based on file extension and associated files using MNE-Python.
 
@@ -21,6 +21,9 @@ def _load_eeg_data(path: str, **kwargs) -> Any:
     -----------
     lpath : str
         The path to the EEG file to be loaded.
+    lazy : bool, optional
+        If True, data are not preloaded (preload=False); blocks are read on
+        demand with raw.get_data(start=..., stop=...). Default is False.
     **kwargs : dict
         Additional keyword arguments to be passed to the specific MNE loading function.
 
@@ -54,36 +57,38 @@ def _load_eeg_data(path: str, **kwargs) -> Any:
         ".set",
     ]
 
-    if extension not in allowed_extensions:
+    if f".{extension}" not in allowed_extensions:
         raise ValueError(
             f"File must have one of these extensions: {', '.join(allowed_extensions)}"
         )
 
+    kwargs.setdefault("preload", not lazy)
+
     with warnings.catch_warnings():
         warnings.simplefilter("ignore", RuntimeWarning)
 
         # Load the data based on the file extension
         if extension in ["vhdr", "vmrk"]:
             # Load BrainVision data
-            raw = mne.io.read_raw_brainvision(lpath, preload=True, **kwargs)
+            raw = mne.io.read_raw_brainvision(lpath, **kwargs)
         elif extension == "edf":
             # Load European data format
-            raw = mne.io.read_raw_edf(lpath, preload=True, **kwargs)
+            raw = mne.io.read_raw_edf(lpath, **kwargs)
         elif extension == "bdf":
             # Load BioSemi data format
-            raw = mne.io.read_raw_bdf(lpath, preload=True, **kwargs)
+            raw = mne.io.read_raw_bdf(lpath, **kwargs)
         elif extension == "gdf":
             # Load Gen data format
-            raw = mne.io.read_raw_gdf(lpath, preload=True, **kwargs)
+            raw = mne.io.read_raw_gdf(lpath, **kwargs)
         elif extension == "cnt":
             # Load Neuroscan CNT data
-            raw = mne.io.read_raw_cnt(lpath, preload=True, **kwargs)
+            raw = mne.io.read_raw_cnt(lpath, **kwargs)
         elif extension == "egi":
             # Load EGI simple binary data
-            raw = mne.io.read_raw_egi(lpath, preload=True, **kwargs)
+            raw = mne.io.read_raw_egi(lpath, **kwargs)
         elif extension == "set":
             # ???
-            raw = mne.io.read_raw(lpath, preload=True, **kwargs)
+            raw = mne.io.read_raw(lpath, **kwargs)
         elif extension == "eeg":
             is_BrainVision = any(
                 os.path.isfile(lpath.replace(".eeg", ext))
@@ -97,13 +102,11 @@ def _load_eeg_data(path: str, **kwargs) -> Any:
             # Brain Vision
             if is_BrainVision:
                 lpath_v = lpath.replace(".eeg", ".vhdr")
-                raw = mne.io.read_raw_brainvision(
-                    lpath_v, preload=True, **kwargs
-                )
+                raw = mne.io.read_raw_brainvision(lpath_v, **kwargs)
             # Nihon Koden
             if is_NihonKoden:
                 # raw = mne.io.read_raw_nihon(lpath, preload=True, **kwargs)
-                raw = mne.io.read_raw(lpath, preload=True, **kwargs)
+                raw = mne.io.read_raw(lpath, **kwargs)
         else:
             raise ValueError(f"Unsupported file extension: {extension}")
 
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-# Time-stamp: "2024-11-14 07:55:37 (ywatanabe)"
+# Time-stamp: "2026-10-18 11:20:14 (ywatanabe)"
 # File: ./mngs_repo/src/mngs/io/_load_modules/_hdf5.py
 
 from typing import Any
@@ -8,14 +8,32 @@ from typing import Any
 import h5py
 
 
-def _load_hdf5(lpath: str, **kwargs) -> Any:
-    """Load HDF5 file."""
+def _load_hdf5(lpath: str, lazy: bool = False, **kwargs) -> Any:
+    """
+    Load HDF5 file.
+
+    With lazy=True, the file is opened read-only and returned as an h5py.File;
+    its datasets are proxies that read only the selected slices (e.g.,
+    obj["x"][:, :4]). Close it with obj.close() or use it in a with block.
+    """
     if not lpath.endswith(".hdf5"):
         raise ValueError("File must have .hdf5 extension")
-    obj = {}
+    if lazy:
+        return h5py.File(lpath, "r", **kwargs)
     with h5py.File(lpath, "r") as hf:
-        for name in hf:
-            obj[name] = hf[name][:]
+        return _read_group(hf)
+
+
+def _read_group(group: h5py.Group) -> dict:
+    """Reads a group into a dict; subgroups become nested dicts."""
+    obj = {}
+    for name, item in group.items():
+        if isinstance(item, h5py.Group):
+            obj[name] = _read_group(item)
+        elif h5py.check_string_dtype(item.dtype) is not None:
+            obj[name] = item.asstr()[()]
+        else:
+            obj[name] = item[()]
     return obj
 
 
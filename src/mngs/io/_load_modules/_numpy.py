@@ -8,24 +8,41 @@ from typing import Any
 import numpy as np
 
 
-def _load_npy(lpath: str, **kwargs) -> Any:
-    """Load NPY or NPZ file."""
+def _load_npy(lpath: str, lazy: bool = False, **kwargs) -> Any:
+    """
+    Load NPY or NPZ file.
+
+    With lazy=True, .npy files are memory-mapped read-only (unless mmap_mode
+    is given) and .npz files are returned as a lazy NpzFile mapping whose
+    arrays are read on access.
+    """
     if lpath.endswith(".npy"):
-        return __load_npy(lpath, **kwargs)
+        return __load_npy(lpath, lazy=lazy, **kwargs)
     elif lpath.endswith(".npz"):
-        return __load_npz(lpath, **kwargs)
+        return __load_npz(lpath, lazy=lazy, **kwargs)
     raise ValueError("File must have .npy or .npz extension")
 
 
-def __load_npy(lpath: str, **kwargs) -> Any:
+def __load_npy(lpath: str, lazy: bool = False, **kwargs) -> Any:
     """Load NPY file."""
-    return np.load(lpath, allow_pickle=True, **kwargs)
-
-
-def __load_npz(lpath: str, **kwargs) -> Any:
+    if lazy:
+        kwargs.setdefault("mmap_mode", "r")
+    try:
+        return np.load(lpath, allow_pickle=True, **kwargs)
+    except ValueError:
+        # Object arrays cannot be memory-mapped
+        if kwargs.pop("mmap_mode", None) is None:
+            raise
+        return np.load(lpath, allow_pickle=True, **kwargs)
+
+
+def __load_npz(lpath: str, lazy: bool = False, **kwargs) -> Any:
     """Load NPZ file."""
-    obj = np.load(lpath)
-    return [v for v in dict(obj).values()]
+    obj = np.load(lpath, **kwargs)
+    if lazy:
+        return obj
+    with obj:
+        return [v for v in dict(obj).values()]
 
 
 # EOF
@@ -20,11 +20,13 @@ __file__ = "./src/mngs/io/_save.py"
 
 """Imports"""
 import gzip
-import inspect
 import json
 import logging
 import os as _os
 import pickle
+import sys
+import threading
+import uuid
 from typing import Any
 
 import h5py
@@ -36,12 +38,12 @@ import scipy
 import torch
 from ruamel.yaml import YAML
 
-from .._sh import sh
 from ..path._clean import clean
 from ..path._getsize import getsize
 from ..path._split import split
 from ..str._color_text import color_text
 from ..str._readable_bytes import readable_bytes
+from ._save_hdf5 import _save_hdf5
 from ._save_image import _save_image
 from ._save_text import _save_text
 from ..str._clean_path import clean_path
@@ -55,6 +57,7 @@ def save(
     symlink_from_cwd: bool = False,
     dry_run: bool = False,
     no_csv: bool = False,
+    atomic: bool = False,
     **kwargs,
 ) -> None:
     """
@@ -74,6 +77,9 @@ def save(
         If True, create a _symlink from the current working directory. Default is False.
     dry_run : bool, optional
         If True, simulate the saving process without actually writing files. Default is False.
+    atomic : bool, optional
+        If True, write to a temporary file in the same directory and rename it
+        into place, so readers never see a partially written file. Default is False.
     **kwargs
         Additional keyword arguments to pass to the underlying save function of the specific format.
 
@@ -120,6 +126,10 @@ def save(
 
     >>> # Save as JSON
     >>> mngs.io.save(data_dict, "data.json")
+
+    >>> # Save as compressed HDF5 and append a batch later
+    >>> mngs.io.save({"x": arr}, "data.hdf5", compression="gzip")
+    >>> mngs.io.save({"x": arr}, "data.hdf5", append=True)
     """
     try:
         ########################################
@@ -147,7 +157,7 @@ def save(
 
         # When relative path
         else:
-            script_path = inspect.stack()[1].filename
+            script_path = _caller_filename()
 
             # Fake path if in ipython
             if ("ipython" in script_path) or ("<stdin>" in script_path):
@@ -164,47 +174,108 @@ def save(
         spath_cwd = _os.getcwd() + "/" + specified_path
         spath_cwd = clean(spath_cwd)
 
-        # Removes spath and spath_cwd to prevent potential circular links
-        for path in [spath_final, spath_cwd]:
-            sh(f"rm -f {path}", verbose=False)
-
         if dry_run:
             print(color_text(f"\n(dry run) Saved to: {spath_final}", c="yellow"))
             return
 
+        # Removes spath and spath_cwd to prevent potential circular links
+        # (kept when appending to an existing HDF5 file)
+        appending = kwargs.get("append", False) and spath_final.endswith(".hdf5")
+        for path in [spath_final, spath_cwd]:
+            if appending and path == spath_final:
+                continue
+            _remove(path)
+
         # Ensure directory exists
         if makedirs:
             _os.makedirs(_os.path.dirname(spath_final), exist_ok=True)
 
         # Main
-        _save(
-            obj,
-            spath_final,
-            verbose=verbose,
-            symlink_from_cwd=symlink_from_cwd,
-            dry_run=dry_run,
-            no_csv=no_csv,
-            **kwargs,
-        )
+        if atomic and not appending:
+            spath_tmp = _os.path.join(
+                _os.path.dirname(spath_final),
+                f".tmp-{uuid.uuid4().hex[:8]}-{_os.path.basename(spath_final)}",
+            )
+            try:
+                _save(
+                    obj,
+                    spath_tmp,
+                    verbose=False,
+                    symlink_from_cwd=symlink_from_cwd,
+                    dry_run=dry_run,
+                    no_csv=no_csv,
+                    spath_final=spath_final,
+                    **kwargs,
+                )
+                _os.replace(spath_tmp, spath_final)
+            finally:
+                _remove(spath_tmp)
+            if verbose:
+                _print_saved(spath_final)
+        else:
+            _save(
+                obj,
+                spath_final,
+                verbose=verbose,
+                symlink_from_cwd=symlink_from_cwd,
+                dry_run=dry_run,
+                no_csv=no_csv,
+                **kwargs,
+            )
 
         # Symbolic link
         _symlink(spath, spath_cwd, symlink_from_cwd, verbose)
 
     except Exception as e:
+        if getattr(_save_context, "raise_errors", False):
+            raise
         logging.error(
             f"Error occurred while saving: {str(e)}"
-            f"Debug: Initial script_path = {inspect.stack()[1].filename}"
+            f"Debug: Initial script_path = {_caller_filename()}"
             # f"Debug: Final script_path = {script_path}"
             # f"Debug: fdir = {fdir}, fname = {fname}"
             f"Debug: Final spath = {spath}"
         )
 
 
+# Per-thread overrides used by background writers (see _save_async.py):
+# script_path fixes the caller resolved in the submitting thread, and
+# raise_errors propagates exceptions instead of logging them.
+_save_context = threading.local()
+
+
+def _caller_filename():
+    """Filename of the code calling save(); cheaper than inspect.stack()."""
+    script_path = getattr(_save_context, "script_path", None)
+    if script_path is not None:
+        return script_path
+    this_file = _caller_filename.__code__.co_filename
+    frame = sys._getframe(1)
+    while frame.f_back and frame.f_code.co_filename == this_file:
+        frame = frame.f_back
+    return frame.f_code.co_filename
+
+
+def _remove(path):
+    """rm -f without spawning a shell."""
+    try:
+        _os.remove(path)
+    except (FileNotFoundError, IsADirectoryError):
+        pass
+
+
 def _symlink(spath, spath_cwd, symlink_from_cwd, verbose):
     if symlink_from_cwd and (spath != spath_cwd):
         _os.makedirs(_os.path.dirname(spath_cwd), exist_ok=True)
-        sh(f"rm -f {spath_cwd}", verbose=False)
-        sh(f"ln -sfr {spath} {spath_cwd}", verbose=False)
+        _remove(spath_cwd)
+        # Relative link, as with ln -sfr
+        _os.symlink(
+            _os.path.relpath(
+                _os.path.realpath(spath),
+                _os.path.realpath(_os.path.dirname(spath_cwd)),
+            ),
+            spath_cwd,
+        )
         if verbose:
             print(color_text(f"\n(Symlinked to: {spath_cwd})", "yellow"))
 
@@ -216,8 +287,13 @@ def _save(
     symlink_from_cwd=False,
     dry_run=False,
     no_csv=False,
+    spath_final=None,
     **kwargs,
 ):
+    # spath_final is the destination when spath is a temporary file (atomic
+    # saves); sidecar files such as the CSV of a figure are named after it
+    spath_final = spath_final or spath
+
     # csv
     if spath.endswith(".csv"):
         _save_csv(obj, spath, **kwargs)
@@ -292,7 +368,7 @@ def _save(
                 ext_wo_dot = ext.replace(".", "")
                 save(
                     obj.to_sigma(),
-                    spath.replace(ext_wo_dot, "csv"),
+                    spath_final.replace(ext_wo_dot, "csv"),
                     symlink_from_cwd=symlink_from_cwd,
                     dry_run=dry_run,
                     **kwargs,
@@ -323,13 +399,7 @@ def _save(
 
     # hdf5
     elif spath.endswith(".hdf5"):
-        name_list, obj_list = []
-        for k, v in obj.items():
-            name_list.append(k)
-            obj_list.append(v)
-        with h5py.File(spath, "w") as hf:
-            for name, obj in zip(name_list, obj_list):
-                hf.create_dataset(name, data=obj)
+        _save_hdf5(obj, spath, **kwargs)
     # pth
     elif spath.endswith(".pth"):
         torch.save(obj, spath)
@@ -353,10 +423,14 @@ def _save(
         raise ValueError(f"Unsupported file format. {spath} was not saved.")
 
     if verbose:
-        if _os.path.exists(spath):
-            file_size = getsize(spath)
-            file_size = readable_bytes(file_size)
-            print(color_text(f"\nSaved to: {spath} ({file_size})", c="yellow"))
+        _print_saved(spath)
+
+
+def _print_saved(spath):
+    if _os.path.exists(spath):
+        file_size = getsize(spath)
+        file_size = readable_bytes(file_size)
+        print(color_text(f"\nSaved to: {spath} ({file_size})", c="yellow"))
 
 
 def _save_csv(obj, spath: str, **kwargs) -> None:
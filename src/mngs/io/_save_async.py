@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-17 16:20:31 (ywatanabe)"
+# File: ./mngs_repo/src/mngs/io/_save_async.py
+
+__file__ = "./src/mngs/io/_save_async.py"
+
+"""
+1. Functionality:
+   - Runs mngs.io.save in background threads so that computation and disk
+     I/O overlap
+   - Snapshots arrays/tensors on submit so later in-place updates (e.g.,
+     optimizer steps) do not leak into the written file
+   - Saves matplotlib figures on the calling thread (matplotlib is not
+     thread-safe)
+   - Bounds the memory held by pending saves (backpressure)
+   - Reports write errors through futures and flush_async_saves()
+2. Input:
+   - Same arguments as mngs.io.save
+3. Output:
+   - concurrent.futures.Future per save
+4. Prerequisites:
+   - mngs.io.save
+
+Example:
+    for epoch in range(n_epochs):
+        ...
+        # Tensors are cloned on submit, so training may continue right away
+        mngs.io.save_async(model.state_dict(), f"weights/epoch_{epoch}.pth")
+        mngs.io.save_async(df_history, "history.csv")
+    mngs.io.flush_async_saves()  # also called by mngs.gen.close
+"""
+
+import copy as _copy
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as _wait
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import torch
+
+from ._save import _caller_filename, _save_context, save
+
+
+def _estimate_nbytes(obj, _depth=0) -> int:
+    """Rough in-memory size of obj, used for backpressure."""
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, torch.Tensor):
+        return obj.element_size() * obj.nelement()
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return int(np.sum(obj.memory_usage(index=True, deep=False)))
+    if isinstance(obj, (bytes, bytearray, str)):
+        return len(obj)
+    if _depth < 3:
+        if isinstance(obj, dict):
+            return sum(_estimate_nbytes(vv, _depth + 1) for vv in obj.values())
+        if isinstance(obj, (list, tuple)):
+            return sum(_estimate_nbytes(vv, _depth + 1) for vv in obj)
+    return sys.getsizeof(obj)
+
+
+def _snapshot(obj, _depth=0):
+    """
+    Copies arrays, tensors and DataFrames in obj (recursing into dicts, lists
+    and tuples) so that the saved data are those at submit time.
+    """
+    if isinstance(obj, torch.Tensor):
+        return obj.detach().clone()
+    if isinstance(obj, np.ndarray):
+        return obj.copy()
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return obj.copy()
+    if _depth < 8:
+        if isinstance(obj, dict):
+            # Shallow copy keeps the type and attributes (e.g., the _metadata
+            # of state dicts)
+            snapshot = _copy.copy(obj)
+            for key, value in obj.items():
+                snapshot[key] = _snapshot(value, _depth + 1)
+            return snapshot
+        if isinstance(obj, list):
+            return [_snapshot(vv, _depth + 1) for vv in obj]
+        if isinstance(obj, tuple) and not hasattr(obj, "_fields"):
+            return tuple(_snapshot(vv, _depth + 1) for vv in obj)
+    return obj
+
+
+def _is_figure(obj) -> bool:
+    """matplotlib figures/animations and mngs.plt figure wrappers."""
+    return hasattr(obj, "savefig") or type(obj).__module__.startswith(
+        "matplotlib."
+    )
+
+
+def _resolve_caller() -> str:
+    """Script calling save_async/submit, resolved in the submitting thread."""
+    skip = {
+        _resolve_caller.__code__.co_filename,
+        _caller_filename.__code__.co_filename,
+    }
+    frame = sys._getframe(1)
+    while frame.f_back and frame.f_code.co_filename in skip:
+        frame = frame.f_back
+    return frame.f_code.co_filename
+
+
+class AsyncSaver:
+    """
+    Background writer for mngs.io.save.
+
+    submit() returns a Future whose result() re-raises any write error. At
+    most max_workers saves run at once, and submit() blocks while the
+    estimated size of pending objects exceeds max_memory_mb (a single object
+    larger than the budget is still accepted when nothing else is pending).
+    Relative paths are resolved against the submitting script, exactly as
+    with mngs.io.save.
+
+    With copy=True (default), arrays, tensors and DataFrames in obj (also
+    inside dicts, lists and tuples, e.g. state dicts) are copied on submit,
+    so the file holds their values at submit time even if they are updated
+    in place afterwards. With copy=False, they must not be modified until
+    their save is done. Other mutable objects are never copied.
+
+    matplotlib is not thread-safe, so figures are saved synchronously on the
+    calling thread; the returned Future is already done.
+    """
+
+    def __init__(self, max_workers: int = 2, max_memory_mb: float = 1024):
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        self.max_workers = max_workers
+        self.max_bytes = int(max_memory_mb * 1024**2)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._pending_bytes = 0
+        self._futures = set()
+        self._errors = []
+
+    @property
+    def pending_bytes(self) -> int:
+        return self._pending_bytes
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="mngs_io_save",
+                )
+            return self._executor
+
+    def submit(
+        self, obj: Any, specified_path: str, copy: bool = True, **kwargs
+    ) -> Future:
+        """Queues mngs.io.save(obj, specified_path, **kwargs)."""
+        script_path = _resolve_caller()
+        if _is_figure(obj):
+            return self._save_now(obj, specified_path, script_path, kwargs)
+
+        n_bytes = _estimate_nbytes(obj)
+
+        with self._cond:
+            while (
+                self._pending_bytes > 0
+                and self.max_bytes < self._pending_bytes + n_bytes
+            ):
+                self._cond.wait()
+            self._pending_bytes += n_bytes
+
+        try:
+            if copy:
+                obj = _snapshot(obj)
+            future = self._get_executor().submit(
+                self._run, obj, specified_path, script_path, n_bytes, kwargs
+            )
+        except Exception:
+            self._release(n_bytes)
+            raise
+
+        with self._cond:
+            self._futures.add(future)
+        future.add_done_callback(
+            lambda ff, path=specified_path: self._on_done(ff, path)
+        )
+        return future
+
+    def _save_now(self, obj, specified_path, script_path, kwargs):
+        """Saves on the calling thread, reporting errors like background saves."""
+        future = Future()
+        try:
+            future.set_result(self._run(obj, specified_path, script_path, 0, kwargs))
+        except Exception as err:
+            future.set_exception(err)
+        self._on_done(future, specified_path)
+        return future
+
+    def _run(self, obj, specified_path, script_path, n_bytes, kwargs):
+        _save_context.script_path = script_path
+        _save_context.raise_errors = True
+        try:
+            save(obj, specified_path, **kwargs)
+            return specified_path
+        finally:
+            _save_context.script_path = None
+            _save_context.raise_errors = False
+            if n_bytes:
+                self._release(n_bytes)
+
+    def _release(self, n_bytes):
+        with self._cond:
+            self._pending_bytes -= n_bytes
+            self._cond.notify_all()
+
+    def _on_done(self, future, specified_path):
+        with self._cond:
+            self._futures.discard(future)
+            if not future.cancelled() and future.exception() is not None:
+                self._errors.append((specified_path, future.exception()))
+
+    def flush(
+        self, timeout: Optional[float] = None, raise_errors: bool = True
+    ) -> List[Tuple[str, BaseException]]:
+        """
+        Waits for pending saves and returns the (path, error) pairs of failed
+        saves since the last flush. With raise_errors=True, a RuntimeError
+        listing them is raised instead.
+        """
+        with self._cond:
+            futures = list(self._futures)
+        _, not_done = _wait(futures, timeout=timeout)
+        if not_done:
+            raise TimeoutError(f"{len(not_done)} saves are still pending")
+
+        with self._cond:
+            errors, self._errors = self._errors, []
+
+        if errors and raise_errors:
+            details = "\n".join(f"{path}: {err!r}" for path, err in errors)
+            raise RuntimeError(
+                f"{len(errors)} background saves failed:\n{details}"
+            ) from errors[0][1]
+        return errors
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+
+async_saver = AsyncSaver()
+
+
+def save_async(obj: Any, specified_path: str, copy: bool = True, **kwargs) -> Future:
+    """
+    Saves obj in a background thread of the shared mngs.io.async_saver.
+
+    Takes the same arguments as mngs.io.save and returns a Future; its
+    result() re-raises write errors. Call mngs.io.flush_async_saves() (done
+    by mngs.gen.close) to wait for all pending saves. Arrays and tensors are
+    snapshotted on submit unless copy=False, and figures are saved on the
+    calling thread (see AsyncSaver).
+    """
+    return async_saver.submit(obj, specified_path, copy=copy, **kwargs)
+
+
+def flush_async_saves(
+    timeout: Optional[float] = None, raise_errors: bool = True
+) -> List[Tuple[str, BaseException]]:
+    """Waits for saves queued by save_async; see AsyncSaver.flush."""
+    return async_saver.flush(timeout=timeout, raise_errors=raise_errors)
+
+
+# EOF
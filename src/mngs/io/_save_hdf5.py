@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-17 15:21:09 (ywatanabe)"
+# File: ./mngs_repo/src/mngs/io/_save_hdf5.py
+
+__file__ = "./src/mngs/io/_save_hdf5.py"
+
+"""
+1. Functionality:
+   - Writes (nested) dicts of arrays to HDF5 with chunking and compression
+   - Appends batches along the first axis of resizable datasets
+   - Keeps a file open for streaming writes, optionally in SWMR mode
+2. Input:
+   - Dict of array-likes (nested dicts become groups)
+3. Output:
+   - HDF5 file
+4. Prerequisites:
+   - h5py, numpy
+
+Example:
+    # One-shot, compressed
+    mngs.io.save({"pac": pac}, "pac.hdf5", compression="gzip")
+
+    # Incremental, one call per batch
+    mngs.io.save({"pac": pac_batch}, "pac.hdf5", append=True)
+
+    # Streaming with the file kept open; readers may follow with swmr=True
+    with mngs.io.HDF5Writer("/path/to/pac.hdf5", swmr=True) as writer:
+        for batch in batches:
+            writer.append({"pac": calc_pac(batch)})
+"""
+
+from typing import Any, Dict, Optional
+
+import h5py
+import numpy as np
+
+
+def _create_dataset(
+    group,
+    name,
+    data,
+    compression=None,
+    compression_opts=None,
+    shuffle=False,
+    chunks=True,
+    resizable=True,
+):
+    """Creates a dataset; arrays are chunked and resizable along the first axis."""
+    data = np.asarray(data)
+    if data.dtype.kind == "U":
+        data = data.astype(h5py.string_dtype())
+
+    if data.ndim == 0:
+        return group.create_dataset(name, data=data)
+
+    kwargs = dict(compression=compression, shuffle=shuffle)
+    if compression_opts is not None:
+        kwargs["compression_opts"] = compression_opts
+    if resizable:
+        kwargs["maxshape"] = (None,) + data.shape[1:]
+        kwargs["chunks"] = True if chunks in (None, False) else chunks
+    elif chunks or compression or shuffle:
+        kwargs["chunks"] = True if chunks in (None, False) else chunks
+
+    return group.create_dataset(name, data=data, **kwargs)
+
+
+def _append_dataset(dataset, data):
+    """Appends data along the first axis of a resizable dataset."""
+    data = np.asarray(data)
+    if dataset.ndim == 0 or dataset.maxshape[0] is not None:
+        raise ValueError(
+            f"{dataset.name} is not resizable; it was written with resizable=False"
+        )
+    if data.ndim == dataset.ndim - 1:
+        data = data[np.newaxis]
+    if data.shape[1:] != dataset.shape[1:]:
+        raise ValueError(
+            f"Cannot append shape {data.shape} to {dataset.name} of shape {dataset.shape}"
+        )
+    n_old = dataset.shape[0]
+    dataset.resize(n_old + data.shape[0], axis=0)
+    dataset[n_old:] = data
+
+
+def _write_dict(group, obj, append=False, **dataset_kwargs):
+    for name, value in obj.items():
+        name = str(name)
+        if isinstance(value, dict):
+            subgroup = group.require_group(name)
+            _write_dict(subgroup, value, append=append, **dataset_kwargs)
+        elif append and name in group:
+            _append_dataset(group[name], value)
+        else:
+            if name in group:
+                del group[name]
+            _create_dataset(group, name, value, **dataset_kwargs)
+
+
+def _save_hdf5(
+    obj: Dict[str, Any],
+    spath: str,
+    append: bool = False,
+    compression: Optional[str] = None,
+    compression_opts: Optional[int] = None,
+    shuffle: bool = False,
+    chunks: Any = True,
+    resizable: bool = True,
+    swmr: bool = False,
+) -> None:
+    """
+    Saves a dict of arrays to HDF5.
+
+    Parameters
+    ----------
+    obj : dict
+        Dataset names to array-likes; nested dicts become groups.
+    spath : str
+        Path to the .hdf5 file.
+    append : bool
+        If True, opens an existing file and appends along the first axis of
+        existing datasets (new names are created). Otherwise the file is
+        overwritten.
+    compression : str, optional
+        "gzip", "lzf" or any h5py filter.
+    compression_opts : int, optional
+        Compression level for gzip (0-9).
+    shuffle : bool
+        Enables the HDF5 byte-shuffle filter.
+    chunks : bool or tuple
+        Chunk shape, or True for h5py's automatic chunking.
+    resizable : bool
+        Makes the first axis unlimited so that later calls can append.
+    swmr : bool
+        Writes with libver="latest" and enables SWMR mode so that readers
+        opening with swmr=True can read while the file is written.
+    """
+    if not isinstance(obj, dict):
+        raise ValueError("For .hdf5 files, obj must be a dict of arrays.")
+
+    with HDF5Writer(
+        spath,
+        mode="a" if append else "w",
+        compression=compression,
+        compression_opts=compression_opts,
+        shuffle=shuffle,
+        chunks=chunks,
+        resizable=resizable,
+        swmr=swmr,
+    ) as writer:
+        if append:
+            writer.append(obj)
+        else:
+            writer.write(obj)
+
+
+class HDF5Writer:
+    """
+    Keeps an HDF5 file open for incremental writes.
+
+    append() extends existing datasets along their first axis (creating them
+    on first use), so results can be streamed to disk batch by batch instead
+    of accumulated in memory. Dataset options are those of mngs.io.save for
+    .hdf5. With swmr=True, SWMR mode is enabled after the first batch (HDF5
+    requires datasets to exist beforehand); datasets added afterwards are not
+    allowed, and data are flushed after every append so readers see them.
+    SWMR also needs a file created with libver="latest" (superblock version
+    3 or later): opening an older file with mode="a" and swmr=True raises a
+    ValueError; rewrite it with mode="w" instead.
+    """
+
+    def __init__(
+        self,
+        spath: str,
+        mode: str = "a",
+        compression: Optional[str] = None,
+        compression_opts: Optional[int] = None,
+        shuffle: bool = False,
+        chunks: Any = True,
+        resizable: bool = True,
+        swmr: bool = False,
+    ):
+        self.spath = spath
+        self.swmr = swmr
+        self.dataset_kwargs = dict(
+            compression=compression,
+            compression_opts=compression_opts,
+            shuffle=shuffle,
+            chunks=chunks,
+            resizable=resizable,
+        )
+        self.file = h5py.File(spath, mode, libver="latest" if swmr else None)
+        if swmr:
+            self._check_swmr_compatible()
+
+    def _check_swmr_compatible(self):
+        # HDF5 refuses SWMR writing below superblock version 3, which only
+        # files created with libver="latest" have
+        superblock_version = self.file.id.get_create_plist().get_version()[0]
+        if superblock_version < 3:
+            self.close()
+            raise ValueError(
+                f"{self.spath} was not created with libver=\"latest\" "
+                f"(superblock version {superblock_version}), so SWMR writing is "
+                "not possible; rewrite it with mode=\"w\" or use swmr=False"
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def write(self, obj: Dict[str, Any]) -> None:
+        """Writes datasets, replacing existing ones with the same names."""
+        _write_dict(self.file, obj, append=False, **self.dataset_kwargs)
+        self._flush()
+
+    def append(self, obj: Dict[str, Any]) -> None:
+        """Appends a batch along the first axis of each dataset."""
+        _write_dict(self.file, obj, append=True, **self.dataset_kwargs)
+        self._flush()
+
+    def _flush(self):
+        if self.swmr and not self.file.swmr_mode:
+            self.file.swmr_mode = True
+        self.file.flush()
+
+    def close(self) -> None:
+        if self.file:
+            self.file.close()
+            self.file = None
+
+
+# EOF
@@ -30,13 +30,22 @@ from ..gen._to_even import to_even
 from ..dsp.utils._ensure_3d import ensure_3d
 from ..dsp.utils.filter import design_filter
 from ..dsp.utils._ensure_even_len import ensure_even_len
+from ..dsp.utils._filter_kernel_cache import cache_filter_kernels
 from ..dsp.utils._zero_pad import zero_pad
 
 class BaseFilter1D(nn.Module):
-    def __init__(self, fp16=False, in_place=False):
+    # Kernel length above which conv_method="auto" switches to FFT convolution
+    FFT_KERNEL_LEN_THRESHOLD = 64
+
+    def __init__(self, fp16=False, in_place=False, conv_method="auto"):
         super().__init__()
+        if conv_method not in ("auto", "direct", "fft"):
+            raise ValueError(
+                f"conv_method should be 'auto', 'direct' or 'fft'. Received: {conv_method}"
+            )
         self.fp16 = fp16
         self.in_place = in_place
+        self.conv_method = conv_method
         # self.kernels = None
 
     @abstractmethod
@@ -65,7 +74,10 @@ class BaseFilter1D(nn.Module):
 
         # Filtering
         x = self.flip_extend(x, self.kernel_size // 2)
-        x = self.batch_conv(x, self.kernels, padding=0)
+        if self._use_fft_conv():
+            x = self.batch_fft_conv(x, self.kernels)
+        else:
+            x = self.batch_conv(x, self.kernels, padding=0)
         x = x[..., :seq_len]
 
         assert x.shape == (
@@ -114,6 +126,61 @@ class BaseFilter1D(nn.Module):
         filted = F.conv1d(x, kernels.type_as(x), padding=padding)
         return filted.reshape(batch_size, n_chs, n_kernels, -1)
 
+    def _use_fft_conv(self):
+        conv_method = getattr(self, "conv_method", "auto")
+        if conv_method == "auto":
+            return self.kernel_size > self.FFT_KERNEL_LEN_THRESHOLD
+        return conv_method == "fft"
+
+    @staticmethod
+    def batch_fft_conv(x, kernels, n_fft=None):
+        """
+        FFT (overlap-save) equivalent of batch_conv(x, kernels, padding=0).
+
+        One FFT of the input blocks is shared across all kernels.
+
+        x: (batch_size, n_chs, seq_len)
+        kernels: (n_kernels, seq_len_filt)
+        n_fft: FFT block length. Defaults to a power of two covering
+               min(seq_len, 8 * seq_len_filt).
+        """
+        assert x.ndim == 3
+        assert kernels.ndim == 2
+        batch_size, n_chs, n_time = x.shape
+        n_kernels, kernel_len = kernels.shape
+        out_len = n_time - kernel_len + 1
+        assert 0 < out_len, "Signal must be longer than the kernels."
+
+        if n_fft is None:
+            n_fft = 2 ** int(np.ceil(np.log2(min(n_time, 8 * kernel_len))))
+        assert kernel_len <= n_fft
+        step = n_fft - kernel_len + 1
+        n_blocks = (out_len + step - 1) // step
+
+        # FFTs are computed in float32 at least (half is not supported on CPU)
+        dtype = torch.promote_types(x.dtype, torch.float32)
+        orig_dtype = x.dtype
+
+        x = x.reshape(-1, n_time).to(dtype)
+        x = F.pad(x, (0, (n_blocks - 1) * step + n_fft - n_time))
+        x = x.unfold(-1, n_fft, step)
+        # (batch_size * n_chs, n_blocks, n_fft)
+
+        # Cross-correlation as conv1d does, hence the kernels are flipped
+        kernels_f = torch.fft.rfft(kernels.to(dtype).flip(-1), n=n_fft)
+        x_f = torch.fft.rfft(x, n=n_fft)
+
+        filted = torch.fft.irfft(
+            x_f.unsqueeze(1) * kernels_f.unsqueeze(0).unsqueeze(2), n=n_fft
+        )
+        # (batch_size * n_chs, n_kernels, n_blocks, n_fft)
+
+        filted = filted[..., kernel_len - 1 :].reshape(
+            batch_size * n_chs, n_kernels, -1
+        )[..., :out_len]
+
+        return filted.reshape(batch_size, n_chs, n_kernels, -1).to(orig_dtype)
+
     @staticmethod
     def remove_edges(x, edge_len):
         edge_len = x.shape[-1] // 8 if edge_len == "auto" else edge_len
@@ -125,8 +192,8 @@ class BaseFilter1D(nn.Module):
 
 
 class BandPassFilter(BaseFilter1D):
-    def __init__(self, bands, fs, seq_len, fp16=False):
-        super().__init__(fp16=fp16)
+    def __init__(self, bands, fs, seq_len, fp16=False, conv_method="auto"):
+        super().__init__(fp16=fp16, conv_method=conv_method)
 
         self.fp16 = fp16
 
@@ -151,6 +218,7 @@ class BandPassFilter(BaseFilter1D):
         )
 
     @staticmethod
+    @cache_filter_kernels("bandpass")
     def init_kernels(seq_len, fs, bands):
         filters = [
             design_filter(
@@ -192,6 +260,7 @@ class BandStopFilter(BaseFilter1D):
         self.register_buffer("kernels", self.init_kernels(seq_len, fs, bands))
 
     @staticmethod
+    @cache_filter_kernels("bandstop")
     def init_kernels(seq_len, fs, bands):
         kernels = zero_pad(
             [
@@ -224,6 +293,7 @@ class LowPassFilter(BaseFilter1D):
         )
 
     @staticmethod
+    @cache_filter_kernels("lowpass")
     def init_kernels(seq_len, fs, cutoffs_hz):
         kernels = zero_pad(
             [
@@ -256,6 +326,7 @@ class HighPassFilter(BaseFilter1D):
         )
 
     @staticmethod
+    @cache_filter_kernels("highpass")
     def init_kernels(seq_len, fs, cutoffs_hz):
         kernels = zero_pad(
             [
@@ -6,11 +6,18 @@ from torch.fft import fft, ifft
 
 
 class Hilbert(nn.Module):
-    def __init__(self, seq_len, dim=-1, fp16=False, in_place=False):
+    def __init__(self, seq_len, dim=-1, fp16=False, in_place=False, fast=False):
+        """
+        fast (bool): Uses a non-differentiable path with rfft and a hard analytic-signal
+                     mask, and writes phase and amplitude directly into the output tensor.
+                     With in_place=True, the spectrum is also masked in place.
+                     Both are ignored for inputs requiring gradients.
+        """
         super().__init__()
         self.dim = dim
         self.fp16 = fp16
         self.in_place = in_place
+        self.fast = fast
         self.n = seq_len
         f = torch.cat(
             [
@@ -20,6 +27,14 @@ class Hilbert(nn.Module):
         )
         self.register_buffer("f", f)
 
+        # Hard analytic-signal mask over the rfft bins: DC (and Nyquist) x1, positive x2
+        rfft_mask = torch.zeros(self.n // 2 + 1)
+        rfft_mask[0] = 1.0
+        rfft_mask[1 : (self.n + 1) // 2] = 2.0
+        if self.n % 2 == 0:
+            rfft_mask[-1] = 1.0
+        self.register_buffer("rfft_mask", rfft_mask)
+
     def hilbert_transform(self, x):
         # n = x.shape[self.dim]
 
@@ -46,11 +61,42 @@ class Hilbert(nn.Module):
 
         return transformed
 
+    @torch.no_grad()
+    def fast_hilbert_transform(self, x):
+        """Returns (..., 2) tensor of phase and amplitude, computed without autograd."""
+        dim = self.dim % x.ndim
+        mask = self.rfft_mask.view(-1, *([1] * (x.ndim - dim - 1)))
+
+        xf = torch.fft.rfft(x.float(), n=self.n, dim=dim)
+        if self.in_place:
+            xf.mul_(mask)
+        else:
+            xf = xf * mask
+
+        # ifft zero-pads the negative frequencies up to n
+        x_comp = torch.fft.ifft(xf, n=self.n, dim=dim)
+        del xf
+
+        out = torch.empty(
+            *x_comp.shape, 2, dtype=x_comp.real.dtype, device=x_comp.device
+        )
+        torch.atan2(x_comp.imag, x_comp.real, out=out[..., 0])
+        torch.abs(x_comp, out=out[..., 1])
+        del x_comp
+
+        return out
+
     def forward(self, x):
+        # fast and in_place are ignored when gradients are required
+        requires_grad = torch.is_grad_enabled() and x.requires_grad
+
+        if self.fast and not requires_grad:
+            return self.fast_hilbert_transform(x)
+
         if self.fp16:
             x = x.half()
 
-        if not self.in_place:
+        if not self.in_place or requires_grad:
             x = x.clone()  # Ensure that we do not modify the input in-place
 
         x_comp = self.hilbert_transform(x)
@@ -23,10 +23,34 @@ import torch.nn.functional as F
 
 # Functions
 class ModulationIndex(nn.Module):
-    def __init__(self, n_bins=18, fp16=False, amp_prob=False):
+    def __init__(
+        self, n_bins=18, fp16=False, amp_prob=False, method="onehot", chunk_size=None
+    ):
+        """
+        Parameters:
+        - n_bins (int): Number of phase bins.
+        - fp16 (bool): Casts inputs to half precision.
+        - amp_prob (bool): Returns the amplitude distribution over phase bins instead of MI.
+        - method (str): "onehot" broadcasts one-hot phase masks against amplitudes,
+                        materializing a (..., sequence_length, n_bins) tensor.
+                        "scatter" accumulates per-bin amplitude sums with bucketized
+                        indices, so that peak memory does not scale with sequence_length.
+        - chunk_size (int or None): Number of time points processed at once by the
+                                    "scatter" method. None processes the whole sequence.
+        """
         super(ModulationIndex, self).__init__()
+        if method not in ("onehot", "scatter"):
+            raise ValueError(
+                f"method should be 'onehot' or 'scatter'. Received: {method}"
+            )
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError(
+                f"chunk_size should be None or a positive integer. Received: {chunk_size}"
+            )
         self.n_bins = n_bins
         self.fp16 = fp16
+        self.method = method
+        self.chunk_size = chunk_size
         self.register_buffer(
             "pha_bin_cutoffs", torch.linspace(-np.pi, np.pi, n_bins + 1)
         )
@@ -66,6 +90,51 @@ class ModulationIndex(nn.Module):
 
         device = pha.device
 
+        if self.method == "scatter":
+            amp_means = self._calc_amp_means_scatter(pha, amp, epsilon)
+        else:
+            amp_means = self._calc_amp_means_onehot(pha, amp, epsilon)
+        # (batch_size, n_channels, n_freqs_pha, n_freqs_amp, n_segments, 1, n_bins)
+
+        amp_probs = amp_means / (
+            amp_means.sum(dim=-1, keepdims=True) + epsilon
+        )
+
+        if self.amp_prob:
+            return amp_probs.detach().cpu()
+
+        """
+        matplotlib.use("TkAgg")
+        fig, ax = mngs.plt.subplots(subplot_kw={'polar': True})
+        yy = amp_probs[0, 0, 0, 0, 0, 0, :].detach().cpu().numpy()
+        xx = ((self.pha_bin_cutoffs[1:] + self.pha_bin_cutoffs[:-1]) / 2).detach().cpu().numpy()
+        ax.bar(xx, yy, width=.1)
+        plt.show()
+        """
+
+        MI = (
+            torch.log(torch.tensor(self.n_bins, device=device) + epsilon)
+            + (amp_probs * (amp_probs + epsilon).log()).sum(dim=-1)
+        ) / torch.log(torch.tensor(self.n_bins, device=device))
+
+        # Squeeze the n_bin dimension
+        MI = MI.squeeze(-1)
+
+        # Takes mean along the n_segments dimension
+        i_segment = -1
+        MI = MI.mean(axis=i_segment)
+
+        if MI.isnan().any():
+            warnings.warn("NaN values detected in Modulation Index calculation.")
+            # raise ValueError(
+            #     "NaN values detected in Modulation Index calculation."
+            # )
+
+        return MI
+
+    def _calc_amp_means_onehot(self, pha, amp, epsilon):
+        device = pha.device
+
         pha_masks = self._phase_to_masks(pha, self.pha_bin_cutoffs.to(device))
         # (batch_size, n_channels, n_freqs_pha, n_segments, sequence_length, n_bins)
 
@@ -102,50 +171,97 @@ class ModulationIndex(nn.Module):
         counts = pha_masks.sum(dim=i_time, keepdims=True)
         amp_means = amp_sums / (counts + epsilon)
 
-        amp_probs = amp_means / (
-            amp_means.sum(dim=-1, keepdims=True) + epsilon
-        )
-
-        if self.amp_prob:
-            return amp_probs.detach().cpu()
+        return amp_means
 
+    def _calc_amp_means_scatter(self, pha, amp, epsilon):
         """
-        matplotlib.use("TkAgg")
-        fig, ax = mngs.plt.subplots(subplot_kw={'polar': True})
-        yy = amp_probs[0, 0, 0, 0, 0, 0, :].detach().cpu().numpy()
-        xx = ((self.pha_bin_cutoffs[1:] + self.pha_bin_cutoffs[:-1]) / 2).detach().cpu().numpy()
-        ax.bar(xx, yy, width=.1)
-        plt.show()
+        Segment-sum version of _calc_amp_means_onehot.
+
+        Phase values are bucketized into bin indices and amplitudes are accumulated
+        into (n_freqs_pha, n_freqs_amp, n_bins) sums with scatter_add_, without
+        materializing one-hot masks. Sums are accumulated in float32.
         """
+        batch_size, n_chs, n_freqs_pha, n_segments, seq_len = pha.shape
+        n_freqs_amp = amp.shape[2]
+        device = pha.device
+        cutoffs = self.pha_bin_cutoffs.to(device)
+
+        amp_sums = torch.zeros(
+            batch_size,
+            n_chs,
+            n_freqs_pha,
+            n_freqs_amp,
+            n_segments,
+            self.n_bins,
+            device=device,
+            dtype=torch.float32,
+        )
+        counts = torch.zeros(
+            batch_size,
+            n_chs,
+            n_freqs_pha,
+            n_segments,
+            self.n_bins,
+            device=device,
+            dtype=torch.float32,
+        )
 
-        MI = (
-            torch.log(torch.tensor(self.n_bins, device=device) + epsilon)
-            + (amp_probs * (amp_probs + epsilon).log()).sum(dim=-1)
-        ) / torch.log(torch.tensor(self.n_bins, device=device))
+        chunk_size = self.chunk_size or seq_len
+        for start in range(0, seq_len, chunk_size):
+            end = min(start + chunk_size, seq_len)
 
-        # Squeeze the n_bin dimension
-        MI = MI.squeeze(-1)
+            bin_indices = self._phase_to_bin_indices(
+                pha[..., start:end].contiguous(), cutoffs
+            )
+            # (batch_size, n_channels, n_freqs_pha, n_segments, chunk_len)
+            _amp = amp[..., start:end].float()
+            # (batch_size, n_channels, n_freqs_amp, n_segments, chunk_len)
 
-        # Takes mean along the n_segments dimension
-        i_segment = -1
-        MI = MI.mean(axis=i_segment)
+            counts.scatter_add_(
+                -1,
+                bin_indices,
+                torch.ones_like(bin_indices, dtype=counts.dtype),
+            )
 
-        if MI.isnan().any():
-            warnings.warn("NaN values detected in Modulation Index calculation.")
-            # raise ValueError(
-            #     "NaN values detected in Modulation Index calculation."
-            # )
+            # Expanded views; no (n_freqs_pha, n_freqs_amp, chunk_len) copy is made
+            expanded_shape = (
+                batch_size,
+                n_chs,
+                n_freqs_pha,
+                n_freqs_amp,
+                n_segments,
+                end - start,
+            )
+            amp_sums.scatter_add_(
+                -1,
+                bin_indices.unsqueeze(3).expand(expanded_shape),
+                _amp.unsqueeze(2).expand(expanded_shape),
+            )
 
-        return MI
+        amp_means = amp_sums / (counts.unsqueeze(3) + epsilon)
+        amp_means = amp_means.unsqueeze(-2)
+        # (batch_size, n_channels, n_freqs_pha, n_freqs_amp, n_segments, 1, n_bins)
+
+        if self.fp16:
+            amp_means = amp_means.half()
+
+        return amp_means
 
     @staticmethod
-    def _phase_to_masks(pha, phase_bin_cutoffs):
+    def _phase_to_bin_indices(pha, phase_bin_cutoffs):
         n_bins = int(len(phase_bin_cutoffs) - 1)
-        bin_indices = (
+        return (
             (torch.bucketize(pha, phase_bin_cutoffs, right=False) - 1).clamp(
                 0, n_bins - 1
             )
         ).long()
+
+    @staticmethod
+    def _phase_to_masks(pha, phase_bin_cutoffs):
+        n_bins = int(len(phase_bin_cutoffs) - 1)
+        bin_indices = ModulationIndex._phase_to_bin_indices(
+            pha, phase_bin_cutoffs
+        )
         one_hot_masks = (
             F.one_hot(
                 bin_indices,
@@ -11,6 +11,7 @@ import warnings
 
 import matplotlib.pyplot as plt
 import mngs
+import psutil
 import torch
 import torch.nn as nn
 
@@ -32,11 +33,16 @@ class PAC(nn.Module):
         in_place=True,
         fp16=False,
         amp_prob=False,
+        mi_method="onehot",
+        mi_chunk_size=None,
+        surrogate_mem_gb=None,
+        hilbert_fast=False,
     ):
         super().__init__()
 
         self.fp16 = fp16
         self.n_perm = n_perm
+        self.surrogate_mem_gb = surrogate_mem_gb
         self.amp_prob = amp_prob
         self.trainable = trainable
 
@@ -61,12 +67,22 @@ class PAC(nn.Module):
             trainable=trainable,
         )
 
-        self.hilbert = mngs.nn.Hilbert(seq_len, dim=-1, fp16=fp16)
+        # The fast Hilbert transform is not differentiable, and in-place
+        # operations would overwrite tensors autograd needs
+        self.hilbert = mngs.nn.Hilbert(
+            seq_len,
+            dim=-1,
+            fp16=fp16,
+            in_place=hilbert_fast and not trainable,
+            fast=hilbert_fast and not trainable,
+        )
 
         self.Modulation_index = mngs.nn.ModulationIndex(
             n_bins=18,
             fp16=fp16,
             amp_prob=amp_prob,
+            method=mi_method,
+            chunk_size=mi_chunk_size,
         )
 
         # Data Handlers
@@ -149,56 +165,137 @@ class PAC(nn.Module):
 
         # return pac
 
-    def generate_surrogates(self, pha, amp, bs=1):
-        # Shape of pha: [batch_size, n_chs, n_freqs_pha, n_segments, sequence_length]
+    def generate_surrogates(self, pha, amp, mem_budget_gb=None):
+        """
+        Computes surrogate PAC values from circularly time-shifted phase signals.
+
+        Shifted phases are built lazily per block of permutations, so that only
+        (samples in block) x (permutations in block) copies exist at a time. The
+        block size is chosen from a memory budget and computation runs on the
+        device of this module.
+
+        Parameters:
+        - pha (torch.Tensor): (batch_size, n_chs, n_freqs_pha, n_segments, seq_len)
+        - amp (torch.Tensor): (batch_size, n_chs, n_freqs_amp, n_segments, seq_len)
+        - mem_budget_gb (float or None): Memory budget for one block. If None,
+          self.surrogate_mem_gb is used; if it is also None, half of the free
+          memory of the device is used.
+
+        Returns:
+        - torch.Tensor: (batch_size, n_chs, n_perm, n_freqs_pha, n_freqs_amp),
+          or amplitude probabilities when amp_prob is True.
+        """
         batch_size, n_chs, n_freqs_pha, n_segments, seq_len = pha.shape
         _, _, n_freqs_amp, _, _ = amp.shape
 
-        # cut and shuffle
-        cut_points = torch.randint(seq_len, (self.n_perm,), device=pha.device)
-        ranges = torch.arange(seq_len, device=pha.device)
-        indices = cut_points.unsqueeze(0) - ranges.unsqueeze(1)
+        device = self.Modulation_index.pha_bin_cutoffs.device
+        dtype = torch.float16 if self.fp16 else torch.float32
 
-        pha = pha[..., indices]
-        amp = amp.unsqueeze(-1).expand(-1, -1, -1, -1, -1, self.n_perm)
+        # (batch_size * n_chs, n_freqs, n_segments, seq_len)
+        pha = pha.reshape(-1, n_freqs_pha, n_segments, seq_len).to(dtype)
+        amp = amp.reshape(-1, n_freqs_amp, n_segments, seq_len).to(dtype)
+        n_samples = len(pha)
 
-        pha = self.dh_pha.fit(pha, keepdims=[2, 3, 4])
-        amp = self.dh_amp.fit(amp, keepdims=[2, 3, 4])
+        # Circular time-shift surrogates
+        shifts = torch.randint(1, max(seq_len, 2), (self.n_perm,))
+        ranges = torch.arange(seq_len)
 
-        if self.fp16:
-            pha = pha.half()
-            amp = amp.half()
-
-        # print("\nCalculating surrogate PAC values...")
+        bs_samples, bs_perm = self._calc_surrogate_batch_sizes(
+            n_samples,
+            n_freqs_pha,
+            n_freqs_amp,
+            n_segments,
+            seq_len,
+            torch.finfo(dtype).bits // 8,
+            device,
+            mem_budget_gb,
+        )
 
         surrogate_pacs = []
-        n_batches = (len(pha) + bs - 1) // bs
-        device = "cuda"
         with torch.no_grad():
-            # ########################################
-            # # fixme
-            # pha = pha.to(device)
-            # amp = amp.to(device)
-            # ########################################
-
-            for i_batch in range(n_batches):
-                start = i_batch * bs
-                end = min((i_batch + 1) * bs, pha.shape[0])
-
-                _pha = pha[start:end].unsqueeze(1).to(device)  # n_chs = 1
-                _amp = amp[start:end].unsqueeze(1).to(device)  # n_chs = 1
-
-                _surrogate_pacs = self.Modulation_index(_pha, _amp).cpu()
-                surrogate_pacs.append(_surrogate_pacs)
-
-                # # Optionally clear cache if memory is an issue
-                # torch.cuda.empty_cache()
+            for i_start in range(0, n_samples, bs_samples):
+                i_end = min(i_start + bs_samples, n_samples)
+                _pha = pha[i_start:i_end].to(device)
+                _amp = amp[i_start:i_end].to(device)
+
+                _surrogate_pacs = []
+                for p_start in range(0, self.n_perm, bs_perm):
+                    p_end = min(p_start + bs_perm, self.n_perm)
+                    indices = (
+                        ranges.unsqueeze(0) + shifts[p_start:p_end].unsqueeze(1)
+                    ) % seq_len
+                    # (n_perm_block, seq_len)
+
+                    _pha_shifted = _pha[..., indices.to(device)].permute(
+                        0, 3, 1, 2, 4
+                    )
+                    # (n_samples_block, n_perm_block, n_freqs_pha, n_segments, seq_len)
+
+                    _amp_expanded = _amp.unsqueeze(1).expand(
+                        -1, p_end - p_start, -1, -1, -1
+                    )
+                    # (n_samples_block, n_perm_block, n_freqs_amp, n_segments, seq_len)
+
+                    _surrogate_pacs.append(
+                        self.Modulation_index(_pha_shifted, _amp_expanded).cpu()
+                    )
+                    del _pha_shifted
+
+                surrogate_pacs.append(torch.cat(_surrogate_pacs, dim=1))
+
+        if device.type == "cuda":
+            torch.cuda.empty_cache()
+
+        surrogate_pacs = torch.cat(surrogate_pacs, dim=0)
+        # (batch_size * n_chs, n_perm, ...)
+
+        return surrogate_pacs.reshape(
+            batch_size, n_chs, *surrogate_pacs.shape[1:]
+        )
 
-        torch.cuda.empty_cache()
-        surrogate_pacs = torch.vstack(surrogate_pacs).squeeze()
-        surrogate_pacs = self.dh_pha.unfit(surrogate_pacs)
+    def _calc_surrogate_batch_sizes(
+        self,
+        n_samples,
+        n_freqs_pha,
+        n_freqs_amp,
+        n_segments,
+        seq_len,
+        n_bytes,
+        device,
+        mem_budget_gb=None,
+    ):
+        """Returns (n_samples, n_perm) per block fitting in the memory budget."""
+        mem_budget_gb = (
+            mem_budget_gb if mem_budget_gb is not None else self.surrogate_mem_gb
+        )
+        if mem_budget_gb is not None:
+            budget = mem_budget_gb * 1024**3
+        elif device.type == "cuda":
+            budget = torch.cuda.mem_get_info(device)[0] / 2
+        else:
+            budget = psutil.virtual_memory().available / 2
+
+        # Estimated bytes for one (sample, permutation) pair
+        n_bins = self.Modulation_index.n_bins
+        n_pha = n_freqs_pha * n_segments * seq_len
+        if self.Modulation_index.method == "scatter":
+            chunk_len = self.Modulation_index.chunk_size or seq_len
+            per_unit = (
+                n_pha * n_bytes
+                + n_freqs_pha * n_segments * min(chunk_len, seq_len) * 8
+                + n_freqs_pha * n_freqs_amp * n_segments * n_bins * 4
+            )
+        else:
+            per_unit = (
+                n_pha * n_bytes
+                + n_pha * n_bins
+                + n_pha * n_freqs_amp * n_bins * n_bytes
+            )
 
-        return surrogate_pacs
+        n_units = max(1, int(budget // per_unit))
+        if n_units >= n_samples:
+            return n_samples, max(1, min(self.n_perm, n_units // n_samples))
+        return n_units, 1
 
     def init_bandpass(
         self,
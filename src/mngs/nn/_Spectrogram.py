@@ -6,9 +6,36 @@ import torch
 import torch.nn as nn
 import torch.nn.functional as F
 from ..decorators import numpy_fn, torch_fn
+from ..dsp.utils._ensure_3d import ensure_3d
 
 
 class Spectrogram(nn.Module):
+    """
+    Short-time Fourier transform of multichannel signals.
+
+    All (batch, channel) pairs are transformed with a single torch.stft call.
+    The window is a (non-persistent) buffer, so it follows .to(device) and
+    .double() together with the module.
+
+    Parameters:
+    - sampling_rate (float): Sampling rate [Hz].
+    - n_fft (int): FFT size.
+    - hop_length (int): Hop between frames; n_fft // 4 by default.
+    - win_length (int): Window length (<= n_fft); n_fft by default.
+    - window (str): Only "hann" is supported.
+    - output (str): "magnitude" (|X|, default), "power" (|X|^2),
+      "log_power" (10 * log10(|X|^2 + eps) [dB]) or "complex".
+    - vectorized (bool): If False, loops over channels (reference path).
+    - eps (float): Floor added before the log for output="log_power".
+
+    Streaming:
+        stream(chunk) accepts consecutive chunks of shape (batch_size, n_chs,
+        n_samples) and returns the frames completed so far (center=False
+        framing); call reset_stream() before a new recording.
+    """
+
+    OUTPUTS = ("magnitude", "power", "log_power", "complex")
+
     def __init__(
         self,
         sampling_rate,
@@ -16,18 +43,37 @@ class Spectrogram(nn.Module):
         hop_length=None,
         win_length=None,
         window="hann",
+        output="magnitude",
+        vectorized=True,
+        eps=1e-10,
     ):
         super().__init__()
         self.sampling_rate = sampling_rate
         self.n_fft = n_fft
         self.hop_length = hop_length if hop_length is not None else n_fft // 4
         self.win_length = win_length if win_length is not None else n_fft
+        if output not in self.OUTPUTS:
+            raise ValueError(f"output should be one of {self.OUTPUTS}. Received: {output}")
+        self.output = output
+        self.vectorized = vectorized
+        self.eps = eps
+
         if window == "hann":
-            self.window = torch.hann_window(window_length=self.win_length)
+            # float64, so that double inputs do not get a rounded window;
+            # cast to the input dtype in _window_for
+            window = torch.hann_window(
+                window_length=self.win_length, dtype=torch.float64
+            )
         else:
             raise ValueError(
                 "Unsupported window type. Extend this to support more window types."
             )
+        # Zero-padded to n_fft and centered, as torch.stft does for win_length < n_fft
+        pad_left = (self.n_fft - self.win_length) // 2
+        window = F.pad(window, (pad_left, self.n_fft - self.win_length - pad_left))
+        self.register_buffer("window", window, persistent=False)
+
+        self.reset_stream()
 
     def forward(self, x):
         """
@@ -37,49 +83,124 @@ class Spectrogram(nn.Module):
         - signal (torch.Tensor): Input signal of shape (batch_size, n_chs, seq_len).
 
         Returns:
-        - spectrograms (torch.Tensor): The computed spectrograms for each channel.
+        - spectrograms (torch.Tensor): The computed spectrograms for each channel,
+          of shape (batch_size, n_chs, n_fft // 2 + 1, n_frames).
+        - freqs (torch.Tensor): Frequencies [Hz].
+        - times_sec (torch.Tensor): Frame times [s].
         """
 
-        x = mngs.dsp.ensure_3d(x)
+        x = ensure_3d(x)
+
+        if self.vectorized:
+            spec = self._stft(x)
+        else:
+            spec = self._stft_per_channel(x)
+        spectrograms = self._to_output(spec)
+
+        # Calculate frequencies (y-axis)
+        freqs = torch.fft.rfftfreq(self.n_fft, d=1 / self.sampling_rate)
+
+        # Time of each frame in seconds, considering the hop length and sampling rate
+        n_frames = spectrograms.shape[-1]
+        times_sec = torch.arange(0, n_frames) * (
+            self.hop_length / self.sampling_rate
+        )
+
+        return spectrograms, freqs, times_sec
+
+    def _window_for(self, x):
+        return self.window.to(device=x.device, dtype=x.dtype)
 
+    def _stft(self, x):
         batch_size, n_chs, seq_len = x.shape
-        spectrograms = []
+        spec = torch.stft(
+            x.reshape(batch_size * n_chs, seq_len),
+            n_fft=self.n_fft,
+            hop_length=self.hop_length,
+            win_length=self.n_fft,
+            window=self._window_for(x),
+            center=True,
+            pad_mode="reflect",
+            normalized=False,
+            return_complex=True,
+        )
+        return spec.reshape(batch_size, n_chs, *spec.shape[-2:])
 
-        for ch in range(n_chs):
-            x_ch = x[:, ch, :].unsqueeze(
-                1
-            )  # Maintain expected input shape for stft
+    def _stft_per_channel(self, x):
+        window = self._window_for(x)
+        spectrograms = []
+        for ch in range(x.shape[1]):
             spec = torch.stft(
-                x_ch.squeeze(1),
+                x[:, ch, :],
                 n_fft=self.n_fft,
                 hop_length=self.hop_length,
-                win_length=self.win_length,
-                window=self.window.to(x.device),
+                win_length=self.n_fft,
+                window=window,
                 center=True,
                 pad_mode="reflect",
                 normalized=False,
                 return_complex=True,
             )
-            magnitude = torch.abs(spec).unsqueeze(1)  # Keep channel dimension
-            spectrograms.append(magnitude)
+            spectrograms.append(spec.unsqueeze(1))
+        return torch.cat(spectrograms, dim=1)
+
+    def _to_output(self, spec):
+        if self.output == "complex":
+            return spec
+        if self.output == "magnitude":
+            return spec.abs()
+        power = spec.real.square() + spec.imag.square()
+        if self.output == "power":
+            return power
+        return 10 * torch.log10(power + self.eps)
+
+    def reset_stream(self):
+        """Clears the samples buffered by stream()."""
+        self._stream_buffer = None
+        self._n_streamed_frames = 0
+        # Samples still to drop before the next frame when hop_length > n_fft
+        self._n_stream_skip = 0
+
+    def stream(self, x):
+        """
+        Computes the frames completed by a new chunk of samples.
 
-        # Concatenate spectrograms along channel dimension
-        spectrograms = torch.cat(spectrograms, dim=1)
+        Parameters:
+        - x (torch.Tensor): Next chunk of shape (batch_size, n_chs, n_samples).
 
-        # Calculate frequencies (y-axis)
-        freqs = torch.linspace(
-            0, self.sampling_rate / 2, steps=self.n_fft // 2 + 1
-        )
+        Returns:
+        - spectrograms (torch.Tensor): (batch_size, n_chs, n_fft // 2 + 1, n_new_frames);
+          n_new_frames may be 0 until n_fft samples have arrived.
+        - freqs (torch.Tensor): Frequencies [Hz].
+        - times_sec (torch.Tensor): Times of the frame centers since the
+          first streamed sample [s].
+        """
+        x = ensure_3d(x)
+        if self._stream_buffer is not None:
+            x = torch.cat([self._stream_buffer.to(x.device, x.dtype), x], dim=-1)
+        n_skip = min(self._n_stream_skip, x.shape[-1])
+        x = x[..., n_skip:]
+        self._n_stream_skip -= n_skip
+
+        n_frames = max(0, (x.shape[-1] - self.n_fft) // self.hop_length + 1)
+        if n_frames:
+            frames = x.unfold(-1, self.n_fft, self.hop_length)
+            spec = torch.fft.rfft(frames * self._window_for(x), dim=-1)
+            spec = spec.transpose(-1, -2)
+        else:
+            empty = x.new_zeros(*x.shape[:2], self.n_fft // 2 + 1, 0)
+            spec = torch.complex(empty, empty)
+        self._stream_buffer = x[..., n_frames * self.hop_length :]
+        self._n_stream_skip += max(0, n_frames * self.hop_length - x.shape[-1])
 
-        # Calculate times (x-axis)
-        # The number of frames can be computed from the size of the last dimension of the spectrogram
-        n_frames = spectrograms.shape[-1]
-        # Time of each frame in seconds, considering the hop length and sampling rate
-        times_sec = torch.arange(0, n_frames) * (
-            self.hop_length / self.sampling_rate
+        i_frames = torch.arange(
+            self._n_streamed_frames, self._n_streamed_frames + n_frames
         )
+        self._n_streamed_frames += n_frames
+        times_sec = (i_frames * self.hop_length + self.n_fft // 2) / self.sampling_rate
+        freqs = torch.fft.rfftfreq(self.n_fft, d=1 / self.sampling_rate)
 
-        return spectrograms, freqs, times_sec
+        return self._to_output(spec), freqs, times_sec
 
 
 @torch_fn
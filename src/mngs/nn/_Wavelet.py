@@ -13,44 +13,96 @@ import numpy as np
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
+from ..dsp.utils._ensure_3d import ensure_3d
+from ..dsp.utils._filter_kernel_cache import cache_filter_kernels
 from ..gen._to_even import to_even
 from ..gen._to_odd import to_odd
+from ._Filters import BaseFilter1D
 
 
 class Wavelet(nn.Module):
+    """
+    Morlet wavelet transform returning phase, amplitude and center frequencies.
+
+    conv_method:
+        "fft" runs all wavelets through one FFT of the input blocks
+        (overlap-save), with the wavelet spectra computed once per block
+        length; "direct" uses F.conv1d; "auto" picks "fft" for kernels longer
+        than BaseFilter1D.FFT_KERNEL_LEN_THRESHOLD.
+    max_memory_mb:
+        Caps the intermediate spectra of the FFT path; frequencies are
+        processed in chunks that fit in it.
+    """
+
     def __init__(
-        self, samp_rate, kernel_size=None, freq_scale="linear", out_scale="log"
+        self,
+        samp_rate,
+        kernel_size=None,
+        freq_scale="linear",
+        out_scale="log",
+        conv_method="auto",
+        max_memory_mb=1024,
     ):
         super().__init__()
+        if conv_method not in ("auto", "direct", "fft"):
+            raise ValueError(
+                f"conv_method should be 'auto', 'direct' or 'fft'. Received: {conv_method}"
+            )
         self.register_buffer("dummy", torch.tensor(0))
-        self.kernel = None
+        self.register_buffer("kernel", None, persistent=False)
+        self.register_buffer("freqs", None, persistent=False)
         self.init_kernel(
             samp_rate, kernel_size=kernel_size, freq_scale=freq_scale
         )
         self.out_scale = out_scale
+        self.conv_method = conv_method
+        self.max_memory_mb = max_memory_mb
 
     def forward(self, x):
         """Apply the 2D filter (n_filts, kernel_size) to input signal x with shape: (batch_size, n_chs, seq_len)"""
-        x = mngs.dsp.ensure_3d(x).to(self.dummy.device)
+        x = ensure_3d(x).to(self.dummy.device)
         seq_len = x.shape[-1]
 
         # Ensure the kernel is initialized
         if self.kernel is None:
-            self.init_kernel()
-            if self.kernel is None:
-                raise ValueError("Filter kernel has not been initialized.")
+            raise ValueError("Filter kernel has not been initialized.")
         assert self.kernel.ndim == 2
-        self.kernel = self.kernel.to(x.device)  # cuda, torch.complex128
 
-        # Edge handling and convolution
+        # Edge handling
         extension_length = self.radius
         first_segment = x[:, :, :extension_length].flip(dims=[-1])
         last_segment = x[:, :, -extension_length:].flip(dims=[-1])
         extended_x = torch.cat([first_segment, x, last_segment], dim=-1)
 
-        # working??
+        if self._use_fft_conv():
+            pha, amp = self._fft_transform(extended_x, seq_len)
+        else:
+            filtered_x = self._direct_conv(extended_x)[..., :seq_len]
+            pha = filtered_x.angle()
+            amp = filtered_x.abs()
+        assert pha.shape[-1] == seq_len
+
+        # Repeats freqs
+        freqs = (
+            self.freqs.unsqueeze(0)
+            .unsqueeze(0)
+            .repeat(pha.shape[0], pha.shape[1], 1)
+        )
+
+        if self.out_scale == "log":
+            return pha, torch.log(amp + 1e-5), freqs
+        else:
+            return pha, amp, freqs
+
+    def _use_fft_conv(self):
+        if self.conv_method == "auto":
+            return BaseFilter1D.FFT_KERNEL_LEN_THRESHOLD < self.kernel.shape[-1]
+        return self.conv_method == "fft"
+
+    def _direct_conv(self, extended_x):
+        batch_size, n_chs, _ = extended_x.shape
         kernel_batched = self.kernel.unsqueeze(1)
-        extended_x_reshaped = extended_x.view(-1, 1, extended_x.shape[-1])
+        extended_x_reshaped = extended_x.reshape(-1, 1, extended_x.shape[-1])
 
         filtered_x_real = F.conv1d(
             extended_x_reshaped, kernel_batched.real.float(), groups=1
@@ -58,42 +110,87 @@ class Wavelet(nn.Module):
         filtered_x_imag = F.conv1d(
             extended_x_reshaped, kernel_batched.imag.float(), groups=1
         )
+        filtered_x = torch.complex(filtered_x_real, filtered_x_imag)
+        return filtered_x.view(batch_size, n_chs, kernel_batched.shape[0], -1)
+
+    def _kernel_spectra(self, n_fft):
+        # Cross-correlation as conv1d does, hence the kernels are flipped
+        if n_fft not in self._kernel_spectra_cache:
+            self._kernel_spectra_cache[n_fft] = torch.fft.fft(
+                self.kernel.flip(-1), n=n_fft
+            )
+        return self._kernel_spectra_cache[n_fft]
+
+    def _fft_transform(self, extended_x, seq_len):
+        """
+        Overlap-save CWT; returns (pha, amp) of shape
+        (batch_size, n_chs, n_freqs, seq_len).
 
-        filtered_x = torch.view_as_complex(
-            torch.stack([filtered_x_real, filtered_x_imag], dim=-1)
-        )
+        Input blocks are transformed once; each chunk of wavelets is then
+        one batched multiply and inverse FFT, written straight into pha/amp.
+        """
+        batch_size, n_chs, n_time = extended_x.shape
+        n_kernels, kernel_len = self.kernel.shape
+        out_len = n_time - kernel_len + 1
+        assert seq_len <= out_len, "Signal must be longer than the kernels."
 
-        filtered_x = filtered_x.view(
-            x.shape[0], x.shape[1], kernel_batched.shape[0], -1
+        n_fft = 2 ** int(
+            np.ceil(np.log2(max(kernel_len, min(n_time, 8 * kernel_len))))
         )
-        filtered_x = filtered_x.view(
-            x.shape[0], x.shape[1], kernel_batched.shape[0], -1
+        step = n_fft - kernel_len + 1
+        n_blocks = (seq_len + step - 1) // step
+
+        x = extended_x.reshape(-1, n_time).float()
+        x = F.pad(x, (0, max(0, (n_blocks - 1) * step + n_fft - n_time)))
+        x = x.unfold(-1, n_fft, step)[:, :n_blocks]
+        x_f = torch.fft.fft(x, n=n_fft).unsqueeze(1)
+        # (batch_size * n_chs, 1, n_blocks, n_fft)
+        kernels_f = self._kernel_spectra(n_fft).unsqueeze(1)
+        # (n_kernels, 1, n_fft)
+
+        # Product and inverse FFT (complex64) dominate memory
+        bytes_per_kernel = 2 * 8 * x.shape[0] * n_blocks * n_fft
+        chunk_size = max(
+            1, int(self.max_memory_mb * 1024**2 // bytes_per_kernel)
         )
-        filtered_x = filtered_x[..., :seq_len]
-        assert filtered_x.shape[-1] == seq_len
-
-        pha = filtered_x.angle()
-        amp = filtered_x.abs()
 
-        # Repeats freqs
-        freqs = (
-            self.freqs.unsqueeze(0)
-            .unsqueeze(0)
-            .repeat(pha.shape[0], pha.shape[1], 1)
+        pha = x.new_empty(batch_size * n_chs, n_kernels, seq_len)
+        amp = x.new_empty(batch_size * n_chs, n_kernels, seq_len)
+        for start in range(0, n_kernels, chunk_size):
+            end = min(start + chunk_size, n_kernels)
+            filtered = torch.fft.ifft(x_f * kernels_f[start:end], n=n_fft)
+            filtered = filtered[..., kernel_len - 1 :].reshape(
+                x.shape[0], end - start, -1
+            )[..., :seq_len]
+            pha[:, start:end] = filtered.angle()
+            amp[:, start:end] = filtered.abs()
+
+        return (
+            pha.view(batch_size, n_chs, n_kernels, seq_len),
+            amp.view(batch_size, n_chs, n_kernels, seq_len),
         )
 
-        if self.out_scale == "log":
-            return pha, torch.log(amp + 1e-5), freqs
-        else:
-            return pha, amp, freqs
-
     def init_kernel(self, samp_rate, kernel_size=None, freq_scale="log"):
         device = self.dummy.device
-        morlets, freqs = self.gen_morlet_to_nyquist(
+        kernel = self.build_kernel(samp_rate, kernel_size, freq_scale)
+        freqs = self.calc_center_freqs(samp_rate, freq_scale=freq_scale)
+        self.kernel = kernel.to(device)
+        self.freqs = torch.tensor(freqs).float().to(device)
+        self._kernel_spectra_cache = {}
+
+    def _apply(self, fn, *args, **kwargs):
+        # Spectra are rebuilt after the kernel moves to another device/dtype
+        self._kernel_spectra_cache = {}
+        return super()._apply(fn, *args, **kwargs)
+
+    @staticmethod
+    @cache_filter_kernels("morlet")
+    def build_kernel(samp_rate, kernel_size=None, freq_scale="linear"):
+        """Morlet wavelets of gen_morlet_to_nyquist as a complex64 tensor."""
+        morlets, _ = Wavelet.gen_morlet_to_nyquist(
             samp_rate, kernel_size=kernel_size, freq_scale=freq_scale
         )
-        self.kernel = torch.tensor(morlets).to(device)
-        self.freqs = torch.tensor(freqs).float().to(device)
+        return torch.tensor(morlets, dtype=torch.complex64)
 
     @staticmethod
     def gen_morlet_to_nyquist(
@@ -112,6 +209,24 @@ class Wavelet(nn.Module):
         if kernel_size is None:
             kernel_size = int(samp_rate)  # * 2.5)
 
+        freqs = Wavelet.calc_center_freqs(samp_rate, freq_scale=freq_scale)
+
+        morlets = []
+        t = np.arange(-kernel_size // 2, kernel_size // 2) / samp_rate
+        for center_frequency in freqs:
+            # Calculate standard deviation of the gaussian window for a given center frequency
+            sigma = 7 / (2 * np.pi * center_frequency)
+            sine_wave = np.exp(2j * np.pi * center_frequency * t)
+            gaussian_window = np.exp(-(t**2) / (2 * sigma**2))
+            morlet_wavelet = sine_wave * gaussian_window
+
+            morlets.append(morlet_wavelet)
+
+        return np.array(morlets), freqs
+
+    @staticmethod
+    def calc_center_freqs(samp_rate, freq_scale="linear"):
+        """Center frequencies [Hz] of the wavelets up to the Nyquist frequency."""
         nyquist_freq = samp_rate / 2
 
         # Log freq_scale
@@ -137,26 +252,13 @@ class Wavelet(nn.Module):
             fn = calc_freq_boundaries_log
         low_hz, high_hz = fn(nyquist_freq)
 
-        morlets = []
         freqs = []
-
         for _, (ll, hh) in enumerate(zip(low_hz, high_hz)):
             if ll > nyquist_freq:
                 break
+            freqs.append((ll + hh) / 2)
 
-            center_frequency = (ll + hh) / 2
-
-            t = np.arange(-kernel_size // 2, kernel_size // 2) / samp_rate
-            # Calculate standard deviation of the gaussian window for a given center frequency
-            sigma = 7 / (2 * np.pi * center_frequency)
-            sine_wave = np.exp(2j * np.pi * center_frequency * t)
-            gaussian_window = np.exp(-(t**2) / (2 * sigma**2))
-            morlet_wavelet = sine_wave * gaussian_window
-
-            freqs.append(center_frequency)
-            morlets.append(morlet_wavelet)
-
-        return np.array(morlets), np.array(freqs)
+        return np.array(freqs)
 
     @property
     def kernel_size(
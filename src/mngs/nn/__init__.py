@@ -115,6 +115,7 @@ from ._PAC import PAC
 
 # from ._PAC_dev import PAC_dev
 from ._PSD import PSD
+from ._Spectrogram import Spectrogram
 from ._ResNet1D import ResNet1D, ResNetBasicBlock
 from ._SpatialAttention import SpatialAttention
 from ._SwapChannels import SwapChannels
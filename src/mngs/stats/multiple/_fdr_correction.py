@@ -56,7 +56,7 @@ def fdr_correction(results: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         DataFrame with added FDR-corrected p-values and stars
     """
-    pval_cols = mngs.stats.find_pval(results, multiple=True)
+    pval_cols = mngs.pd.find_pval(results, multiple=True)
     if not pval_cols:
         return results
 
@@ -6,7 +6,7 @@ from bisect import bisect_right
 import numpy as np
 import mngs
 from scipy import stats
-from typing import Any, Literal, Dict, Callable
+from typing import Any, Callable, Dict, Literal, Optional
 from ...decorators import numpy_fn
 import multiprocessing as mp
 from functools import partial
@@ -34,6 +34,77 @@ def _compute_surrogate(args):
         non_nan_indices = ~(np.isnan(data1) | np.isnan(data2))
         return corr_func(data1[non_nan_indices], data2[non_nan_indices])[0]
 
+def _standardize(xx: np.ndarray) -> np.ndarray:
+    """Scales xx so that the Pearson correlation equals a dot product."""
+    xx = xx - xx.mean(axis=0)
+    return xx / np.sqrt((xx**2).sum(axis=0))
+
+
+# Elements allocated per chunk of permutations (~256 MB in float64)
+_PERM_CHUNK_ELEMENTS = 2**25
+
+
+def _calc_perm_chunk_size(n_per_perm: int, chunk_size: Optional[int]) -> int:
+    """Permutations per chunk, given the elements allocated per permutation."""
+    if chunk_size:
+        return chunk_size
+    return max(1, _PERM_CHUNK_ELEMENTS // max(n_per_perm, 1))
+
+
+def _compute_surrogates_vectorized(
+    data1: np.ndarray,
+    data2: np.ndarray,
+    n_perm: int,
+    seed: int,
+    is_spearman: bool,
+    chunk_size: Optional[int] = None,
+    backend: Literal["numpy", "torch"] = "numpy",
+    device: str = "cpu",
+) -> np.ndarray:
+    """
+    Computes permutation correlations as (n_perm x n) @ (n,) products in chunks.
+
+    Data are ranked once (Spearman) and standardized once; each chunk of
+    permutations is drawn at once (argsort of uniform noise) and applied as
+    a matrix of permuted copies of the standardized data2.
+    """
+    if is_spearman:
+        data1, data2 = stats.rankdata(data1), stats.rankdata(data2)
+    z1 = _standardize(np.asarray(data1, dtype=np.float64))
+    z2 = _standardize(np.asarray(data2, dtype=np.float64))
+
+    n_samples = len(z1)
+    chunk_size = _calc_perm_chunk_size(n_samples, chunk_size)
+
+    surrogate = np.empty(n_perm)
+    if backend == "torch":
+        import torch
+
+        generator = torch.Generator(device=device).manual_seed(seed)
+        z1_t = torch.as_tensor(z1, device=device)
+        z2_t = torch.as_tensor(z2, device=device)
+        for start in range(0, n_perm, chunk_size):
+            end = min(start + chunk_size, n_perm)
+            # A chunk of permutations at once: argsort of uniform noise
+            indices = torch.argsort(
+                torch.rand(
+                    end - start, n_samples, generator=generator, device=device
+                ),
+                dim=1,
+            )
+            surrogate[start:end] = (z2_t[indices] @ z1_t).cpu().numpy()
+    elif backend == "numpy":
+        rng = np.random.default_rng(seed)
+        for start in range(0, n_perm, chunk_size):
+            end = min(start + chunk_size, n_perm)
+            indices = np.argsort(rng.random((end - start, n_samples)), axis=1)
+            surrogate[start:end] = z2[indices] @ z1
+    else:
+        raise ValueError("Invalid backend. Choose 'numpy' or 'torch'.")
+
+    return np.clip(surrogate, -1.0, 1.0)
+
+
 def _corr_test_base(
     data1: np.ndarray,
     data2: np.ndarray,
@@ -42,12 +113,16 @@ def _corr_test_base(
     seed: int,
     corr_func: Callable,
     test_name: str,
-    n_jobs: int = -1
+    n_jobs: int = -1,
+    engine: Literal["vectorized", "pool"] = "vectorized",
+    backend: Literal["numpy", "torch"] = "numpy",
+    chunk_size: Optional[int] = None,
+    device: str = "cpu",
 ) -> Dict[str, Any]:
     np.random.seed(seed)
     seeds = np.random.randint(0, n_perm*100, size=n_perm)
 
-    if corr_func != stats.spearmanr:
+    if corr_func != stats.spearmanr or engine == "vectorized":
         # Convert to numeric, replacing non-numeric values with NaN
         data1 = pd.to_numeric(data1, errors='coerce')
         data2 = pd.to_numeric(data2, errors='coerce')
@@ -87,7 +162,20 @@ def _corr_test_base(
 
     #     corr_obs, _ = corr_func(data1, data2)
 
-    if n_jobs != 1:
+    if engine == "vectorized":
+        surrogate = _compute_surrogates_vectorized(
+            data1,
+            data2,
+            n_perm,
+            seed,
+            corr_func == stats.spearmanr,
+            chunk_size=chunk_size,
+            backend=backend,
+            device=device,
+        )
+    elif engine != "pool":
+        raise ValueError("Invalid engine. Choose 'vectorized' or 'pool'.")
+    elif n_jobs != 1:
         n_jobs = mp.cpu_count() if n_jobs == -1 else n_jobs
         with mp.Pool(n_jobs) as pool:
             surrogate = np.array(pool.map(_compute_surrogate,
@@ -138,8 +226,24 @@ def corr_test_spearman(
     only_significant: bool = False,
     n_perm: int = 1_000,
     seed: int = 42,
+    engine: Literal["vectorized", "pool"] = "vectorized",
+    backend: Literal["numpy", "torch"] = "numpy",
+    chunk_size: Optional[int] = None,
+    device: str = "cpu",
 ) -> Dict[str, Any]:
-    return _corr_test_base(data1, data2, only_significant, n_perm, seed, stats.spearmanr, "Spearman")
+    return _corr_test_base(
+        data1,
+        data2,
+        only_significant,
+        n_perm,
+        seed,
+        stats.spearmanr,
+        "Spearman",
+        engine=engine,
+        backend=backend,
+        chunk_size=chunk_size,
+        device=device,
+    )
 
 @numpy_fn
 def corr_test_pearson(
@@ -148,8 +252,24 @@ def corr_test_pearson(
     only_significant: bool = False,
     n_perm: int = 1_000,
     seed: int = 42,
+    engine: Literal["vectorized", "pool"] = "vectorized",
+    backend: Literal["numpy", "torch"] = "numpy",
+    chunk_size: Optional[int] = None,
+    device: str = "cpu",
 ) -> Dict[str, Any]:
-    return _corr_test_base(data1, data2, only_significant, n_perm, seed, stats.pearsonr, "Pearson")
+    return _corr_test_base(
+        data1,
+        data2,
+        only_significant,
+        n_perm,
+        seed,
+        stats.pearsonr,
+        "Pearson",
+        engine=engine,
+        backend=backend,
+        chunk_size=chunk_size,
+        device=device,
+    )
 
 @numpy_fn
 def corr_test(
@@ -159,6 +279,10 @@ def corr_test(
     only_significant: bool = False,
     n_perm: int = 1_000,
     seed: int = 42,
+    engine: Literal["vectorized", "pool"] = "vectorized",
+    backend: Literal["numpy", "torch"] = "numpy",
+    chunk_size: Optional[int] = None,
+    device: str = "cpu",
 ) -> Dict[str, Any]:
     """
     Performs a correlation test between two datasets using permutation.
@@ -177,6 +301,18 @@ def corr_test(
         Number of permutations for the test. Default is 1,000.
     seed : int, optional
         Random seed for reproducibility. Default is 42.
+    engine : {"vectorized", "pool"}, optional
+        "vectorized" computes all permutation correlations as chunked matrix
+        products of standardized (and, for Spearman, pre-ranked) data.
+        "pool" calls scipy once per permutation in a multiprocessing pool.
+        Default is "vectorized".
+    backend : {"numpy", "torch"}, optional
+        Array backend of the vectorized engine. Default is "numpy".
+    chunk_size : int, optional
+        Number of permutations per chunk of the vectorized engine.
+        Default is None (about 2**25 elements per chunk).
+    device : str, optional
+        Torch device of backend="torch" (e.g., "cuda"). Default is "cpu".
 
     Returns
     -------
@@ -189,13 +325,159 @@ def corr_test(
     >>> yy = np.array([2, 4, 4, 5, 4, 7, 8, 19, 14, 10])
     >>> results = corr_test(xx, yy, test="pearson")
     """
+    kwargs = dict(engine=engine, backend=backend, chunk_size=chunk_size, device=device)
     if test == "spearman":
-        return corr_test_spearman(data1, data2, only_significant, n_perm, seed)
+        return corr_test_spearman(data1, data2, only_significant, n_perm, seed, **kwargs)
     elif test == "pearson":
-        return corr_test_pearson(data1, data2, only_significant, n_perm, seed)
+        return corr_test_pearson(data1, data2, only_significant, n_perm, seed, **kwargs)
     else:
         raise ValueError("Invalid test type. Choose 'pearson' or 'spearman'.")
 
+def _to_2d_with_names(data: Any, prefix: str):
+    if isinstance(data, pd.Series):
+        data = data.to_frame()
+    if isinstance(data, pd.DataFrame):
+        return data.to_numpy(dtype=float), [str(col) for col in data.columns]
+    if hasattr(data, "detach"):
+        data = data.detach().cpu().numpy()
+    data = np.asarray(data, dtype=float)
+    if data.ndim == 1:
+        data = data[:, np.newaxis]
+    if data.ndim != 2:
+        raise ValueError(f"{prefix} must be 1-D or 2-D (n_samples x n_features).")
+    return data, [f"{prefix}_{ii}" for ii in range(data.shape[1])]
+
+
+def corr_test_mass(
+    data1: Any,
+    data2: Any,
+    test: Literal["pearson", "spearman"] = "pearson",
+    pairs: Literal["all", "columnwise"] = "all",
+    n_perm: int = 1_000,
+    seed: int = 42,
+    chunk_size: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Performs permutation-based correlation tests for many (feature, target) pairs at once.
+
+    One set of permutation indices is shared by all pairs, and observed and
+    surrogate correlations are computed as blocked matrix products of
+    standardized (and, for Spearman, pre-ranked) columns. Since all pairs see
+    the same permutations, the maximum |corr| per permutation gives a
+    family-wise error rate (max-statistic) correction as well.
+
+    Parameters
+    ----------
+    data1 : array-like or pd.DataFrame
+        (n_samples x n_features). DataFrame column names are used as labels.
+    data2 : array-like or pd.DataFrame
+        (n_samples,) or (n_samples x n_targets).
+    test : {"pearson", "spearman"}, optional
+        Type of correlation. Default is "pearson".
+    pairs : {"all", "columnwise"}, optional
+        "all" tests every feature against every target; "columnwise" tests the
+        i-th column of data1 against the i-th column of data2. Default is "all".
+    n_perm : int, optional
+        Number of permutations. Default is 1,000.
+    seed : int, optional
+        Random seed for reproducibility. Default is 42.
+    chunk_size : int, optional
+        Number of permutations per block. Default is None: about 2**25
+        elements per block, counting the permuted targets and the surrogate
+        correlations of all pairs, so memory stays bounded for any n_features.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per pair with 'feature', 'target', 'corr', 'p_value' (two-sided,
+        as in corr_test), 'p_fwer' (max-statistic), 'n', 'test_name', and the
+        FDR-corrected 'p_value_fdr' and 'p_value_fdr_stars'.
+
+    Example
+    -------
+    >>> X = np.random.randn(100, 500)
+    >>> y = X[:, 0] + np.random.randn(100)
+    >>> df = corr_test_mass(X, y, test="spearman")
+    """
+    if test not in ("pearson", "spearman"):
+        raise ValueError("Invalid test type. Choose 'pearson' or 'spearman'.")
+    if pairs not in ("all", "columnwise"):
+        raise ValueError("Invalid pairs. Choose 'all' or 'columnwise'.")
+
+    data1, names1 = _to_2d_with_names(data1, "feature")
+    data2, names2 = _to_2d_with_names(data2, "target")
+
+    if len(data1) != len(data2):
+        raise ValueError("data1 and data2 must have the same number of samples.")
+    if pairs == "columnwise" and data1.shape[1] != data2.shape[1]:
+        raise ValueError(
+            "data1 and data2 must have the same number of columns for pairs='columnwise'."
+        )
+    if np.isnan(data1).any() or np.isnan(data2).any():
+        raise ValueError("NaN values are not supported; drop or impute them first.")
+
+    n_samples = len(data1)
+    if n_samples < 3:
+        raise ValueError("Not enough data points for correlation.")
+
+    if test == "spearman":
+        data1 = stats.rankdata(data1, axis=0)
+        data2 = stats.rankdata(data2, axis=0)
+    z1, z2 = _standardize(data1), _standardize(data2)
+
+    def _corr(_z2):
+        # _z2: (..., n_samples, n_targets)
+        if pairs == "all":
+            return np.matmul(z1.T, _z2)  # (..., n_features, n_targets)
+        return np.einsum("nf,...nf->...f", z1, _z2)  # (..., n_features)
+
+    corr_obs = np.clip(_corr(z2), -1.0, 1.0)
+    abs_obs = np.abs(corr_obs)
+
+    n_le = np.zeros(corr_obs.shape, dtype=np.int64)
+    n_fwer = np.zeros(corr_obs.shape, dtype=np.int64)
+
+    # Each permutation allocates its permuted targets (n_samples x n_targets)
+    # and its surrogate correlations / comparisons (one per pair)
+    chunk_size = _calc_perm_chunk_size(
+        n_samples * z2.shape[1] + corr_obs.size, chunk_size
+    )
+    rng = np.random.default_rng(seed)
+    for start in range(0, n_perm, chunk_size):
+        end = min(start + chunk_size, n_perm)
+        indices = np.argsort(rng.random((end - start, n_samples)), axis=1)
+        surrogate = _corr(z2[indices])
+        # (n_perm_block, n_features[, n_targets])
+
+        n_le += (surrogate <= corr_obs).sum(axis=0)
+        max_abs = np.abs(surrogate).reshape(end - start, -1).max(axis=1)
+        n_fwer += (max_abs[:, np.newaxis] >= abs_obs.reshape(1, -1)).sum(
+            axis=0
+        ).reshape(abs_obs.shape)
+
+    p_value = np.minimum(n_le, n_perm - n_le) / n_perm * 2
+    p_fwer = n_fwer / n_perm
+
+    if pairs == "all":
+        features = np.repeat(names1, len(names2))
+        targets = np.tile(names2, len(names1))
+    else:
+        features, targets = names1, names2
+
+    results = pd.DataFrame(
+        {
+            "feature": features,
+            "target": targets,
+            "corr": corr_obs.ravel(),
+            "p_value": p_value.ravel(),
+            "p_fwer": p_fwer.ravel(),
+            "n": n_samples,
+            "test_name": f"Permutation-based {test.capitalize()} correlation test",
+        }
+    )
+    return mngs.stats.multiple.fdr_correction(results)
+
+
 if __name__ == "__main__":
     xx = np.array([3, 4, 4, 5, 7, 8, 10, 12, 13, 15])
     yy = np.array([2, 4, 4, 5, 4, 7, 8, 19, 14, 10])
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 16:12:50 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/db/_SQLite3Mixins/test__BatchMixin_bulk.py
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+src_dir = str(Path(__file__).parent.parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from mngs.db._SQLite3 import SQLite3
+
+COLUMNS = {
+    "id": "INTEGER PRIMARY KEY",
+    "subject_id": "INTEGER",
+    "name": "TEXT",
+    "value": "REAL",
+    "recorded_at": "TEXT",
+}
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = SQLite3(str(tmp_path / "test.db"))
+    db.create_table("subjects", {"subject_id": "INTEGER", "name": "TEXT UNIQUE"})
+    db.insert_many(
+        "subjects",
+        [{"subject_id": 10, "name": "a"}, {"subject_id": 20, "name": "b"}],
+    )
+    for table in ["rows", "bulk"]:
+        db.create_table(
+            table,
+            COLUMNS,
+            foreign_keys=[
+                {"tgt_column": "subject_id", "src_table": "subjects", "src_column": "name"}
+            ],
+        )
+    yield db
+    db.close()
+
+
+def _frame(n_rows=25):
+    rng = np.random.default_rng(0)
+    value = rng.standard_normal(n_rows)
+    value[::7] = np.nan
+    return pd.DataFrame(
+        {
+            "id": np.arange(n_rows),
+            "subject_id": pd.array([None if ii % 3 else 99 for ii in range(n_rows)], dtype="Int64"),
+            "name": [["a", "b", "c", None][ii % 4] for ii in range(n_rows)],
+            "value": value,
+            "recorded_at": pd.date_range("2024-01-01", periods=n_rows, freq="h"),
+            "not_a_column": np.zeros(n_rows),
+        }
+    )
+
+
+def _as_rows(df):
+    # Row dicts of plain Python values, as insert_many(list) expects
+    df = df.astype(object).where(df.notna(), None)
+    df["recorded_at"] = df["recorded_at"].map(lambda tt: None if tt is None else str(tt))
+    df = df.drop(columns="not_a_column")
+    return [{kk: vv for kk, vv in row.items()} for row in df.to_dict("records")]
+
+
+def _table(db, table):
+    return db.get_rows(table, order_by="id").reset_index(drop=True)
+
+
+@pytest.mark.parametrize("batch_size", [1, 4, 1000])
+def test_bulk_insert_matches_row_path(db, batch_size):
+    df = _frame()
+    db.insert_many("rows", _as_rows(df))
+    n_inserted = db.bulk_insert("bulk", df, batch_size=batch_size)
+
+    assert n_inserted == len(df)
+    expected = _table(db, "rows")
+    pd.testing.assert_frame_equal(_table(db, "bulk"), expected)
+    # Foreign keys were filled from subjects where subject_id was missing
+    assert expected.loc[1, "subject_id"] == 20
+    assert expected.loc[0, "subject_id"] == 99
+    assert expected["value"].isna().sum() == df["value"].isna().sum()
+
+
+def test_bulk_insert_accepts_dict_of_arrays(db):
+    df = _frame()
+    db.insert_many("bulk", {col: df[col].to_numpy() for col in df.columns})
+    db.insert_many("rows", _as_rows(df))
+    pd.testing.assert_frame_equal(_table(db, "bulk"), _table(db, "rows"))
+
+
+def test_bulk_insert_where_matches_row_path(db):
+    df = _frame()
+    db.insert_many("rows", _as_rows(df), where="value > 0")
+    n_inserted = db.bulk_insert("bulk", df, where="value > 0")
+
+    expected = _table(db, "rows")
+    assert n_inserted == len(expected) == (df["value"] > 0).sum()
+    pd.testing.assert_frame_equal(_table(db, "bulk"), expected)
+
+
+def test_bulk_replace(db):
+    db.bulk_insert("bulk", _frame())
+    db.replace_many("bulk", pd.DataFrame({"id": [0, 1], "value": [100.0, 200.0]}))
+
+    table = _table(db, "bulk")
+    assert len(table) == len(_frame())
+    assert table.loc[:1, "value"].tolist() == [100.0, 200.0]
+    assert table.loc[:1, "name"].isna().all()
+
+
+def test_bulk_insert_is_atomic(db):
+    db.bulk_insert("bulk", _frame(5))
+    duplicated = _frame(10)  # ids 0-4 already exist
+
+    with pytest.raises(ValueError, match="Bulk operation failed"):
+        db.bulk_insert("bulk", duplicated.iloc[::-1], batch_size=2)
+
+    assert len(_table(db, "bulk")) == 5
+
+
+@pytest.mark.parametrize(
+    "data, match",
+    [
+        ({"id": np.arange(3), "value": np.zeros(2)}, "same length"),
+        ({"unknown": np.arange(3)}, "No valid columns"),
+        ({"id": np.zeros((3, 2))}, "one-dimensional"),
+    ],
+)
+def test_bulk_insert_invalid_data_raises(db, data, match):
+    with pytest.raises(ValueError, match=match):
+        db.bulk_insert("bulk", data)
+    assert len(_table(db, "bulk")) == 0
+
+
+def test_bulk_insert_empty_input(db):
+    assert db.bulk_insert("bulk", pd.DataFrame({"id": [], "value": []})) == 0
+
+
+# EOF
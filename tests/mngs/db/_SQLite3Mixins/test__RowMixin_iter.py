@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 16:47:19 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/db/_SQLite3Mixins/test__RowMixin_iter.py
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+src_dir = str(Path(__file__).parent.parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from mngs.db._SQLite3 import SQLite3
+
+N_ROWS = 53
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = SQLite3(str(tmp_path / "test.db"))
+    rows = pd.DataFrame(
+        {
+            "id": np.arange(N_ROWS) * 3,  # gaps in the keys
+            "name": [f"name_{ii % 5}" for ii in range(N_ROWS)],
+            "value": np.linspace(-1, 1, N_ROWS),
+        }
+    )
+    db.create_table("pk", {"id": "INTEGER PRIMARY KEY", "name": "TEXT", "value": "REAL"})
+    db.create_table("nopk", {"id": "INTEGER", "name": "TEXT", "value": "REAL"})
+    # Inserted in reverse so that rowid and id orders differ in nopk
+    for table in ["pk", "nopk"]:
+        db.insert_many(table, rows.iloc[::-1])
+    yield db
+    db.close()
+
+
+def _concat(batches):
+    return pd.concat(list(batches), ignore_index=True)
+
+
+@pytest.mark.parametrize("chunksize", [1, 7, N_ROWS, 1000])
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(),
+        dict(where="value > 0"),
+        dict(order_by="value DESC", limit=20, offset=5),
+        dict(columns=["name", "id"], offset=10),
+    ],
+)
+def test_get_rows_chunksize_matches_get_rows(db, chunksize, kwargs):
+    expected = db.get_rows("pk", **kwargs)
+    batches = list(db.get_rows("pk", chunksize=chunksize, **kwargs))
+
+    assert all(0 < len(batch) <= chunksize for batch in batches)
+    pd.testing.assert_frame_equal(_concat(batches), expected)
+
+
+@pytest.mark.parametrize("chunksize", [1, 7, N_ROWS, 1000])
+@pytest.mark.parametrize("where", [None, "value > 0", "name = 'name_2'", "id < 0"])
+@pytest.mark.parametrize("table", ["pk", "nopk"])
+def test_keyset_matches_ordered_query(db, chunksize, where, table):
+    # The key is the primary key of pk and the rowid of nopk
+    order_by = "id" if table == "pk" else "rowid"
+    expected = db.get_rows(table, where=where, order_by=order_by)
+
+    batches = list(db.iter_rows(table, where=where, chunksize=chunksize, keyset=True))
+
+    assert all(0 < len(batch) <= chunksize for batch in batches)
+    if expected.empty:
+        assert batches == []
+    else:
+        pd.testing.assert_frame_equal(_concat(batches), expected)
+
+
+def test_keyset_with_explicit_key(db):
+    batches = db.iter_rows("nopk", columns=["name"], chunksize=4, keyset=True, key="id")
+    expected = db.get_rows("nopk", columns=["name"], order_by="id")
+    pd.testing.assert_frame_equal(_concat(batches), expected)
+
+
+def test_keyset_does_not_hold_a_read_between_batches(db):
+    batches = db.iter_rows("pk", chunksize=10, keyset=True)
+    first = next(batches)
+    # Rows committed between batches are seen by the next queries
+    db.insert_many("pk", [{"id": 10_000, "name": "late", "value": 0.0}])
+    rest = _concat(batches)
+
+    assert len(first) + len(rest) == N_ROWS + 1
+    assert rest["id"].iloc[-1] == 10_000
+
+
+@pytest.mark.parametrize("return_as", ["list", "dict"])
+def test_iter_rows_return_as(db, return_as):
+    expected = db.get_rows("pk", order_by="id", return_as=return_as)
+    batches = db.iter_rows("pk", chunksize=8, keyset=True, return_as=return_as)
+    assert [row for batch in batches for row in batch] == expected
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(chunksize=0),
+        dict(chunksize=10, keyset=True, order_by="id"),
+        dict(chunksize=10, keyset=True, limit=5),
+        dict(chunksize=10, keyset=True, offset=5),
+    ],
+)
+def test_iter_rows_invalid_arguments_raise(db, kwargs):
+    with pytest.raises(ValueError):
+        next(db.iter_rows("pk", **kwargs))
+
+
+# EOF
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 14:20:31 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/db/test__PostgreSQL_io.py
+
+"""
+Needs a PostgreSQL server; set MNGS_TEST_POSTGRES_DSN, e.g.
+"dbname=test user=postgres password=... host=localhost port=5432".
+"""
+
+import os
+import sys
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+psycopg2 = pytest.importorskip("psycopg2")
+
+src_dir = str(Path(__file__).parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from mngs.db._PostgreSQL import PostgreSQL
+
+DSN = os.environ.get("MNGS_TEST_POSTGRES_DSN")
+
+
+def _config():
+    if not DSN:
+        pytest.skip("MNGS_TEST_POSTGRES_DSN is not set")
+    params = psycopg2.extensions.parse_dsn(DSN)
+    config = dict(
+        dbname=params.get("dbname"),
+        user=params.get("user"),
+        password=params.get("password", ""),
+        host=params.get("host", "localhost"),
+        port=int(params.get("port", 5432)),
+    )
+    try:
+        psycopg2.connect(**config).close()
+    except psycopg2.OperationalError as err:
+        pytest.skip(f"PostgreSQL server is not reachable: {err}")
+    return config
+
+
+@pytest.fixture(params=[0, 2], ids=["no_pool", "pool"])
+def db(request):
+    db = PostgreSQL(**_config(), pool_size=request.param)
+    db.table = f"test_{uuid.uuid4().hex[:8]}"
+    yield db
+    db.conn.rollback()
+    db.execute(f"DROP TABLE IF EXISTS {db.table}")
+    db.close()
+
+
+def _count_committed(db, table):
+    with psycopg2.connect(**db.db_config) as conn, conn.cursor() as cursor:
+        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        return cursor.fetchone()[0]
+
+
+def test_reads_keep_uncommitted_writes(db):
+    db.execute(f"CREATE TABLE {db.table} (id INTEGER, data BYTEA)")
+    db.execute(
+        f"INSERT INTO {db.table} VALUES (1, %s)",
+        (psycopg2.Binary(np.arange(3.0).tobytes()),),
+    )
+
+    # Uncommitted write on the main connection
+    db.cursor.execute(
+        f"INSERT INTO {db.table} VALUES (2, %s)",
+        (psycopg2.Binary(np.ones(3).tobytes()),),
+    )
+
+    # No data_dtype/data_shape columns: the first query fails and falls back
+    arrays = db.load_array(db.table, "data", ids=[1], dtype=np.float64)
+    np.testing.assert_array_equal(arrays[0], np.arange(3.0))
+    # Pooled sessions do not see the main connection's uncommitted rows
+    assert len(db.copy_to_dataframe(db.table)) == (2 if db.pool_size == 0 else 1)
+    with pytest.raises(ValueError):
+        db.copy_to_dataframe(db.table, where="no_such_column = 1")
+    # Interrupted export
+    chunks = db.copy_to_dataframe(db.table, chunksize=1)
+    next(chunks)
+    chunks.close()
+
+    db.conn.commit()
+    assert _count_committed(db, db.table) == 2
+
+
+@pytest.fixture
+def table(db):
+    db.execute(
+        f"CREATE TABLE {db.table} (id INTEGER, name TEXT, value DOUBLE PRECISION)"
+    )
+    return db.table
+
+
+def _frame():
+    return pd.DataFrame(
+        {
+            "id": np.arange(7),
+            "name": [
+                "plain",
+                "comma, inside",
+                'double "quotes"',
+                "line\nbreak",
+                "",
+                None,
+                "tab\tand ;semicolon",
+            ],
+            "value": [0.5, np.nan, -1.0, 1e-300, 2.0, 3.0, None],
+        }
+    )
+
+
+def test_copy_round_trip_with_nulls_and_quoted_strings(db, table):
+    df = _frame()
+    assert db.copy_from_dataframe(table, df, chunk_size=3) == len(df)
+
+    out = db.copy_to_dataframe(table, order_by="id")
+    assert list(out["id"]) == list(df["id"])
+    assert list(out["name"].iloc[:5]) == list(df["name"].iloc[:5])
+    assert pd.isna(out["name"].iloc[5])
+    assert out["name"].iloc[6] == df["name"].iloc[6]
+    np.testing.assert_array_equal(out["value"].isna(), df["value"].isna())
+    np.testing.assert_allclose(out["value"].dropna(), df["value"].dropna())
+
+    # NULLs are stored as NULL, not as text
+    n_null = db.execute_query(f"SELECT COUNT(*) AS n FROM {table} WHERE name IS NULL")
+    assert n_null[0]["n"] == 1
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 100])
+def test_chunked_export_round_trip(db, table, chunksize):
+    df = _frame()
+    db.copy_from_dataframe(table, df)
+    chunks = list(db.copy_to_dataframe(table, order_by="id", chunksize=chunksize))
+    assert all(len(chunk) <= chunksize for chunk in chunks)
+    out = pd.concat(chunks, ignore_index=True)
+    pd.testing.assert_series_equal(out["id"], df["id"], check_dtype=False)
+    assert out["name"].fillna("<NA>").tolist() == df["name"].fillna("<NA>").tolist()
+
+
+def test_copy_replace_and_filtered_export(db, table):
+    db.copy_from_dataframe(table, _frame())
+    db.copy_from_dataframe(table, _frame().iloc[:2], if_exists="replace")
+    assert len(db.copy_to_dataframe(table)) == 2
+    out = db.copy_to_dataframe(table, columns=["id"], where="id > 0")
+    assert out.columns.tolist() == ["id"] and out["id"].tolist() == [1]
+
+
+@pytest.fixture
+def rows_table(db):
+    db.execute(
+        f"CREATE TABLE {db.table} (id INTEGER PRIMARY KEY, name TEXT, value DOUBLE PRECISION)"
+    )
+    df = pd.DataFrame(
+        {
+            "id": np.arange(23)[::-1] * 3,
+            "name": [f"name_{ii % 4}" for ii in range(23)],
+            "value": np.linspace(-1, 1, 23),
+        }
+    )
+    db.copy_from_dataframe(db.table, df)
+    return db.table
+
+
+@pytest.mark.parametrize("chunksize", [1, 5, 100])
+@pytest.mark.parametrize("where", [None, "value > 0", "id < 0"])
+def test_iter_rows_matches_get_rows(db, rows_table, chunksize, where):
+    expected = db.get_rows(rows_table, where=where, order_by="id")
+
+    streamed = list(
+        db.get_rows(rows_table, where=where, order_by="id", chunksize=chunksize)
+    )
+    keyset = list(
+        db.iter_rows(rows_table, where=where, chunksize=chunksize, keyset=True)
+    )
+
+    for batches in [streamed, keyset]:
+        assert all(0 < len(batch) <= chunksize for batch in batches)
+        if expected.empty:
+            assert batches == []
+        else:
+            pd.testing.assert_frame_equal(
+                pd.concat(batches, ignore_index=True), expected
+            )
+
+
+def test_keyset_needs_a_single_column_key(db, table):
+    db.copy_from_dataframe(table, _frame())
+    with pytest.raises(ValueError, match="single-column primary key"):
+        next(db.iter_rows(table, chunksize=2, keyset=True))
+
+    batches = db.iter_rows(table, columns=["name"], chunksize=2, keyset=True, key="id")
+    out = pd.concat(list(batches), ignore_index=True)
+    assert out["name"].fillna("<NA>").tolist() == _frame()["name"].fillna("<NA>").tolist()
+
+
+# EOF
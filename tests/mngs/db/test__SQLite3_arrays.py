@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 11:58:19 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/db/test__SQLite3_arrays.py
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+src_dir = str(Path(__file__).parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from mngs.db._SQLite3 import SQLite3
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = SQLite3(str(tmp_path / "test.db"))
+    db.create_table("arrays", {"id": "INTEGER PRIMARY KEY", "data": "BLOB"})
+    db.save_array("arrays", np.arange(4.0))  # raw bytes (legacy format)
+    db.save_array("arrays", np.arange(4.0), codec="zlib")
+    yield db
+    db.close()
+
+
+@pytest.mark.parametrize("ids", [[1], [2]])
+def test_iter_arrays_returns_writable_arrays(db, ids):
+    _, arrays = next(db.iter_arrays("arrays", "data", ids=ids))
+    assert arrays.flags.writeable
+    arrays[0, 0] = -1.0
+    np.testing.assert_array_equal(db.load_array("arrays", "data", ids=ids)[0], np.arange(4.0))
+
+
+@pytest.fixture
+def mixed_db(tmp_path):
+    # Rows alternate raw, zlib and "none" codecs with distinct values
+    db = SQLite3(str(tmp_path / "mixed.db"))
+    db.create_table("arrays", {"id": "INTEGER PRIMARY KEY", "data": "BLOB"})
+    codecs = [None, "zlib", "none", "zlib", None, None, "none", "zlib"]
+    expected = []
+    for ii, codec in enumerate(codecs):
+        arr = np.arange(6, dtype=np.float32).reshape(2, 3) + 10 * ii
+        db.save_array("arrays", arr, codec=codec)
+        expected.append(arr)
+    yield db, np.stack(expected)
+    db.close()
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 128])
+def test_load_array_mixed_formats(mixed_db, batch_size):
+    db, expected = mixed_db
+    loaded = db.load_array("arrays", "data", batch_size=batch_size)
+    np.testing.assert_array_equal(loaded, expected)
+    assert loaded.dtype == np.float32
+
+
+def test_iter_arrays_mixed_formats_keeps_requested_order(mixed_db):
+    db, expected = mixed_db
+    ids = [3, 2, 1, 8, 3, 5]
+    batches = list(db.iter_arrays("arrays", "data", ids=ids, batch_size=4))
+    got_ids = [id_ for batch_ids, _ in batches for id_ in batch_ids]
+    arrays = np.concatenate([arrays for _, arrays in batches])
+    assert got_ids == ids
+    np.testing.assert_array_equal(arrays, expected[np.array(ids) - 1])
+
+
+def test_mixed_dtypes_in_a_batch_raise(mixed_db):
+    db, _ = mixed_db
+    db.save_array("arrays", np.zeros((2, 3)), codec="zlib")  # float64
+    with pytest.raises(ValueError, match="differ in dtype or shape"):
+        db.load_array("arrays", "data", ids=[1, 9])
+
+
+def test_binary_to_array_returns_writable_array(db):
+    arr = db.binary_to_array(np.arange(4.0).tobytes(), dtype=np.float64, shape=(4,))
+    assert arr.flags.writeable
+
+
+# EOF
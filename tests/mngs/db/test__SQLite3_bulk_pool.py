@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 10:05:12 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/db/test__SQLite3_bulk_pool.py
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+src_dir = str(Path(__file__).parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from mngs.db._SQLite3 import SQLite3
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = SQLite3(str(tmp_path / "test.db"), pool_size=2)
+    db.create_table("items", {"id": "INTEGER", "value": "REAL"})
+    yield db
+    db.close()
+
+
+def test_bulk_insert_after_pooled_read(db):
+    db.insert_many("items", pd.DataFrame({"id": [0, 1], "value": [0.0, 1.0]}))
+    assert len(db.get_rows("items")) == 2
+
+    n_inserted = db.bulk_insert(
+        "items", {"id": np.arange(2, 102), "value": np.arange(100.0)}
+    )
+
+    assert n_inserted == 100
+    assert len(db.get_rows("items")) == 102
+
+
+def test_bulk_insert_restores_pragmas(db):
+    db.get_rows("items")
+    db.bulk_insert("items", {"id": np.arange(10), "value": np.zeros(10)})
+
+    assert db.cursor.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert db.cursor.execute("PRAGMA synchronous").fetchone()[0] != 0
+
+
+# EOF
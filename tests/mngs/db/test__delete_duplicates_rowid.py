@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 16:31:08 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/db/test__delete_duplicates_rowid.py
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+src_dir = str(Path(__file__).parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from mngs.db._delete_duplicates import delete_duplicates
+
+N_ROWS = 300
+
+
+@pytest.fixture
+def lpath_db(tmp_path):
+    # Small value sets with NULLs in every column give many duplicates
+    rng = np.random.default_rng(0)
+    blobs = [None, b"", b"\x00\x01", b"\x00\x01\x02", np.arange(3.0).tobytes()]
+    names = [None, "a", "b", "a,b\n"]
+    rows = [
+        (
+            int(rng.integers(3)) if rng.random() > 0.2 else None,
+            names[rng.integers(len(names))],
+            blobs[rng.integers(len(blobs))],
+            float(rng.standard_normal()),
+        )
+        for _ in range(N_ROWS)
+    ]
+    lpath_db = str(tmp_path / "test.db")
+    with sqlite3.connect(lpath_db) as conn:
+        conn.execute("CREATE TABLE items (key INTEGER, name TEXT, data BLOB, noise REAL)")
+        conn.executemany("INSERT INTO items VALUES (?, ?, ?, ?)", rows)
+        # Gaps in the rowid range
+        conn.execute("DELETE FROM items WHERE rowid % 7 = 0")
+    conn.close()
+    return lpath_db
+
+
+def _read(lpath_db):
+    with sqlite3.connect(lpath_db) as conn:
+        df = pd.read_sql("SELECT rowid, * FROM items ORDER BY rowid", conn)
+    conn.close()
+    return df.set_index("rowid")
+
+
+def _expected(df, columns):
+    # First row of each group; NaN/None compare equal, as in GROUP BY
+    return df.loc[~df[columns].astype(object).duplicated(keep="first")]
+
+
+@pytest.mark.parametrize(
+    "columns, include_blob, subset",
+    [
+        ("all", True, ["key", "name", "data"]),
+        ("all", False, ["key", "name"]),
+        (["key", "data"], False, ["key", "data"]),
+        ("data", False, ["data"]),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 16, 10_000])
+def test_rowid_matches_pandas(lpath_db, columns, include_blob, subset, chunk_size):
+    if columns == "all":
+        # noise would make every row unique
+        with sqlite3.connect(lpath_db) as conn:
+            conn.execute("ALTER TABLE items DROP COLUMN noise")
+        conn.close()
+    df = _read(lpath_db)
+    expected = _expected(df, subset)
+
+    n_rows, n_duplicates = delete_duplicates(
+        lpath_db,
+        "items",
+        columns=columns,
+        include_blob=include_blob,
+        chunk_size=chunk_size,
+        dry_run=False,
+        method="rowid",
+    )
+
+    assert n_rows == len(df)
+    assert n_duplicates == len(df) - len(expected)
+    # dtypes of a re-read may change once NULLs are gone
+    pd.testing.assert_frame_equal(_read(lpath_db), expected, check_dtype=False)
+
+
+def test_rowid_dry_run_keeps_table(lpath_db):
+    df = _read(lpath_db)
+    expected = _expected(df, ["key", "name"])
+
+    n_rows, n_duplicates = delete_duplicates(
+        lpath_db, "items", columns=["key", "name"], method="rowid", dry_run=True
+    )
+
+    assert (n_rows, n_duplicates) == (len(df), len(df) - len(expected))
+    pd.testing.assert_frame_equal(_read(lpath_db), df)
+
+
+def test_rowid_keeps_all_columns_of_first_rows(lpath_db):
+    df = _read(lpath_db)
+    delete_duplicates(
+        lpath_db, "items", columns=["key"], method="rowid", dry_run=False
+    )
+    # noise is not a key and is kept from the first row of each group
+    pd.testing.assert_frame_equal(
+        _read(lpath_db), _expected(df, ["key"]), check_dtype=False
+    )
+
+
+def test_rowid_without_rowid_table_fails(tmp_path):
+    lpath_db = str(tmp_path / "norowid.db")
+    with sqlite3.connect(lpath_db) as conn:
+        conn.execute("CREATE TABLE items (key INTEGER PRIMARY KEY, name TEXT) WITHOUT ROWID")
+    conn.close()
+    assert delete_duplicates(lpath_db, "items", method="rowid", dry_run=False) == (None, None)
+
+
+# EOF
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 15:41:02 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/dsp/test__crop_views.py
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+src_dir = str(Path(__file__).parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from mngs.dsp._crop import crop
+
+
+def _crop_loop(sig, window_length, overlap_factor=0.0, axis=-1, time=None):
+    # Per-window loop of the previous implementation
+    axis = axis % sig.ndim
+    seq_len = sig.shape[axis]
+    step = int(window_length * (1 - overlap_factor))
+    n_windows = max(1, (seq_len - window_length) // step + 1)
+    windows, times = [], []
+    for i in range(n_windows):
+        start = i * step
+        end = start + window_length
+        windows.append(np.take(sig, np.arange(start, min(end, seq_len)), axis=axis))
+        if time is not None:
+            times.append(time[start:end])
+    if time is None:
+        return np.array(windows)
+    return np.array(windows), np.array(times)
+
+
+@pytest.fixture
+def sig():
+    return np.random.default_rng(0).standard_normal((50, 3, 101))
+
+
+@pytest.mark.parametrize("overlap_factor", [0.0, 0.5, 0.9])
+@pytest.mark.parametrize("axis", [0, -1])
+@pytest.mark.parametrize("copy", [True, False])
+def test_crop_matches_loop(sig, overlap_factor, axis, copy):
+    window_length = 20
+    time = np.arange(sig.shape[axis]) / 10.0
+    expected, expected_time = _crop_loop(sig, window_length, overlap_factor, axis, time)
+
+    windows, times = crop(
+        sig, window_length, overlap_factor, axis=axis, time=time, copy=copy
+    )
+    np.testing.assert_array_equal(windows, expected)
+    np.testing.assert_array_equal(times, expected_time)
+
+    pairs = list(
+        crop(
+            sig,
+            window_length,
+            overlap_factor,
+            axis=axis,
+            time=time,
+            copy=copy,
+            generator=True,
+        )
+    )
+    np.testing.assert_array_equal(np.stack([ww for ww, _ in pairs]), expected)
+    np.testing.assert_array_equal(np.stack([tt for _, tt in pairs]), expected_time)
+
+
+def test_window_longer_than_signal(sig):
+    expected = _crop_loop(sig, 500)
+    assert expected.shape == (1,) + sig.shape
+    np.testing.assert_array_equal(crop(sig, 500), expected)
+    np.testing.assert_array_equal(next(crop(sig, 500, generator=True)), sig)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(overlap_factor=0.99),
+        dict(axis=3),
+        dict(time=np.arange(100)),
+    ],
+)
+def test_invalid_arguments_raise(sig, kwargs):
+    with pytest.raises(ValueError):
+        crop(sig, 20, **kwargs)
+
+
+@pytest.mark.parametrize("generator", [False, True])
+def test_views_share_memory_and_are_read_only(sig, generator):
+    time = np.arange(sig.shape[-1])
+    out = crop(sig, 20, 0.5, time=time, copy=False, generator=generator)
+    pairs = list(out) if generator else list(zip(*out))
+    for window, window_time in pairs:
+        assert np.shares_memory(window, sig)
+        assert np.shares_memory(window_time, time)
+        assert not window.flags.writeable
+        assert not window_time.flags.writeable
+    assert sig.flags.writeable
+
+    out = crop(sig, 20, 0.5, time=time, generator=generator)
+    pairs = list(out) if generator else list(zip(*out))
+    for window, window_time in pairs:
+        assert not np.shares_memory(window, sig)
+        assert window.flags.writeable
+
+
+# EOF
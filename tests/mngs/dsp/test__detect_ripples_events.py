@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 17:48:55 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/dsp/test__detect_ripples_events.py
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.ndimage import gaussian_filter1d
+from scipy.signal import find_peaks
+
+src_dir = str(Path(__file__).parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from mngs.dsp._detect_ripples import _find_events, detect_ripples
+
+FS = 240
+
+
+def _find_events_loop(xx_r, fs_r, sd, min_duration_ms):
+    # Per-peak implementation that _find_events replaced
+    dfs = []
+    for i_ch, xx_ri in enumerate(np.atleast_2d(xx_r)):
+        peaks, _ = find_peaks(xx_ri, height=sd)
+        peaks_all, peak_ranges, peak_amps = [], [], []
+        for peak in peaks:
+            left_bound = np.where(xx_ri[:peak] < 0)[0]
+            right_bound = np.where(xx_ri[peak:] < 0)[0]
+            left_ips = left_bound.max() if left_bound.size > 0 else peak
+            right_ips = peak + right_bound.min() if right_bound.size > 0 else peak
+            if (left_ips, right_ips) not in peak_ranges:
+                peaks_all.append(peak)
+                peak_ranges.append((left_ips, right_ips))
+                peak_amps.append(xx_ri[peak])
+        starts, ends = zip(*peak_ranges) if peak_ranges else ((), ())
+        df = pd.DataFrame(
+            {
+                "start_s": np.array(starts, dtype=float) / fs_r,
+                "peak_s": np.array(peaks_all, dtype=float) / fs_r,
+                "end_s": np.array(ends, dtype=float) / fs_r,
+                "peak_amp_sd": np.array(peak_amps, dtype=float),
+            }
+        ).round(3)
+        df["duration_s"] = df.end_s - df.start_s
+        df = df[df.duration_s > (min_duration_ms * 1e-3)]
+        df.index = [i_ch] * len(df)
+        dfs.append(df)
+    return pd.concat(dfs)
+
+
+@pytest.fixture
+def xx_r():
+    # Smoothed z-scored noise: events span several samples and peaks of one
+    # event share their bounds
+    rng = np.random.default_rng(0)
+    xx = gaussian_filter1d(rng.standard_normal((7, 20 * FS)), 3, axis=-1)
+    xx = (xx - xx.mean(-1, keepdims=True)) / xx.std(-1, keepdims=True)
+    xx[2] = -1.0  # no peaks
+    xx[4] = np.abs(xx[4]) + 0.1  # no negative samples
+    xx[5, :100] = 5.0  # plateau at the start
+    xx[6, -50:] = 3.0 + np.sin(np.arange(50))  # peaks running into the end
+    return xx
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2, 3, 16])
+@pytest.mark.parametrize("sd, min_duration_ms", [(1.0, 0), (2.0, 10)])
+def test_find_events_matches_loop(xx_r, n_jobs, sd, min_duration_ms):
+    expected = _find_events_loop(xx_r, FS, sd, min_duration_ms)
+    df = _find_events(xx_r, FS, sd, min_duration_ms, n_jobs=n_jobs)
+
+    assert len(df) > 0
+    assert df.index.tolist() == expected.index.tolist()
+    pd.testing.assert_frame_equal(
+        df.reset_index(drop=True), expected.reset_index(drop=True)
+    )
+
+
+def test_find_events_on_1d_signal(xx_r):
+    expected = _find_events_loop(xx_r[0], FS, 1.0, 0)
+    pd.testing.assert_frame_equal(_find_events(xx_r[0], FS, 1.0, 0), expected)
+
+
+@pytest.mark.parametrize("n_jobs", [0, -1, 1.5])
+def test_invalid_n_jobs_raise(xx_r, n_jobs):
+    with pytest.raises(ValueError, match="n_jobs"):
+        _find_events(xx_r, FS, 2.0, 10, n_jobs=n_jobs)
+    with pytest.raises(ValueError, match="n_jobs"):
+        detect_ripples(xx_r, 1000, 80, 140, n_jobs=n_jobs)
+
+
+def test_detect_ripples_n_jobs():
+    # Channels are averaged in preprocessing; events are detected per batch
+    rng = np.random.default_rng(1)
+    xx = rng.standard_normal((4, 2, 10 * 1000)).astype(np.float32)
+    tt = np.arange(xx.shape[-1]) / 1000
+    for start in [2.0, 5.0, 7.5]:
+        burst = (start < tt) & (tt < start + 0.05)
+        xx[..., burst] += 5 * np.sin(2 * np.pi * 110 * tt[burst])
+
+    df = detect_ripples(xx, 1000, 80, 140)
+    df_threads = detect_ripples(xx, 1000, 80, 140, n_jobs=3)
+
+    assert df.index.nunique() > 1
+    pd.testing.assert_frame_equal(df_threads, df)
+
+
+# EOF
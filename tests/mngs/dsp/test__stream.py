@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 10:40:27 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/dsp/test__stream.py
+
+import sys
+from fractions import Fraction
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pytest
+from scipy.signal import resample_poly
+
+src_dir = str(Path(__file__).parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from mngs.dsp._stream import stream
+
+SEQ_LEN = 10007
+
+
+@pytest.fixture
+def signal():
+    return np.random.RandomState(42).randn(2, SEQ_LEN).astype(np.float32)
+
+
+def _read(spath):
+    if spath is None:
+        return None
+    if str(spath).endswith(".npy"):
+        return np.load(spath)
+    with h5py.File(spath, "r") as hf:
+        return hf["x"][:]
+
+
+@pytest.mark.parametrize("ext", [None, ".npy", ".hdf5"])
+@pytest.mark.parametrize("down", [3, 7])
+def test_stream_resample(signal, tmp_path, ext, down):
+    spath = None if ext is None else str(tmp_path / f"out{ext}")
+    out = stream(
+        signal,
+        lambda x: resample_poly(x, 1, down, axis=-1),
+        spath=spath,
+        block_len=1000,
+        out_ratio=Fraction(1, down),
+        verbose=False,
+    )
+    out = out if spath is None else _read(spath)
+    expected = resample_poly(signal, 1, down, axis=-1)
+
+    assert out.shape == expected.shape
+    # Interior samples match the whole-signal result; block edges use context
+    np.testing.assert_allclose(out[:, 50:-50], expected[:, 50:-50], atol=1e-4)
+
+
+def test_stream_identity_is_exact(signal):
+    out = stream(signal, lambda x: x, block_len=1000, overlap=10, verbose=False)
+    np.testing.assert_array_equal(out, signal)
+
+
+def test_stream_wrong_out_ratio_raises(signal):
+    with pytest.raises(ValueError, match="out_ratio"):
+        stream(
+            signal,
+            lambda x: resample_poly(x, 1, 3, axis=-1),
+            block_len=1000,
+            verbose=False,
+        )
+
+
+@pytest.mark.parametrize("ext", [None, ".npy", ".hdf5"])
+def test_stream_reduce_drops_partial_block(signal, tmp_path, ext):
+    spath = None if ext is None else str(tmp_path / f"out{ext}")
+    reduce = lambda b: np.abs(np.fft.rfft(b))
+    out = stream(
+        signal,
+        lambda x: x,
+        spath=spath,
+        block_len=1000,
+        reduce=reduce,
+        verbose=False,
+    )
+    out = out if spath is None else _read(spath)
+
+    assert out.shape == (SEQ_LEN // 1000, 2, 501)
+    np.testing.assert_allclose(out[3], reduce(signal[:, 3000:4000]), rtol=1e-4)
+
+
+def test_stream_reduce_requires_a_full_block(signal):
+    with pytest.raises(ValueError, match="full block"):
+        stream(signal[:, :500], lambda x: x, block_len=1000, reduce=np.mean)
+
+
+# EOF
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 12:10:52 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/dsp/utils/test__filter_kernel_cache.py
+
+import sys
+from pathlib import Path
+
+import pytest
+import torch
+
+src_dir = str(Path(__file__).parent.parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from mngs.dsp.utils._filter_kernel_cache import FilterKernelCache
+
+KEY = ("bandpass", (1024, 512.0))
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return FilterKernelCache(persist_dir=str(tmp_path))
+
+
+def test_kernels_are_reloaded_from_disk(cache, tmp_path):
+    kernels = torch.randn(3, 101)
+    cache.get_or_build(KEY, lambda: kernels)
+
+    other = FilterKernelCache(persist_dir=str(tmp_path))
+    loaded = other.get_or_build(KEY, lambda: pytest.fail("should not rebuild"))
+    torch.testing.assert_close(loaded, kernels)
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda data: data[: len(data) // 2],  # truncated
+        lambda data: data[:200],
+        lambda data: b"",
+        lambda data: b"not a torch file" * 10,
+    ],
+)
+def test_corrupt_file_is_rebuilt(cache, tmp_path, corrupt):
+    kernels = torch.randn(3, 101)
+    cache.get_or_build(KEY, lambda: kernels)
+    path = cache._path(KEY)
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(corrupt(data))
+
+    other = FilterKernelCache(persist_dir=str(tmp_path))
+    rebuilt = other.get_or_build(KEY, lambda: kernels)
+    torch.testing.assert_close(rebuilt, kernels)
+    assert other.n_misses == 1
+
+    # The file was replaced by a valid copy
+    torch.testing.assert_close(torch.load(path, weights_only=True), kernels)
+
+
+# EOF
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 11:41:08 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/io/test__load_lazy.py
+
+import sys
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pytest
+
+src_dir = str(Path(__file__).parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+import mngs
+import mngs.io._load as load_module
+
+
+@pytest.fixture
+def tiny_threshold(monkeypatch):
+    # Every file counts as large
+    monkeypatch.setattr(load_module, "LAZY_LOAD_THRESHOLD_MB", 0)
+
+
+def test_large_npy_is_memory_mapped_by_default(tmp_path, tiny_threshold):
+    spath = str(tmp_path / "x.npy")
+    np.save(spath, np.arange(10))
+    obj = mngs.io.load(spath)
+    assert isinstance(obj, np.memmap)
+    assert not isinstance(mngs.io.load(spath, lazy=False), np.memmap)
+
+
+def test_large_npz_and_hdf5_need_explicit_lazy(tmp_path, tiny_threshold):
+    npz_path = str(tmp_path / "x.npz")
+    np.savez(npz_path, x=np.arange(10))
+    hdf5_path = str(tmp_path / "x.hdf5")
+    with h5py.File(hdf5_path, "w") as hf:
+        hf["x"] = np.arange(10)
+
+    assert not isinstance(mngs.io.load(npz_path), np.lib.npyio.NpzFile)
+    assert isinstance(mngs.io.load(hdf5_path), dict)
+
+    lazy_npz = mngs.io.load(npz_path, lazy=True)
+    assert isinstance(lazy_npz, np.lib.npyio.NpzFile)
+    lazy_npz.close()
+    with mngs.io.load(hdf5_path, lazy=True) as hf:
+        assert isinstance(hf, h5py.File)
+
+
+# EOF
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 17:05:43 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/io/test__load_many.py
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+src_dir = str(Path(__file__).parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+import mngs.io._load_many as load_many_module
+from mngs.io._glob import glob
+from mngs.io._load import load
+from mngs.io._load_many import iter_load_many, load_many
+
+BACKENDS = ["thread", "process"]
+
+
+@pytest.fixture
+def files(tmp_path):
+    # Sizes differ so that loads finish out of order
+    paths = []
+    for sub in [1, 2, 10]:
+        for run in [1, 2, 3]:
+            path = tmp_path / f"sub_{sub:02d}" / f"run_{run}.npy"
+            path.parent.mkdir(exist_ok=True)
+            np.save(path, np.full(1000 * ((sub * 7 + run) % 5 + 1), 10 * sub + run))
+            paths.append(str(path))
+    return tmp_path, paths
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("max_memory_mb", [1e-6, 1024])
+def test_list_keeps_order(files, backend, max_memory_mb):
+    _, paths = files
+    paths = paths[::-1][:4] + paths[4:][::-1]
+    arrays = load_many(paths, n_jobs=3, backend=backend, max_memory_mb=max_memory_mb)
+
+    assert len(arrays) == len(paths)
+    for arr, path in zip(arrays, paths):
+        np.testing.assert_array_equal(arr, load(path))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_pattern_is_parsed(files, backend):
+    tmp_path, _ = files
+    pattern = str(tmp_path / "sub_{sub}" / "run_{run}.npy")
+    expected_paths, expected_parsed = glob(pattern, parse=True)
+
+    pairs = load_many(pattern, n_jobs=2, backend=backend)
+
+    # Parsed fields are DotDicts
+    assert [dict(parsed) for _, parsed in pairs] == [dict(pp) for pp in expected_parsed]
+    assert dict(pairs[-1][1]) == {"sub": "10", "run": "3"}
+    for (arr, parsed), path in zip(pairs, expected_paths):
+        np.testing.assert_array_equal(arr, load(path))
+        assert arr[0] == 10 * int(parsed["sub"]) + int(parsed["run"])
+
+
+def test_pattern_without_fields_is_not_parsed(files):
+    tmp_path, _ = files
+    arrays = load_many(str(tmp_path / "sub_*" / "run_1.npy"))
+    assert [arr[0] for arr in arrays] == [11, 21, 101]
+
+
+def test_loads_in_flight_fit_in_memory_budget(files, monkeypatch):
+    _, paths = files
+    sizes = {path: Path(path).stat().st_size for path in paths}
+    budget = 3 * max(sizes.values())
+    lock = threading.Lock()
+    in_flight, peak = [0], [0]
+
+    def slow_load(path, **kwargs):
+        with lock:
+            in_flight[0] += sizes[path]
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= sizes[path]
+        return load(path, **kwargs)
+
+    monkeypatch.setattr(load_many_module, "load", slow_load)
+    arrays = load_many(paths, n_jobs=8, max_memory_mb=budget / 1024**2)
+
+    assert len(arrays) == len(paths)
+    assert 0 < peak[0] <= budget
+
+
+def test_closing_the_generator_stops_loading(files):
+    _, paths = files
+    loaded = iter_load_many(paths, n_jobs=2, max_memory_mb=1e-6)
+    np.testing.assert_array_equal(next(loaded), load(paths[0]))
+    loaded.close()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [dict(backend="dask"), dict(parse=True)],
+)
+def test_invalid_arguments_raise(files, kwargs):
+    _, paths = files
+    with pytest.raises(ValueError):
+        load_many(paths, **kwargs)
+
+
+# EOF
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 13:40:05 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/io/test__save_async.py
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+import torch
+
+src_dir = str(Path(__file__).parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+import mngs
+import mngs.io._save_async as save_async_module
+from mngs.io._save_async import AsyncSaver
+
+
+@pytest.fixture
+def saver():
+    saver = AsyncSaver(max_workers=2, max_memory_mb=1)
+    yield saver
+    saver.shutdown()
+
+
+@pytest.fixture
+def slow_save(monkeypatch):
+    """Delays each background save until release is set."""
+    release = threading.Event()
+    original = save_async_module.save
+
+    def _slow_save(obj, specified_path, **kwargs):
+        release.wait(timeout=10)
+        original(obj, specified_path, **kwargs)
+
+    monkeypatch.setattr(save_async_module, "save", _slow_save)
+    yield release
+    release.set()
+
+
+def test_errors_propagate_to_the_caller(saver, tmp_path):
+    future = saver.submit(np.zeros(3), str(tmp_path / "x.unsupported"), verbose=False)
+    with pytest.raises(ValueError):
+        future.result(timeout=10)
+    with pytest.raises(RuntimeError, match="1 background saves failed"):
+        saver.flush()
+    # Errors are reported once
+    assert saver.flush() == []
+
+
+def test_flush_without_raising_returns_errors(saver, tmp_path):
+    saver.submit(np.zeros(3), str(tmp_path / "x.unsupported"), verbose=False)
+    errors = saver.flush(raise_errors=False)
+    assert len(errors) == 1 and errors[0][0].endswith("x.unsupported")
+
+
+def test_backpressure_bounds_pending_bytes(saver, tmp_path, slow_save):
+    arr = np.zeros(400 * 1024 // 8)  # 0.4 MB
+    max_pending = []
+
+    def _submit_all():
+        for ii in range(6):
+            saver.submit(arr, str(tmp_path / f"{ii}.npy"), verbose=False)
+            max_pending.append(saver.pending_bytes)
+
+    thread = threading.Thread(target=_submit_all)
+    thread.start()
+    time.sleep(0.5)
+    # Only two arrays fit in 1 MB; the third submit blocks
+    assert len(max_pending) == 2 and thread.is_alive()
+
+    slow_save.set()
+    thread.join(timeout=10)
+    saver.flush()
+    assert max(max_pending) <= saver.max_bytes
+    assert all((tmp_path / f"{ii}.npy").exists() for ii in range(6))
+
+
+def test_tensors_are_snapshotted_on_submit(saver, tmp_path, slow_save):
+    state = {"weight": torch.zeros(3), "bias": np.zeros(2)}
+    saver.submit(state, str(tmp_path / "state.pth"), verbose=False)
+    state["weight"] += 1  # e.g., an optimizer step
+    state["bias"] += 1
+    slow_save.set()
+    saver.flush()
+
+    saved = torch.load(str(tmp_path / "state.pth"), weights_only=False)
+    assert torch.equal(saved["weight"], torch.zeros(3))
+    np.testing.assert_array_equal(saved["bias"], np.zeros(2))
+
+
+def test_figures_are_saved_on_the_calling_thread(saver, tmp_path, slow_save):
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [0, 1])
+    future = saver.submit(fig, str(tmp_path / "fig.png"), verbose=False)
+    plt.close(fig)
+    assert future.done() and future.exception() is None
+    assert (tmp_path / "fig.png").exists()
+
+
+def test_gen_close_flushes_pending_saves(tmp_path, slow_save):
+    future = mngs.io.save_async(np.arange(3), str(tmp_path / "x.npy"), verbose=False)
+    assert not future.done()
+
+    class _Config:
+        def to_dict(self):
+            raise RuntimeError("stop after flushing")
+
+    # The save finishes only while close() is waiting for it
+    threading.Timer(0.5, slow_save.set).start()
+    with pytest.raises(Exception):
+        mngs.gen.close(_Config(), verbose=False)
+    assert future.done()
+    np.testing.assert_array_equal(np.load(tmp_path / "x.npy"), np.arange(3))
+
+
+# EOF
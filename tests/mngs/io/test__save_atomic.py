@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 11:02:45 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/io/test__save_atomic.py
+
+import os
+import sys
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+
+import numpy as np
+import pytest
+
+src_dir = str(Path(__file__).parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+import mngs
+
+
+def test_atomic_save_array(tmp_path):
+    spath = str(tmp_path / "x.npy")
+    mngs.io.save(np.arange(3), spath, atomic=True, verbose=False)
+    assert os.listdir(tmp_path) == ["x.npy"]
+    np.testing.assert_array_equal(np.load(spath), np.arange(3))
+
+
+def test_atomic_save_figure_renames_csv_sidecar(tmp_path):
+    fig, ax = mngs.plt.subplots()
+    ax.plot([1, 2, 3], [4, 5, 6], id="line")
+    mngs.io.save(fig, str(tmp_path / "fig.png"), atomic=True, verbose=False)
+    plt.close("all")
+
+    files = sorted(os.listdir(tmp_path))
+    assert files == ["fig.csv", "fig.png"]
+    assert not any(ff.startswith(".tmp-") for ff in files)
+
+
+# EOF
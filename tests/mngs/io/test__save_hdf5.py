@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 11:24:36 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/io/test__save_hdf5.py
+
+import sys
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pytest
+
+src_dir = str(Path(__file__).parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+import mngs
+from mngs.io._save_hdf5 import HDF5Writer
+
+
+def test_nested_dict_round_trip(tmp_path):
+    spath = str(tmp_path / "nested.hdf5")
+    obj = {
+        "x": np.arange(6).reshape(2, 3),
+        "meta": {
+            "fs": 1000,
+            "labels": np.array(["a", "b"]),
+            "sub": {"y": np.ones(4, dtype=np.float32)},
+        },
+    }
+    mngs.io.save(obj, spath, verbose=False)
+    loaded = mngs.io.load(spath)
+
+    assert set(loaded) == {"x", "meta"}
+    np.testing.assert_array_equal(loaded["x"], obj["x"])
+    assert loaded["meta"]["fs"] == 1000
+    assert list(loaded["meta"]["labels"]) == ["a", "b"]
+    np.testing.assert_array_equal(loaded["meta"]["sub"]["y"], obj["meta"]["sub"]["y"])
+
+
+def test_append_round_trip(tmp_path):
+    spath = str(tmp_path / "append.hdf5")
+    mngs.io.save({"g": {"x": np.zeros((2, 3))}}, spath, verbose=False)
+    mngs.io.save({"g": {"x": np.ones((1, 3))}}, spath, append=True, verbose=False)
+    assert mngs.io.load(spath)["g"]["x"].shape == (3, 3)
+
+
+def test_swmr_on_file_without_latest_libver_raises(tmp_path):
+    spath = str(tmp_path / "old.hdf5")
+    with h5py.File(spath, "w") as hf:
+        hf.create_dataset("x", data=np.zeros((2, 3)), maxshape=(None, 3))
+
+    with pytest.raises(ValueError, match="libver"):
+        HDF5Writer(spath, mode="a", swmr=True)
+
+    # The file is closed and can be rewritten for SWMR
+    with HDF5Writer(spath, mode="w", swmr=True) as writer:
+        writer.append({"x": np.zeros((2, 3))})
+        writer.append({"x": np.ones((2, 3))})
+    assert mngs.io.load(spath)["x"].shape == (4, 3)
+
+
+# EOF
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 15:20:44 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/nn/test__PAC_grad.py
+
+import sys
+from pathlib import Path
+
+import pytest
+import torch
+
+src_dir = str(Path(__file__).parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from mngs.nn._Hilbert import Hilbert
+from mngs.nn._PAC import PAC
+
+
+def test_trainable_pac_with_hilbert_fast_is_differentiable():
+    # Trainable band-pass filters are built with torchaudio
+    pytest.importorskip("torchaudio.prototype.functional")
+    pac = PAC(
+        512,
+        512,
+        pha_n_bands=3,
+        amp_n_bands=3,
+        trainable=True,
+        hilbert_fast=True,
+    )
+    assert not pac.hilbert.in_place and not pac.hilbert.fast
+
+    x = torch.randn(1, 2, 512)
+    pac(x).sum().backward()
+    grads = [pp.grad for pp in pac.parameters() if pp.requires_grad]
+    assert grads and all(gg is not None for gg in grads)
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_hilbert_in_place_is_ignored_for_inputs_requiring_grad(fast):
+    hilbert = Hilbert(256, in_place=True, fast=fast)
+    x = torch.randn(2, 256, requires_grad=True)
+    x_before = x.detach().clone()
+
+    out = hilbert(x)
+    out[..., 1].sum().backward()
+
+    assert torch.equal(x.detach(), x_before)
+    assert x.grad is not None and torch.isfinite(x.grad).all()
+
+
+# EOF
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 17:22:16 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/nn/test__Spectrogram_batched.py
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+import torch
+
+src_dir = str(Path(__file__).parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from mngs.nn._Spectrogram import Spectrogram
+
+FS = 250
+
+
+@pytest.fixture
+def x():
+    torch.manual_seed(0)
+    return torch.randn(2, 5, 1001, dtype=torch.float64)
+
+
+@pytest.mark.parametrize("output", Spectrogram.OUTPUTS)
+@pytest.mark.parametrize("n_fft, hop_length, win_length", [(64, None, None), (100, 7, 60)])
+def test_vectorized_matches_per_channel(x, output, n_fft, hop_length, win_length):
+    kwargs = dict(n_fft=n_fft, hop_length=hop_length, win_length=win_length, output=output)
+    spec, freqs, times = Spectrogram(FS, **kwargs)(x)
+    spec_ref, freqs_ref, times_ref = Spectrogram(FS, vectorized=False, **kwargs)(x)
+
+    assert spec.shape == (2, 5, n_fft // 2 + 1, spec.shape[-1])
+    torch.testing.assert_close(spec, spec_ref)
+    torch.testing.assert_close(freqs, freqs_ref)
+    torch.testing.assert_close(times, times_ref)
+
+
+def test_matches_torch_stft(x):
+    spec, _, _ = Spectrogram(FS, n_fft=100, hop_length=7, win_length=60, output="complex")(x)
+    expected = torch.stft(
+        x[1, 3],
+        n_fft=100,
+        hop_length=7,
+        win_length=60,
+        window=torch.hann_window(60, dtype=x.dtype),
+        return_complex=True,
+    )
+    torch.testing.assert_close(spec[1, 3], expected)
+
+
+def test_outputs_are_consistent(x):
+    mag = Spectrogram(FS, output="magnitude")(x)[0]
+    power = Spectrogram(FS, output="power")(x)[0]
+    log_power = Spectrogram(FS, output="log_power", eps=1e-12)(x)[0]
+    torch.testing.assert_close(power, mag**2)
+    torch.testing.assert_close(log_power, 10 * torch.log10(mag**2 + 1e-12))
+
+
+@pytest.mark.parametrize(
+    "n_fft, hop_length, win_length",
+    [(64, 16, None), (64, 64, 48), (32, 45, None)],
+)
+@pytest.mark.parametrize("chunk_sizes", [[1001], [1] * 100 + [901], [13, 250, 5, 700, 33]])
+def test_stream_matches_uncentered_stft(x, n_fft, hop_length, win_length, chunk_sizes):
+    sg = Spectrogram(
+        FS, n_fft=n_fft, hop_length=hop_length, win_length=win_length, output="complex"
+    )
+    chunks = torch.split(x, chunk_sizes, dim=-1)
+    outs = [sg.stream(chunk) for chunk in chunks]
+    spec = torch.cat([out[0] for out in outs], dim=-1)
+    times = torch.cat([out[2] for out in outs])
+
+    win_length = win_length or n_fft
+    expected = torch.stft(
+        x.reshape(-1, x.shape[-1]),
+        n_fft=n_fft,
+        hop_length=hop_length,
+        win_length=win_length,
+        window=torch.hann_window(win_length, dtype=x.dtype),
+        center=False,
+        return_complex=True,
+    ).reshape(*x.shape[:2], n_fft // 2 + 1, -1)
+
+    assert spec.shape == expected.shape
+    torch.testing.assert_close(spec, expected)
+    n_frames = expected.shape[-1]
+    expected_times = (np.arange(n_frames) * hop_length + n_fft // 2) / FS
+    np.testing.assert_allclose(times.numpy(), expected_times)
+
+
+def test_reset_stream(x):
+    sg = Spectrogram(FS, n_fft=64, hop_length=16)
+    first = sg.stream(x)[0]
+    sg.stream(x[..., :100])
+    sg.reset_stream()
+    torch.testing.assert_close(sg.stream(x)[0], first)
+
+
+def test_invalid_output_raises():
+    with pytest.raises(ValueError, match="output"):
+        Spectrogram(FS, output="phase")
+
+
+# EOF
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 15:58:37 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/nn/test__Wavelet_fft.py
+
+import sys
+from pathlib import Path
+
+import pytest
+import torch
+
+src_dir = str(Path(__file__).parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from mngs.nn._Wavelet import Wavelet
+
+FS = 256
+
+
+@pytest.fixture
+def x():
+    torch.manual_seed(0)
+    tt = torch.arange(4 * FS) / FS
+    chirp = torch.sin(2 * torch.pi * (5 + 20 * tt) * tt)
+    return chirp + 0.5 * torch.randn(2, 3, tt.numel())
+
+
+def test_fft_matches_direct(x):
+    pha_d, amp_d, freqs_d = Wavelet(FS, out_scale="linear", conv_method="direct")(x)
+    pha_f, amp_f, freqs_f = Wavelet(FS, out_scale="linear", conv_method="fft")(x)
+
+    assert pha_f.shape == pha_d.shape == x.shape[:2] + (len(freqs_d[0, 0]), x.shape[-1])
+    torch.testing.assert_close(freqs_f, freqs_d)
+    torch.testing.assert_close(amp_f, amp_d, atol=1e-3 * amp_d.max().item(), rtol=1e-3)
+
+    # Phase is only defined where the amplitude is not negligible
+    mask = amp_d > 1e-2 * amp_d.max()
+    dpha = torch.angle(torch.exp(1j * (pha_f - pha_d)))
+    assert dpha[mask].abs().max() < 1e-2
+
+
+def test_fft_chunking_over_freqs_is_identical(x):
+    wavelet = Wavelet(FS, conv_method="fft")
+    pha, amp, freqs = wavelet(x)
+
+    wavelet.max_memory_mb = 1e-6  # one frequency per chunk
+    pha_c, amp_c, freqs_c = wavelet(x)
+
+    assert torch.equal(pha_c, pha)
+    assert torch.equal(amp_c, amp)
+    assert torch.equal(freqs_c, freqs)
+
+
+def test_invalid_conv_method_raises():
+    with pytest.raises(ValueError, match="conv_method"):
+        Wavelet(FS, conv_method="overlap-add")
+
+
+# EOF
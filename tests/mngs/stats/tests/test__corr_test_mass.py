@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 13:12:40 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/stats/tests/test__corr_test_mass.py
+
+import sys
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pytest
+from scipy import stats
+
+src_dir = str(Path(__file__).parent.parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+import mngs
+
+corr_test_mass = mngs.stats.tests.corr_test_mass
+
+
+def _brute_force(X, Y, test, n_perm, seed):
+    """Per-pair scipy loop over the permutations drawn by corr_test_mass."""
+    corr_func = stats.pearsonr if test == "pearson" else stats.spearmanr
+    rng = np.random.default_rng(seed)
+    indices = np.argsort(rng.random((n_perm, len(X))), axis=1)
+    p_values = np.empty((X.shape[1], Y.shape[1]))
+    for ii in range(X.shape[1]):
+        for jj in range(Y.shape[1]):
+            obs = corr_func(X[:, ii], Y[:, jj])[0]
+            surrogate = np.array(
+                [corr_func(X[:, ii], Y[perm, jj])[0] for perm in indices]
+            )
+            n_le = (surrogate <= obs + 1e-12).sum()
+            p_values[ii, jj] = min(n_le, n_perm - n_le) / n_perm * 2
+    return p_values
+
+
+@pytest.mark.parametrize("test", ["pearson", "spearman"])
+@pytest.mark.parametrize("chunk_size", [None, 7])
+def test_p_values_match_brute_force(test, chunk_size):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(20, 3))
+    Y = np.column_stack([X[:, 0] + rng.normal(size=20), rng.normal(size=20)])
+    n_perm = 50
+
+    df = corr_test_mass(X, Y, test=test, n_perm=n_perm, seed=1, chunk_size=chunk_size)
+    expected = _brute_force(X, Y, test, n_perm, seed=1)
+    np.testing.assert_allclose(df["p_value"].to_numpy(), expected.ravel())
+
+
+def test_memory_is_bounded_for_many_features(monkeypatch):
+    budget = 2**18  # elements per chunk (2 MB in float64)
+    monkeypatch.setitem(corr_test_mass.__globals__, "_PERM_CHUNK_ELEMENTS", budget)
+
+    n_samples, n_features, n_perm = 30, 20_000, 200
+    X = np.random.default_rng(0).normal(size=(n_samples, n_features))
+    y = np.random.default_rng(1).normal(size=n_samples)
+    data_bytes = X.nbytes
+
+    tracemalloc.start()
+    try:
+        corr_test_mass(X, y, n_perm=n_perm)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Without n_features in the budget, one chunk of all 200 permutations
+    # would allocate 200 x 20,000 surrogate correlations (32 MB)
+    assert peak < 5 * data_bytes + 4 * budget * 8
+
+
+# EOF
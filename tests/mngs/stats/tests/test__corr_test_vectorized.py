@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Time-stamp: "2026-10-18 14:58:11 (ywatanabe)"
+# File: ./mngs_repo/tests/mngs/stats/tests/test__corr_test_vectorized.py
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from scipy import stats
+
+src_dir = str(Path(__file__).parent.parent.parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+import mngs
+
+corr_test = mngs.stats.tests.corr_test
+N_PERM = 4_000
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    xx = rng.normal(size=25)
+    yy = 0.3 * xx + rng.normal(size=25)
+    return xx, yy
+
+
+@pytest.mark.parametrize("backend", ["numpy", "torch"])
+@pytest.mark.parametrize("test", ["pearson", "spearman"])
+def test_p_value_agrees_with_scipy_permutation_test(data, test, backend):
+    xx, yy = data
+    corr_func = stats.pearsonr if test == "pearson" else stats.spearmanr
+    expected = stats.permutation_test(
+        (xx, yy),
+        lambda x, y: corr_func(x, y)[0],
+        permutation_type="pairings",
+        vectorized=False,
+        n_resamples=N_PERM,
+        random_state=0,
+    ).pvalue
+
+    result = corr_test(xx, yy, test=test, n_perm=N_PERM, seed=1, backend=backend, device="cpu")
+
+    # Both p-values are Monte-Carlo estimates from independent permutations
+    tol = 4 * np.sqrt(2 * expected * (1 - expected) / N_PERM) + 2 / N_PERM
+    assert abs(result["p_value"] - expected) < tol + 1e-3  # p_value is rounded
+    assert result["corr"] == round(corr_func(xx, yy)[0], 3)
+
+
+def test_surrogates_match_per_permutation_loop(data):
+    xx, yy = data
+    n_perm = 200
+    result = corr_test(xx, yy, n_perm=n_perm, seed=3)
+
+    rng = np.random.default_rng(3)
+    indices = np.argsort(rng.random((n_perm, len(xx))), axis=1)
+    expected = [stats.pearsonr(xx, yy[perm])[0] for perm in indices]
+    np.testing.assert_allclose(result["surrogate"], expected, atol=1e-10)
+
+
+def test_surrogates_do_not_depend_on_chunk_size(data):
+    xx, yy = data
+    full = corr_test(xx, yy, n_perm=300, seed=5)["surrogate"]
+    chunked = corr_test(xx, yy, n_perm=300, seed=5, chunk_size=7)["surrogate"]
+    np.testing.assert_allclose(full, chunked)
+
+
+def test_invalid_backend_raises(data):
+    with pytest.raises(ValueError, match="backend"):
+        corr_test(*data, n_perm=10, backend="jax")
+
+
+# EOF